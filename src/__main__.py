@@ -4,6 +4,9 @@ Package entry point for Summary Bot NG.
 Ultra-resilient entry point that GUARANTEES a web server starts,
 even if all other imports fail. This is critical for Fly.io health checks.
 """
+# Keep module-level imports to sys/os only. asyncio, FastAPI and uvicorn are
+# imported inside the functions that need them so a failed startup does not
+# pay for them twice and a healthy startup never loads the emergency stack.
 import sys
 import os
 
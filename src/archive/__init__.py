@@ -7,83 +7,77 @@ for Discord, WhatsApp, and Slack summaries.
 Implements ADR-006: Retrospective Summary Archive.
 """
 
-from .models import (
-    SourceType,
-    ArchiveSource,
-    ArchiveManifest,
-    SourceManifest,
-    SummaryMetadata,
-    SummaryStatistics,
-    SummaryStatus,
-    GenerationInfo,
-    GenerationLock,
-    PeriodInfo,
-    BackfillInfo,
-    IncompleteInfo,
-    CostEntry,
-)
-from .sources import SourceRegistry
-from .cost_tracker import CostTracker, PricingTable, CostEstimate
-from .locking import LockManager
-from .writer import SummaryWriter, get_summary_path, summary_exists
-from .api_keys import ApiKeyResolver, ResolvedKey, KeyStatus
-from .scanner import ArchiveScanner, ScanResult, GapInfo
-from .backfill import BackfillManager, BackfillJob, BackfillReport
-from .retention import RetentionManager, RetentionConfig
-from .generator import RetrospectiveGenerator, GenerationJob
-from .importers.whatsapp import WhatsAppImporter, WhatsAppImportResult
-from .sync import SyncProvider, GoogleDriveSync, GoogleDriveConfig
+import importlib
+from typing import Any, List
 
-__all__ = [
+# Public name -> defining submodule. Submodules are imported on first access
+# so touching one name does not load httpx, cryptography or the Google SDK.
+_LAZY_MAP = {
     # Models
-    "SourceType",
-    "ArchiveSource",
-    "ArchiveManifest",
-    "SourceManifest",
-    "SummaryMetadata",
-    "SummaryStatistics",
-    "SummaryStatus",
-    "GenerationInfo",
-    "GenerationLock",
-    "PeriodInfo",
-    "BackfillInfo",
-    "IncompleteInfo",
-    "CostEntry",
+    "SourceType": ".models",
+    "ArchiveSource": ".models",
+    "ArchiveManifest": ".models",
+    "SourceManifest": ".models",
+    "SummaryMetadata": ".models",
+    "SummaryStatistics": ".models",
+    "SummaryStatus": ".models",
+    "GenerationInfo": ".models",
+    "GenerationLock": ".models",
+    "PeriodInfo": ".models",
+    "BackfillInfo": ".models",
+    "IncompleteInfo": ".models",
+    "CostEntry": ".models",
     # Registry
-    "SourceRegistry",
+    "SourceRegistry": ".sources",
     # Cost tracking
-    "CostTracker",
-    "PricingTable",
-    "CostEstimate",
+    "CostTracker": ".cost_tracker",
+    "PricingTable": ".cost_tracker",
+    "CostEstimate": ".cost_tracker",
     # Locking
-    "LockManager",
+    "LockManager": ".locking",
     # Writer
-    "SummaryWriter",
-    "get_summary_path",
-    "summary_exists",
+    "SummaryWriter": ".writer",
+    "get_summary_path": ".writer",
+    "summary_exists": ".writer",
     # API Keys
-    "ApiKeyResolver",
-    "ResolvedKey",
-    "KeyStatus",
+    "ApiKeyResolver": ".api_keys",
+    "ResolvedKey": ".api_keys",
+    "KeyStatus": ".api_keys",
     # Scanner
-    "ArchiveScanner",
-    "ScanResult",
-    "GapInfo",
+    "ArchiveScanner": ".scanner",
+    "ScanResult": ".scanner",
+    "GapInfo": ".scanner",
     # Backfill
-    "BackfillManager",
-    "BackfillJob",
-    "BackfillReport",
+    "BackfillManager": ".backfill",
+    "BackfillJob": ".backfill",
+    "BackfillReport": ".backfill",
     # Retention
-    "RetentionManager",
-    "RetentionConfig",
+    "RetentionManager": ".retention",
+    "RetentionConfig": ".retention",
     # Generator
-    "RetrospectiveGenerator",
-    "GenerationJob",
+    "RetrospectiveGenerator": ".generator",
+    "GenerationJob": ".generator",
     # Importers
-    "WhatsAppImporter",
-    "WhatsAppImportResult",
+    "WhatsAppImporter": ".importers.whatsapp",
+    "WhatsAppImportResult": ".importers.whatsapp",
     # Sync
-    "SyncProvider",
-    "GoogleDriveSync",
-    "GoogleDriveConfig",
-]
+    "SyncProvider": ".sync",
+    "GoogleDriveSync": ".sync",
+    "GoogleDriveConfig": ".sync",
+}
+
+__all__ = list(_LAZY_MAP)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining submodule on first access to a public name."""
+    module_name = _LAZY_MAP.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_MAP))
@@ -8,16 +8,20 @@ Supports multiple secure storage options for per-server OpenRouter keys:
 - Database (future)
 """
 
+import asyncio
 import base64
 import json
 import logging
 import os
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Maximum decrypted keys kept in memory per EncryptedFileBackend
+_PLAINTEXT_CACHE_SIZE = 256
+
 
 class ApiKeyBackend(ABC):
     """Abstract base class for API key storage backends."""
@@ -91,10 +95,10 @@ class EnvVarBackend(ApiKeyBackend):
         return key_ref
 
     async def get_key(self, key_ref: str) -> Optional[str]:
-        var_name = self._parse_ref(key_ref)
+        var_name = key_ref[4:] if key_ref.startswith("env:") else key_ref
         value = os.environ.get(var_name)
         if value:
-            logger.debug(f"Retrieved key from env var: {var_name}")
+            logger.debug("Retrieved key from env var: %s", var_name)
         return value
 
     async def set_key(self, key_ref: str, key_value: str) -> bool:
@@ -124,6 +128,8 @@ class EncryptedFileBackend(ApiKeyBackend):
     Example: file:keys/discord_123456789.enc
 
     Uses Fernet symmetric encryption with a master key from environment.
+    Decrypted keys are cached per file and invalidated when the file's
+    mtime changes, so repeat lookups skip the read and decrypt.
     """
 
     def __init__(
@@ -140,13 +146,22 @@ class EncryptedFileBackend(ApiKeyBackend):
         """
         self.keys_dir = keys_dir
         self.master_key_env = master_key_env
+        self._master_key: Optional[bytes] = self._read_master_key()
         self._fernet = None
+        self._plaintext_cache: Dict[Path, Tuple[int, str]] = {}  # path -> (mtime_ns, key)
+
+    def _read_master_key(self) -> Optional[bytes]:
+        """Read the master key from the environment as bytes."""
+        master_key = os.environ.get(self.master_key_env)
+        return master_key.encode() if master_key else None
 
     def _get_fernet(self):
         """Get or create Fernet instance."""
         if self._fernet is None:
-            master_key = os.environ.get(self.master_key_env)
-            if not master_key:
+            # Re-read if the key was set after this backend was created
+            if self._master_key is None:
+                self._master_key = self._read_master_key()
+            if not self._master_key:
                 raise ValueError(
                     f"Master key not found in environment: {self.master_key_env}"
                 )
@@ -154,7 +169,7 @@ class EncryptedFileBackend(ApiKeyBackend):
             # Ensure key is valid Fernet format
             try:
                 from cryptography.fernet import Fernet
-                self._fernet = Fernet(master_key.encode())
+                self._fernet = Fernet(self._master_key)
             except Exception as e:
                 raise ValueError(f"Invalid master key format: {e}")
 
@@ -169,17 +184,40 @@ class EncryptedFileBackend(ApiKeyBackend):
 
         return self.keys_dir / filename
 
+    @staticmethod
+    def _read_key_file(file_path: Path, fernet) -> str:
+        """Read and decrypt a key file (runs in a worker thread)."""
+        return fernet.decrypt(file_path.read_bytes()).decode()
+
+    @staticmethod
+    def _write_key_file(file_path: Path, fernet, key_value: str) -> None:
+        """Encrypt and write a key file with restrictive permissions (runs in a worker thread)."""
+        encrypted = fernet.encrypt(key_value.encode())
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(encrypted)
+        file_path.chmod(0o600)
+
     async def get_key(self, key_ref: str) -> Optional[str]:
         try:
             file_path = self._parse_ref(key_ref)
-            if not file_path.exists():
+            try:
+                mtime_ns = file_path.stat().st_mtime_ns
+            except FileNotFoundError:
+                self._plaintext_cache.pop(file_path, None)
                 return None
 
-            encrypted_data = file_path.read_bytes()
+            cached = self._plaintext_cache.get(file_path)
+            if cached and cached[0] == mtime_ns:
+                return cached[1]
+
             fernet = self._get_fernet()
-            decrypted = fernet.decrypt(encrypted_data)
-            logger.debug(f"Retrieved key from file: {file_path}")
-            return decrypted.decode()
+            decrypted = await asyncio.to_thread(self._read_key_file, file_path, fernet)
+            logger.debug("Retrieved key from file: %s", file_path)
+
+            if len(self._plaintext_cache) >= _PLAINTEXT_CACHE_SIZE:
+                self._plaintext_cache.pop(next(iter(self._plaintext_cache)))
+            self._plaintext_cache[file_path] = (mtime_ns, decrypted)
+            return decrypted
 
         except Exception as e:
             logger.error(f"Failed to get key from file {key_ref}: {e}")
@@ -188,14 +226,10 @@ class EncryptedFileBackend(ApiKeyBackend):
     async def set_key(self, key_ref: str, key_value: str) -> bool:
         try:
             file_path = self._parse_ref(key_ref)
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            self._plaintext_cache.pop(file_path, None)
 
             fernet = self._get_fernet()
-            encrypted = fernet.encrypt(key_value.encode())
-            file_path.write_bytes(encrypted)
-
-            # Set restrictive permissions
-            file_path.chmod(0o600)
+            await asyncio.to_thread(self._write_key_file, file_path, fernet, key_value)
             logger.info(f"Saved encrypted key to file: {file_path}")
             return True
 
@@ -206,8 +240,9 @@ class EncryptedFileBackend(ApiKeyBackend):
     async def delete_key(self, key_ref: str) -> bool:
         try:
             file_path = self._parse_ref(key_ref)
+            self._plaintext_cache.pop(file_path, None)
             if file_path.exists():
-                file_path.unlink()
+                await asyncio.to_thread(file_path.unlink)
                 logger.info(f"Deleted encrypted key file: {file_path}")
                 return True
             return False
@@ -262,6 +297,38 @@ class VaultBackend(ApiKeyBackend):
         raise NotImplementedError("Vault backend not yet implemented")
 
 
+def _vault_backend(config: dict) -> ApiKeyBackend:
+    """Build a Vault backend from config or VAULT_ADDR."""
+    vault_addr = config.get("vault_addr", os.environ.get("VAULT_ADDR"))
+    if not vault_addr:
+        raise ValueError("Vault address not configured")
+    return VaultBackend(vault_addr)
+
+
+def _file_backend(config: dict) -> ApiKeyBackend:
+    """Get the shared encrypted file backend for the configured keys_dir."""
+    keys_dir = Path(config.get("keys_dir", "./data/keys"))
+    backend = _FILE_BACKENDS.get(keys_dir)
+    if backend is None:
+        backend = _FILE_BACKENDS[keys_dir] = EncryptedFileBackend(keys_dir)
+    return backend
+
+
+# EnvVarBackend holds no state, so one instance serves every lookup
+_ENV_BACKEND = EnvVarBackend()
+
+# File backends are reused per keys_dir so their Fernet instance and
+# decrypted-key cache survive across lookups
+_FILE_BACKENDS: Dict[Path, EncryptedFileBackend] = {}
+
+# Key reference scheme -> backend factory
+_BACKEND_FACTORIES: Dict[str, Callable[[dict], ApiKeyBackend]] = {
+    "env": lambda config: _ENV_BACKEND,
+    "file": _file_backend,
+    "vault": _vault_backend,
+}
+
+
 def get_backend_for_ref(key_ref: str, config: dict) -> ApiKeyBackend:
     """
     Get the appropriate backend for a key reference.
@@ -273,19 +340,9 @@ def get_backend_for_ref(key_ref: str, config: dict) -> ApiKeyBackend:
     Returns:
         Appropriate backend instance
     """
-    if key_ref.startswith("env:"):
-        return EnvVarBackend()
-
-    elif key_ref.startswith("file:"):
-        keys_dir = Path(config.get("keys_dir", "./data/keys"))
-        return EncryptedFileBackend(keys_dir)
-
-    elif key_ref.startswith("vault:"):
-        vault_addr = config.get("vault_addr", os.environ.get("VAULT_ADDR"))
-        if not vault_addr:
-            raise ValueError("Vault address not configured")
-        return VaultBackend(vault_addr)
-
-    else:
+    scheme, sep, _ = key_ref.partition(":")
+    factory = _BACKEND_FACTORIES.get(scheme) if sep else None
+    if factory is None:
         # Default to env var
-        return EnvVarBackend()
+        return _ENV_BACKEND
+    return factory(config)
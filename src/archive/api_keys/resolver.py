@@ -6,18 +6,36 @@ Resolves the appropriate API key for a source based on configuration:
 2. Default installation key (fallback)
 """
 
+import asyncio
+import hashlib
 import logging
 import os
+import secrets
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime
 from enum import Enum
-from typing import Dict, Optional, Any, Literal
+from typing import Awaitable, Callable, Dict, Optional, Any, Literal, Sequence
+
+import httpx
 
 from .backends import get_backend_for_ref
 from src.utils.time import utc_now_naive
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on entries in each resolver cache (LRU eviction beyond this)
+_CACHE_MAX_ENTRIES = 1024
+
+# Cache lifetimes in seconds
+_KEY_TTL_SECONDS = 300.0  # 5 minutes
+_VALIDATION_TTL_SECONDS = 3600.0  # 1 hour
+
+# Circuit breaker for the OpenRouter auth endpoint: after this many
+# consecutive transient failures, skip validation for the cooldown period
+_BREAKER_FAILURE_THRESHOLD = 5
+_BREAKER_COOLDOWN_SECONDS = 60.0
+
 
 class KeyStatus(Enum):
     """Status of an API key."""
@@ -67,8 +85,16 @@ class ApiKeyResolver:
         """
         self.default_key = default_key or os.environ.get("OPENROUTER_API_KEY")
         self.backend_config = backend_config or {}
-        self._key_cache: Dict[str, tuple] = {}  # ref -> (key, expiry)
-        self._validation_cache: Dict[str, tuple] = {}  # key -> (status, expiry)
+        # LRU caches; expiries are time.monotonic() deadlines
+        self._key_cache: OrderedDict[str, tuple] = OrderedDict()  # ref -> (key, expiry)
+        self._validation_cache: OrderedDict[bytes, tuple] = OrderedDict()  # fingerprint -> (status, expiry)
+        self._hash_salt = secrets.token_bytes(16)
+        self._client: Optional[httpx.AsyncClient] = None  # Created on first use
+        # In-flight lookups, so concurrent cache misses share one request
+        self._inflight_fetches: Dict[str, asyncio.Task] = {}
+        self._inflight_validations: Dict[bytes, asyncio.Task] = {}
+        self._breaker_failures = 0
+        self._breaker_open_until = 0.0  # time.monotonic() deadline
 
     async def get_key_for_source(
         self,
@@ -99,7 +125,7 @@ class ApiKeyResolver:
                 if key:
                     # Optionally validate the key
                     if await self._validate_key(key):
-                        logger.debug(f"Using server key for {source_key}")
+                        logger.debug("Using server key for %s", source_key)
                         return ResolvedKey(
                             key=key,
                             source="server",
@@ -140,22 +166,91 @@ class ApiKeyResolver:
             API key value or None
         """
         # Check cache first
-        if key_ref in self._key_cache:
-            cached_key, expiry = self._key_cache[key_ref]
-            if utc_now_naive() < expiry:
-                return cached_key
+        cached_key = self._cache_get(self._key_cache, key_ref)
+        if cached_key is not None:
+            return cached_key
+
+        return await self._coalesce(
+            self._inflight_fetches, key_ref, lambda: self._load_key(key_ref)
+        )
 
-        # Get appropriate backend
+    async def _load_key(self, key_ref: str) -> Optional[str]:
+        """Read a key from its backend and cache it."""
         backend = get_backend_for_ref(key_ref, self.backend_config)
         key = await backend.get_key(key_ref)
 
         if key:
-            # Cache for 5 minutes
-            from datetime import timedelta
-            self._key_cache[key_ref] = (key, utc_now_naive() + timedelta(minutes=5))
+            self._cache_put(self._key_cache, key_ref, key, _KEY_TTL_SECONDS)
 
         return key
 
+    @staticmethod
+    def _cache_get(cache: OrderedDict, token: Any) -> Optional[Any]:
+        """Return a live cache value, dropping it if expired."""
+        entry = cache.get(token)
+        if entry is None:
+            return None
+        value, expiry = entry
+        if time.monotonic() >= expiry:
+            del cache[token]
+            return None
+        cache.move_to_end(token)
+        return value
+
+    @staticmethod
+    def _cache_put(cache: OrderedDict, token: Any, value: Any, ttl: float) -> None:
+        """Store a value for ttl seconds, evicting the least recently used entry."""
+        if token in cache:
+            cache.move_to_end(token)
+        elif len(cache) >= _CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+        cache[token] = (value, time.monotonic() + ttl)
+
+    @staticmethod
+    async def _coalesce(
+        inflight: Dict[Any, asyncio.Task],
+        token: Any,
+        factory: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Run factory() at most once per token at a time.
+
+        Concurrent callers with the same token await the same task. The task
+        is shielded so one caller being cancelled does not cancel the others.
+        """
+        task = inflight.get(token)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            inflight[token] = task
+            task.add_done_callback(lambda _: inflight.pop(token, None))
+        return await asyncio.shield(task)
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the shared HTTP client for OpenRouter calls."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+            self._client = None
+
+    def _key_fingerprint(self, key: str) -> bytes:
+        """
+        Derive a cache key for an API key without keeping the secret around.
+
+        Uses a keyed BLAKE2b digest with a per-process salt so fingerprints
+        cannot be precomputed or matched across processes.
+        """
+        return hashlib.blake2b(
+            key.encode(), digest_size=16, key=self._hash_salt
+        ).digest()
+
     async def _validate_key(self, key: str) -> bool:
         """
         Validate an API key with OpenRouter.
@@ -167,39 +262,59 @@ class ApiKeyResolver:
             True if key is valid
         """
         # Check validation cache
-        key_hash = hash(key)
-        if key_hash in self._validation_cache:
-            status, expiry = self._validation_cache[key_hash]
-            if utc_now_naive() < expiry:
-                return status == KeyStatus.VALID
+        key_hash = self._key_fingerprint(key)
+        status = self._cache_get(self._validation_cache, key_hash)
+        if status is not None:
+            return status == KeyStatus.VALID
+
+        return await self._coalesce(
+            self._inflight_validations,
+            key_hash,
+            lambda: self._check_key(key, key_hash),
+        )
+
+    async def _check_key(self, key: str, key_hash: bytes) -> bool:
+        """Validate a key with OpenRouter and cache the result."""
+        if time.monotonic() < self._breaker_open_until:
+            # OpenRouter is degraded - skip the call rather than wait on a timeout
+            return True
 
-        # Validate with OpenRouter
         try:
-            import httpx
+            client = await self._get_client()
+            response = await client.get(
+                "https://openrouter.ai/api/v1/auth/key",
+                headers={"Authorization": f"Bearer {key}"},
+                timeout=5.0
+            )
+        except Exception as e:
+            logger.warning(f"Key validation failed: {e}")
+            self._record_validation_failure()
+            # Don't cache failures - try again next time
+            return True  # Assume valid on network errors
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://openrouter.ai/api/v1/auth/key",
-                    headers={"Authorization": f"Bearer {key}"},
-                    timeout=5.0
-                )
+        if response.status_code == 429 or response.status_code >= 500:
+            logger.warning(f"Key validation unavailable: HTTP {response.status_code}")
+            self._record_validation_failure()
+            return True  # Assume valid while OpenRouter is degraded
 
-                is_valid = response.status_code == 200
+        self._breaker_failures = 0
+        is_valid = response.status_code == 200
 
-                # Cache result for 1 hour
-                from datetime import timedelta
-                status = KeyStatus.VALID if is_valid else KeyStatus.INVALID
-                self._validation_cache[key_hash] = (
-                    status,
-                    utc_now_naive() + timedelta(hours=1)
-                )
+        status = KeyStatus.VALID if is_valid else KeyStatus.INVALID
+        self._cache_put(self._validation_cache, key_hash, status, _VALIDATION_TTL_SECONDS)
 
-                return is_valid
+        return is_valid
 
-        except Exception as e:
-            logger.warning(f"Key validation failed: {e}")
-            # Don't cache failures - try again next time
-            return True  # Assume valid on network errors
+    def _record_validation_failure(self) -> None:
+        """Count a transient validation failure, opening the breaker if needed."""
+        self._breaker_failures += 1
+        if self._breaker_failures >= _BREAKER_FAILURE_THRESHOLD:
+            self._breaker_open_until = time.monotonic() + _BREAKER_COOLDOWN_SECONDS
+            self._breaker_failures = 0
+            logger.warning(
+                f"Key validation circuit open for {_BREAKER_COOLDOWN_SECONDS:.0f}s "
+                f"after {_BREAKER_FAILURE_THRESHOLD} consecutive failures"
+            )
 
     async def validate_key(
         self,
@@ -224,31 +339,29 @@ class ApiKeyResolver:
                     "validated_at": utc_now_naive().isoformat(),
                 }
 
-            import httpx
-
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://openrouter.ai/api/v1/auth/key",
-                    headers={"Authorization": f"Bearer {key}"},
-                    timeout=10.0
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return {
-                        "valid": True,
-                        "key_ref": key_ref,
-                        "credits_remaining": data.get("credits_remaining"),
-                        "rate_limit": data.get("rate_limit"),
-                        "validated_at": utc_now_naive().isoformat(),
-                    }
-                else:
-                    return {
-                        "valid": False,
-                        "key_ref": key_ref,
-                        "error": f"HTTP {response.status_code}",
-                        "validated_at": utc_now_naive().isoformat(),
-                    }
+            client = await self._get_client()
+            response = await client.get(
+                "https://openrouter.ai/api/v1/auth/key",
+                headers={"Authorization": f"Bearer {key}"},
+                timeout=10.0
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                return {
+                    "valid": True,
+                    "key_ref": key_ref,
+                    "credits_remaining": data.get("credits_remaining"),
+                    "rate_limit": data.get("rate_limit"),
+                    "validated_at": utc_now_naive().isoformat(),
+                }
+            else:
+                return {
+                    "valid": False,
+                    "key_ref": key_ref,
+                    "error": f"HTTP {response.status_code}",
+                    "validated_at": utc_now_naive().isoformat(),
+                }
 
         except Exception as e:
             return {
@@ -258,6 +371,25 @@ class ApiKeyResolver:
                 "validated_at": utc_now_naive().isoformat(),
             }
 
+    async def validate_keys(
+        self,
+        key_refs: Sequence[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Validate several keys concurrently.
+
+        Args:
+            key_refs: Key references to validate
+
+        Returns:
+            Mapping of key reference to its validate_key() result
+        """
+        unique_refs = list(dict.fromkeys(key_refs))
+        results = await asyncio.gather(
+            *(self.validate_key(key_ref) for key_ref in unique_refs)
+        )
+        return dict(zip(unique_refs, results))
+
     async def set_server_key(
         self,
         source_key: str,
@@ -286,7 +418,7 @@ class ApiKeyResolver:
 
         # Clear caches
         self._key_cache.pop(key_ref, None)
-        key_hash = hash(api_key)
+        key_hash = self._key_fingerprint(api_key)
         self._validation_cache.pop(key_hash, None)
 
         logger.info(f"Set API key for {source_key} with ref {key_ref}")
@@ -5,13 +5,23 @@ Phase 7: Backfill Analysis - Execution component
 """
 
 import asyncio
+import concurrent.futures
+import functools
+import json
 import logging
-import uuid
+import os
+import time
+from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, time as dt_time, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    from backports.zoneinfo import ZoneInfo  # type: ignore
 
 from src.utils.time import utc_now_naive
 from .models import (
@@ -21,14 +31,128 @@ from .models import (
     GenerationInfo,
     SummaryStatus,
     CostEntry,
+    _SLOTS,
 )
 from .scanner import ArchiveScanner, ScanResult, GapInfo
 from .writer import SummaryWriter
-from .locking import LockManager
 from .cost_tracker import CostTracker
 
 logger = logging.getLogger(__name__)
 
+# Daily period boundaries (end is truncated to whole seconds)
+_DAY_START = dt_time(0, 0, 0)
+_DAY_END = dt_time(23, 59, 59)
+
+# Cost entries are written to the ledger in batches of this size
+_COST_FLUSH_EVERY = 32
+
+# Claims older than this are assumed to belong to a crashed worker
+_CLAIM_TTL_SECONDS = 300
+
+
+@functools.lru_cache(maxsize=64)
+def _get_timezone(name: str) -> ZoneInfo:
+    """Get a cached ZoneInfo for a timezone name."""
+    return ZoneInfo(name)
+
+
+def _try_claim(claim_path: Path, job_id: str) -> bool:
+    """
+    Atomically claim a date by creating its .lock sentinel file.
+
+    Args:
+        claim_path: Path of the sentinel file
+        job_id: Job ID written into the sentinel
+
+    Returns:
+        True if this job now owns the claim
+    """
+    for _ in range(2):
+        try:
+            fd = os.open(claim_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileNotFoundError:
+            claim_path.parent.mkdir(parents=True, exist_ok=True)
+            continue
+        except FileExistsError:
+            try:
+                age = time.time() - os.stat(claim_path).st_mtime
+            except FileNotFoundError:
+                continue
+            if age < _CLAIM_TTL_SECONDS:
+                return False
+            logger.warning(f"Taking over stale claim {claim_path}")
+            try:
+                os.unlink(claim_path)
+            except FileNotFoundError:
+                pass
+            continue
+        try:
+            os.write(fd, job_id.encode())
+        finally:
+            os.close(fd)
+        return True
+    return False
+
+
+def _release_claim(claim_path: Path, job_id: str) -> None:
+    """
+    Remove a date's .lock sentinel file if this job still owns it.
+
+    A claim that outlived _CLAIM_TTL_SECONDS may have been taken over by
+    another worker; its sentinel is left in place.
+
+    Args:
+        claim_path: Path of the sentinel file
+        job_id: Job ID this job wrote into the sentinel
+    """
+    try:
+        if claim_path.read_bytes() != job_id.encode():
+            logger.warning(f"Claim {claim_path} was taken over; leaving it in place")
+            return
+        os.unlink(claim_path)
+    except FileNotFoundError:
+        pass
+
+
+def _message_stats(messages: "Messages") -> Tuple[int, int]:
+    """
+    Count messages and distinct authors.
+
+    Args:
+        messages: Row-oriented list of message dicts, or a columnar mapping
+            whose "author_id" entry is an array with one value per message
+
+    Returns:
+        Tuple of (message_count, participant_count)
+    """
+    if isinstance(messages, Mapping):
+        import numpy as np
+
+        author_ids = np.asarray(messages.get("author_id", ()))
+        if author_ids.dtype == object:
+            # Mixed/None ids can't be sorted by np.unique
+            return author_ids.size, len(set(author_ids.tolist()) - {None})
+        return author_ids.size, np.unique(author_ids).size
+
+    # Single pass over row-oriented messages
+    participants = set()
+    message_count = 0
+    for message in messages:
+        message_count += 1
+        author_id = message.get("author_id")
+        if author_id is not None:
+            participants.add(author_id)
+    return message_count, len(participants)
+
+
+def _is_complete(meta_path: Path) -> bool:
+    """Check whether a summary's metadata is marked complete."""
+    try:
+        with open(meta_path, "r") as f:
+            return json.load(f).get("status") == SummaryStatus.COMPLETE.value
+    except (OSError, ValueError):
+        return False
+
 
 class BackfillStatus(Enum):
     """Status of a backfill job."""
@@ -40,7 +164,7 @@ class BackfillStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BackfillProgress:
     """Progress information for a backfill job."""
     total_periods: int
@@ -59,7 +183,36 @@ class BackfillProgress:
         return (self.completed + self.failed + self.skipped) / self.total_periods * 100
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
+class ProgressDelta:
+    """An increment to a job's progress, published to progress subscribers."""
+    completed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    cost_usd: float = 0.0
+    tokens_input: int = 0
+    tokens_output: int = 0
+    current_period: Optional[str] = None
+
+    def apply(self, progress: BackfillProgress) -> None:
+        """Add this delta to a progress record."""
+        progress.completed += self.completed
+        progress.failed += self.failed
+        progress.skipped += self.skipped
+        progress.cost_usd += self.cost_usd
+        progress.tokens_input += self.tokens_input
+        progress.tokens_output += self.tokens_output
+        if self.current_period is not None:
+            progress.current_period = self.current_period
+
+
+# Shared deltas for per-date outcomes (ProgressDelta is immutable)
+_DATE_COMPLETED = ProgressDelta(completed=1)
+_DATE_FAILED = ProgressDelta(failed=1)
+_DATE_SKIPPED = ProgressDelta(skipped=1)
+
+
+@dataclass(**_SLOTS)
 class BackfillJob:
     """A backfill job configuration."""
     job_id: str
@@ -67,15 +220,36 @@ class BackfillJob:
     dates: List[date]
     status: BackfillStatus = BackfillStatus.PENDING
     progress: BackfillProgress = field(default_factory=lambda: BackfillProgress(0))
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=utc_now_naive)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     error: Optional[str] = None
     max_cost_usd: Optional[float] = None
     dry_run: bool = False
     regenerate_existing: bool = False
+    # (state snapshot, serialized dict) from the last to_dict call
+    _dict_cache: Optional[Tuple[tuple, Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _state(self) -> tuple:
+        """Snapshot of every mutable field that to_dict serializes."""
+        p = self.progress
+        return (
+            self.status, self.started_at, self.completed_at, self.error,
+            p.total_periods, p.completed, p.failed, p.skipped,
+            p.current_period, p.cost_usd,
+        )
 
     def to_dict(self) -> Dict[str, Any]:
+        # Status endpoints poll this; only rebuild when the job has changed
+        state = self._state()
+        if self._dict_cache is None or self._dict_cache[0] != state:
+            self._dict_cache = (state, self._build_dict())
+        data = self._dict_cache[1]
+        return {**data, "progress": dict(data["progress"])}
+
+    def _build_dict(self) -> Dict[str, Any]:
         return {
             "job_id": self.job_id,
             "source_key": self.source.source_key,
@@ -96,7 +270,7 @@ class BackfillJob:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BackfillReport:
     """Report of backfill potential for a source."""
     source: ArchiveSource
@@ -104,22 +278,30 @@ class BackfillReport:
     backfill_dates: List[date]
     estimated_cost_usd: float
     estimated_tokens: int
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "source_key": self.source.source_key,
-            "scan": self.scan_result.to_dict(),
-            "backfill_dates": [d.isoformat() for d in self.backfill_dates],
-            "estimated_cost_usd": round(self.estimated_cost_usd, 4),
-            "estimated_tokens": self.estimated_tokens,
-            "period_count": len(self.backfill_dates),
-        }
-
-
+        # Reports are not modified after analyze_backfill builds them
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "source_key": self.source.source_key,
+                "scan": self.scan_result.to_dict(),
+                "backfill_dates": [d.isoformat() for d in self.backfill_dates],
+                "estimated_cost_usd": round(self.estimated_cost_usd, 4),
+                "estimated_tokens": self.estimated_tokens,
+                "period_count": len(self.backfill_dates),
+            }
+        return dict(self._dict_cache)
+
+
+# Messages as a list of dicts, or columnar: field name -> per-message array
+Messages = Union[List[Dict[str, Any]], Mapping[str, Sequence[Any]]]
 # Type for message fetcher callback
-MessageFetcher = Callable[[ArchiveSource, datetime, datetime], List[Dict[str, Any]]]
+MessageFetcher = Callable[[ArchiveSource, datetime, datetime], Messages]
 # Type for summarizer callback
-Summarizer = Callable[[List[Dict[str, Any]], ArchiveSource], Dict[str, Any]]
+Summarizer = Callable[[Messages, ArchiveSource], Dict[str, Any]]
 
 
 class BackfillManager:
@@ -136,6 +318,8 @@ class BackfillManager:
         cost_tracker: CostTracker,
         message_fetcher: Optional[MessageFetcher] = None,
         summarizer: Optional[Summarizer] = None,
+        analyze_ttl_seconds: float = 30.0,
+        max_workers: int = 4,
     ):
         """
         Initialize backfill manager.
@@ -143,8 +327,11 @@ class BackfillManager:
         Args:
             archive_root: Root path of the archive
             cost_tracker: Cost tracker for estimates and recording
-            message_fetcher: Callback to fetch messages for a period
+            message_fetcher: Callback to fetch messages for a period, as a list of
+                dicts or a columnar mapping of per-message arrays
             summarizer: Callback to generate summary from messages
+            analyze_ttl_seconds: How long analyze_backfill results are reused
+            max_workers: Threads available to the fetcher and summarizer
         """
         self.archive_root = archive_root
         self.cost_tracker = cost_tracker
@@ -152,9 +339,52 @@ class BackfillManager:
         self.summarizer = summarizer
         self.scanner = ArchiveScanner(archive_root)
         self.writer = SummaryWriter(archive_root)
-        self.lock_manager = LockManager()
         self._jobs: Dict[str, BackfillJob] = {}
-        self._cancelled: set = set()
+        # status -> job IDs in that status (dict keys keep creation order)
+        self._jobs_by_status: Dict[BackfillStatus, Dict[str, None]] = defaultdict(dict)
+        self._cancel_events: Dict[str, asyncio.Event] = {}
+        self._cost_batch: Dict[str, List[CostEntry]] = {}
+        self._progress_subscribers: Dict[str, List[asyncio.Queue]] = {}
+        # Dedicated pool so blocking fetch/summarize calls don't crowd the default executor
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="backfill",
+        )
+        self.analyze_ttl_seconds = analyze_ttl_seconds
+        # (source_key, start, end, include_outdated, prompt_version, model) -> (computed_at, report)
+        self._analyze_cache: Dict[tuple, Tuple[float, BackfillReport]] = {}
+        # Exact (model, tokens_in, tokens_out) -> (cost, pricing_version); reset per job
+        self._calculate_cost = functools.lru_cache(maxsize=1024)(
+            self.cost_tracker.pricing.calculate_cost
+        )
+
+    def subscribe_progress(self, job_id: str) -> asyncio.Queue:
+        """
+        Subscribe to a job's progress updates.
+
+        Args:
+            job_id: Job to follow
+
+        Returns:
+            Queue receiving each ProgressDelta, then None when the job stops
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._progress_subscribers.setdefault(job_id, []).append(queue)
+        return queue
+
+    def _apply_progress(self, job: BackfillJob, delta: ProgressDelta) -> None:
+        """Apply a progress delta to a job and publish it to subscribers."""
+        delta.apply(job.progress)
+        for queue in self._progress_subscribers.get(job.job_id, ()):
+            queue.put_nowait(delta)
+
+    def close(self) -> None:
+        """Shut down the worker threads used for fetching and summarizing."""
+        self._executor.shutdown(wait=True)
+
+    def cost_cache_info(self):
+        """Hit/miss statistics for the per-job cost calculation cache."""
+        return self._calculate_cost.cache_info()
 
     def analyze_backfill(
         self,
@@ -179,6 +409,15 @@ class BackfillManager:
         Returns:
             Backfill report with dates and cost estimate
         """
+        cache_key = (
+            source.source_key, start_date, end_date,
+            include_outdated, current_prompt_version, model,
+        )
+        now = time.monotonic()
+        cached = self._analyze_cache.get(cache_key)
+        if cached and now - cached[0] < self.analyze_ttl_seconds:
+            return cached[1]
+
         # Scan the source
         scan_result = self.scanner.scan_source(
             source,
@@ -193,14 +432,10 @@ class BackfillManager:
             include_failed=True,
             include_outdated=include_outdated,
             current_prompt_version=current_prompt_version,
+            start_date=start_date,
+            end_date=end_date,
         )
 
-        # Filter by date range
-        if start_date:
-            backfill_dates = [d for d in backfill_dates if d >= start_date]
-        if end_date:
-            backfill_dates = [d for d in backfill_dates if d <= end_date]
-
         # Estimate cost
         estimate = self.cost_tracker.estimate_backfill_cost(
             source_key=source.source_key,
@@ -208,13 +443,52 @@ class BackfillManager:
             model=model,
         )
 
-        return BackfillReport(
+        report = BackfillReport(
             source=source,
             scan_result=scan_result,
             backfill_dates=backfill_dates,
             estimated_cost_usd=estimate.estimated_cost_usd,
             estimated_tokens=estimate.avg_tokens_per_summary * len(backfill_dates),
         )
+        self._analyze_cache[cache_key] = (now, report)
+        return report
+
+    def _cached_candidates(
+        self,
+        source: ArchiveSource,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        include_outdated: bool,
+    ) -> Optional[List[date]]:
+        """
+        Reuse backfill dates from a recent analyze_backfill call.
+
+        Only reports whose candidate set matches an unversioned scan qualify;
+        the estimation model does not affect the dates.
+
+        Returns:
+            Copy of the cached dates, or None if no fresh report matches
+        """
+        now = time.monotonic()
+        for key, (computed_at, report) in self._analyze_cache.items():
+            source_key, start, end, outdated, prompt_version, _ = key
+            if (
+                source_key == source.source_key
+                and start == start_date
+                and end == end_date
+                and outdated == include_outdated
+                and (not outdated or prompt_version is None)
+                and now - computed_at < self.analyze_ttl_seconds
+            ):
+                return list(report.backfill_dates)
+        return None
+
+    def _invalidate_analysis(self, source_key: str) -> None:
+        """Drop cached analyze_backfill reports for a source."""
+        self._analyze_cache = {
+            key: value for key, value in self._analyze_cache.items()
+            if key[0] != source_key
+        }
 
     async def create_backfill_job(
         self,
@@ -225,6 +499,7 @@ class BackfillManager:
         max_cost_usd: Optional[float] = None,
         dry_run: bool = False,
         regenerate_existing: bool = False,
+        dates_pre_sorted: bool = False,
     ) -> BackfillJob:
         """
         Create a new backfill job.
@@ -237,25 +512,31 @@ class BackfillManager:
             max_cost_usd: Maximum cost limit
             dry_run: If True, only estimate without generating
             regenerate_existing: If True, regenerate existing summaries
+            dates_pre_sorted: Caller guarantees dates are already ascending
 
         Returns:
             Created backfill job
         """
-        job_id = f"bf_{uuid.uuid4().hex[:12]}"
+        job_id = f"bf_{os.urandom(6).hex()}"
 
         # Determine dates to backfill
         if dates:
-            backfill_dates = sorted(dates)
+            backfill_dates = list(dates) if dates_pre_sorted else sorted(dates)
         else:
-            backfill_dates = self.scanner.get_backfill_candidates(
-                source,
-                include_failed=True,
-                include_outdated=regenerate_existing,
+            # The UI usually analyzes right before starting a job
+            cached_dates = self._cached_candidates(
+                source, start_date, end_date, regenerate_existing
             )
-            if start_date:
-                backfill_dates = [d for d in backfill_dates if d >= start_date]
-            if end_date:
-                backfill_dates = [d for d in backfill_dates if d <= end_date]
+            if cached_dates is not None:
+                backfill_dates = cached_dates
+            else:
+                backfill_dates = self.scanner.get_backfill_candidates(
+                    source,
+                    include_failed=True,
+                    include_outdated=regenerate_existing,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
 
         job = BackfillJob(
             job_id=job_id,
@@ -268,6 +549,8 @@ class BackfillManager:
         )
 
         self._jobs[job_id] = job
+        self._jobs_by_status[job.status][job_id] = None
+        self._cancel_events[job_id] = asyncio.Event()
         logger.info(f"Created backfill job {job_id} with {len(backfill_dates)} periods")
 
         return job
@@ -279,6 +562,7 @@ class BackfillManager:
         prompt_version: str = "1.0.0",
         prompt_checksum: str = "sha256:unknown",
         model: str = "anthropic/claude-3-haiku",
+        concurrency: int = 3,
     ) -> BackfillJob:
         """
         Execute a backfill job.
@@ -289,6 +573,7 @@ class BackfillManager:
             prompt_version: Prompt version for metadata
             prompt_checksum: Prompt checksum for metadata
             model: Model to use
+            concurrency: Maximum dates processed at once
 
         Returns:
             Updated job with results
@@ -297,83 +582,121 @@ class BackfillManager:
         if not job:
             raise ValueError(f"Job not found: {job_id}")
 
+        if job.dry_run:
+            return self._complete_dry_run(job, model)
+
         if not self.message_fetcher or not self.summarizer:
             raise ValueError("Message fetcher and summarizer must be configured")
 
-        job.status = BackfillStatus.RUNNING
+        self._set_status(job, BackfillStatus.RUNNING)
         job.started_at = utc_now_naive()
+        cancel_event = self._cancel_events.setdefault(job_id, asyncio.Event())
+        # Pricing may have been refreshed since the last job
+        self._calculate_cost.cache_clear()
+        source_dir = str(job.source.get_archive_path(self.archive_root))
 
         try:
             # PERF-003: Parallelize backfill processing with controlled concurrency
             # Use semaphore to limit concurrent API calls (3-5 is safe for most APIs)
-            concurrency_limit = 3
-            semaphore = asyncio.Semaphore(concurrency_limit)
-
-            async def process_date(target_date: date) -> tuple[date, bool, Optional[str]]:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            # Bound once rather than re-resolved for every date
+            backfill_date = self._backfill_date
+            apply_progress = self._apply_progress
+            invalidate_analysis = self._invalidate_analysis
+            is_cancelled = cancel_event.is_set
+            progress = job.progress
+            max_cost_usd = job.max_cost_usd
+            source_key = job.source.source_key
+
+            async def process_date(target_date: date) -> str:
                 """Process a single date with semaphore control.
 
-                Returns: (date, success, error_msg)
+                Returns: "completed", "skipped", "failed", "cancelled" or "cost_limit"
                 """
-                # Check for cancellation before starting
-                if job_id in self._cancelled:
-                    return (target_date, False, "cancelled")
-
-                # Check cost limit before starting
-                if job.max_cost_usd and job.progress.cost_usd >= job.max_cost_usd:
-                    return (target_date, False, "cost_limit")
-
                 async with semaphore:
+                    # Checked once a slot is free so that dates still queued
+                    # behind the semaphore see cancellation and spent budget
+                    if is_cancelled():
+                        return "cancelled"
+                    if max_cost_usd and progress.cost_usd >= max_cost_usd:
+                        return "cost_limit"
+
+                    apply_progress(job, ProgressDelta(current_period=target_date.isoformat()))
                     try:
-                        await self._backfill_date(
+                        processed = await backfill_date(
                             job=job,
                             target_date=target_date,
                             timezone=timezone,
                             prompt_version=prompt_version,
                             prompt_checksum=prompt_checksum,
                             model=model,
+                            source_dir=source_dir,
                         )
-                        return (target_date, True, None)
                     except Exception as e:
                         logger.error(f"Failed to backfill {target_date}: {e}")
-                        return (target_date, False, str(e))
-
-            # Process all dates concurrently with limited parallelism
-            results = await asyncio.gather(
-                *[process_date(d) for d in job.dates],
-                return_exceptions=True
+                        apply_progress(job, _DATE_FAILED)
+                        return "failed"
+
+                    if not processed:
+                        apply_progress(job, _DATE_SKIPPED)
+                        return "skipped"
+                    invalidate_analysis(source_key)
+                    apply_progress(job, _DATE_COMPLETED)
+                    return "completed"
+
+            # Process all dates concurrently with limited parallelism, then
+            # make the job's summaries durable with a single fsync pass
+            with self.writer.begin_batch() as write_batch:
+                results = await asyncio.gather(
+                    *[process_date(d) for d in job.dates],
+                    return_exceptions=True
+                )
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, write_batch.sync
             )
 
-            # Process results and update progress
             for result in results:
                 if isinstance(result, Exception):
-                    job.progress.failed += 1
+                    self._apply_progress(job, _DATE_FAILED)
                     logger.error(f"Backfill task exception: {result}")
-                else:
-                    target_date, success, error_msg = result
-                    if success:
-                        job.progress.completed += 1
-                    elif error_msg == "cancelled":
-                        job.status = BackfillStatus.CANCELLED
-                        break
-                    elif error_msg == "cost_limit":
-                        job.status = BackfillStatus.PAUSED
-                        job.error = "Cost limit reached"
-                        break
-                    else:
-                        job.progress.failed += 1
-
-            if job.status == BackfillStatus.RUNNING:
-                job.status = BackfillStatus.COMPLETED
+
+            if "cancelled" in results:
+                self._set_status(job, BackfillStatus.CANCELLED)
+            elif "cost_limit" in results:
+                self._set_status(job, BackfillStatus.PAUSED)
+                job.error = "Cost limit reached"
+            elif job.status == BackfillStatus.RUNNING:
+                self._set_status(job, BackfillStatus.COMPLETED)
 
         except Exception as e:
-            job.status = BackfillStatus.FAILED
+            self._set_status(job, BackfillStatus.FAILED)
             job.error = str(e)
             logger.error(f"Backfill job {job_id} failed: {e}")
 
         finally:
+            self._flush_costs(job_id)
             job.completed_at = utc_now_naive()
             job.progress.current_period = None
+            for queue in self._progress_subscribers.pop(job_id, ()):
+                queue.put_nowait(None)
+
+        return job
 
+    def _complete_dry_run(self, job: BackfillJob, model: str) -> BackfillJob:
+        """Finish a dry-run job with its cost estimate, without generating."""
+        estimate = self.cost_tracker.estimate_backfill_cost(
+            source_key=job.source.source_key,
+            periods=len(job.dates),
+            model=model,
+        )
+        job.started_at = utc_now_naive()
+        job.progress.completed = len(job.dates)
+        job.progress.cost_usd = estimate.estimated_cost_usd
+        self._set_status(job, BackfillStatus.COMPLETED)
+        job.completed_at = job.started_at
+        for queue in self._progress_subscribers.pop(job.job_id, ()):
+            queue.put_nowait(None)
         return job
 
     async def _backfill_date(
@@ -384,15 +707,26 @@ class BackfillManager:
         prompt_version: str,
         prompt_checksum: str,
         model: str,
-    ) -> None:
-        """Backfill a single date."""
+        source_dir: Optional[str] = None,
+    ) -> bool:
+        """
+        Backfill a single date.
+
+        Args:
+            source_dir: Pre-computed archive directory of the job's source
+
+        Returns:
+            False if the date was skipped because another job holds it
+        """
+        # run_backfill_job refuses to start without both
+        message_fetcher, summarizer = self.message_fetcher, self.summarizer
+        assert message_fetcher is not None and summarizer is not None
         source = job.source
 
         # Create period for the day
-        import pytz
-        tz = pytz.timezone(timezone)
-        start_dt = tz.localize(datetime.combine(target_date, datetime.min.time()))
-        end_dt = tz.localize(datetime.combine(target_date, datetime.max.time().replace(microsecond=0)))
+        tz = _get_timezone(timezone)
+        start_dt = datetime.combine(target_date, _DAY_START, tzinfo=tz)
+        end_dt = datetime.combine(target_date, _DAY_END, tzinfo=tz)
 
         period = PeriodInfo(
             start=start_dt,
@@ -401,26 +735,35 @@ class BackfillManager:
             duration_hours=24,
         )
 
-        # Acquire lock
-        meta_path = source.get_archive_path(self.archive_root) / str(target_date.year) / f"{target_date.month:02d}" / f"{target_date.isoformat()}_daily.meta.json"
-        lock_job_id = await self.lock_manager.acquire_lock(meta_path, job.job_id)
+        # Claim the date
+        if source_dir is None:
+            source_dir = str(source.get_archive_path(self.archive_root))
+        meta_path = Path(
+            f"{source_dir}/{target_date.year}/{target_date.month:02d}/"
+            f"{target_date.isoformat()}_daily.meta.json"
+        )
+        claim_path = Path(f"{meta_path}.lock")
 
-        if not lock_job_id and not job.regenerate_existing:
-            job.progress.skipped += 1
-            return
+        if not job.regenerate_existing and _is_complete(meta_path):
+            return False
+        claimed = _try_claim(claim_path, job.job_id)
+        if not claimed and not job.regenerate_existing:
+            return False
 
         try:
             # Fetch messages
-            start_time = datetime.now()
-            messages = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.message_fetcher,
+            start_ns = time.monotonic_ns()
+            loop = asyncio.get_running_loop()
+            messages = await loop.run_in_executor(
+                self._executor,
+                message_fetcher,
                 source,
                 start_dt,
                 end_dt,
             )
 
-            if not messages:
+            message_count, participant_count = _message_stats(messages)
+            if not message_count:
                 # Write incomplete marker
                 self.writer.write_incomplete_marker(
                     source=source,
@@ -429,29 +772,29 @@ class BackfillManager:
                     reason_message="No messages found in this period",
                     backfill_eligible=False,
                 )
-                return
+                return True
 
             # Generate summary
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.summarizer,
+            result = await loop.run_in_executor(
+                self._executor,
+                summarizer,
                 messages,
                 source,
             )
 
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = (time.monotonic_ns() - start_ns) / 1e9
 
             # Calculate cost
             tokens_in = result.get("tokens_input", 0)
             tokens_out = result.get("tokens_output", 0)
-            cost, pricing_version = self.cost_tracker.pricing.calculate_cost(
-                model, tokens_in, tokens_out
-            )
+            cost, pricing_version = self._calculate_cost(model, tokens_in, tokens_out)
 
             # Update progress
-            job.progress.cost_usd += cost
-            job.progress.tokens_input += tokens_in
-            job.progress.tokens_output += tokens_out
+            self._apply_progress(job, ProgressDelta(
+                cost_usd=cost,
+                tokens_input=tokens_in,
+                tokens_output=tokens_out,
+            ))
 
             # Create generation info
             generation = GenerationInfo(
@@ -469,8 +812,8 @@ class BackfillManager:
 
             # Create statistics
             stats = SummaryStatistics(
-                message_count=len(messages),
-                participant_count=len(set(m.get("author_id") for m in messages)),
+                message_count=message_count,
+                participant_count=participant_count,
             )
 
             # Write summary
@@ -484,8 +827,9 @@ class BackfillManager:
                 backfill_reason="historical_archive",
             )
 
-            # Record cost
-            self.cost_tracker.record_cost(CostEntry(
+            # Queue cost for the next ledger flush
+            batch = self._cost_batch.setdefault(job.job_id, [])
+            batch.append(CostEntry(
                 source_key=source.source_key,
                 summary_id=f"sum_{target_date.isoformat()}",
                 timestamp=utc_now_naive(),
@@ -495,21 +839,50 @@ class BackfillManager:
                 cost_usd=cost,
                 pricing_version=pricing_version,
             ))
+            if len(batch) >= _COST_FLUSH_EVERY:
+                self._flush_costs(job.job_id)
+            return True
 
         finally:
-            await self.lock_manager.release_lock(meta_path, SummaryStatus.COMPLETE)
+            if claimed:
+                _release_claim(claim_path, job.job_id)
+
+    def _flush_costs(self, job_id: str) -> None:
+        """Write a job's queued cost entries to the ledger."""
+        entries = self._cost_batch.pop(job_id, None)
+        if entries:
+            self.cost_tracker.record_costs_bulk(entries)
 
     def get_job(self, job_id: str) -> Optional[BackfillJob]:
         """Get a backfill job by ID."""
         return self._jobs.get(job_id)
 
-    def list_jobs(self) -> List[BackfillJob]:
-        """List all backfill jobs."""
-        return list(self._jobs.values())
+    def _set_status(self, job: BackfillJob, status: BackfillStatus) -> None:
+        """Transition a job's status, keeping the status index in sync."""
+        self._jobs_by_status[job.status].pop(job.job_id, None)
+        job.status = status
+        self._jobs_by_status[status][job.job_id] = None
+
+    def list_jobs(self, status: Optional[BackfillStatus] = None) -> List[BackfillJob]:
+        """
+        List backfill jobs.
+
+        Args:
+            status: Only return jobs in this status
+
+        Returns:
+            Matching jobs
+        """
+        if status is None:
+            return list(self._jobs.values())
+        jobs = (self._jobs[job_id] for job_id in self._jobs_by_status[status])
+        # Guard against callers assigning job.status directly
+        return [job for job in jobs if job.status == status]
 
     def cancel_job(self, job_id: str) -> bool:
         """Cancel a running backfill job."""
-        if job_id in self._jobs:
-            self._cancelled.add(job_id)
-            return True
-        return False
+        event = self._cancel_events.get(job_id)
+        if event is None:
+            return False
+        event.set()
+        return True
@@ -5,31 +5,125 @@ Tracks API costs per source for billing, budgeting, and reporting.
 Implements ADR-006 Section 4: Cost Attribution & Tracking.
 """
 
+import asyncio
+import atexit
+import bisect
 import json
 import logging
+import os
+import tempfile
+import time
+import weakref
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Sequence, Tuple, Any
 
-from .models import CostEntry
+from .models import CostEntry, _SLOTS
 from src.utils.time import utc_now_naive
 
+orjson: Any  # None when orjson is not installed
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Mode open() gives new files. mkstemp creates 0o600 temp files, and that
+# mode would otherwise carry over to the ledger they are renamed to.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_FILE_MODE = 0o666 & ~_UMASK
+
+
+def _month_key(ts: datetime) -> str:
+    """Ledger month key ("YYYY-MM") without going through strftime."""
+    return f"{ts.year:04d}-{ts.month:02d}"
+
+
+def _json_dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize ledger/pricing data, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _to_micros(cost_usd: float) -> int:
+    """Convert a USD amount to integer micro-USD (costs are priced to 6 decimals)."""
+    return round(cost_usd * 1_000_000)
+
+
+def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+    """
+    Replace a file so a crash leaves either the old or the new contents.
+
+    The data is written to a sibling temp file, fsynced, then swapped in
+    with os.replace.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}-", suffix=".tmp")
+    try:
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, _FILE_MODE)
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse ledger/pricing data, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Upper bound on cached (model, pricing version) rate lookups
+_RATE_CACHE_MAX_ENTRIES = 512
+
+# Concurrent OpenRouter pricing requests in PricingTable.refresh_all
+_PRICING_FETCH_CONCURRENCY = 4
+
+# Trackers with possibly unsaved costs, flushed at interpreter exit
+_LIVE_TRACKERS: "weakref.WeakSet[CostTracker]" = weakref.WeakSet()
+
 
-@dataclass
+@atexit.register
+def _flush_live_trackers() -> None:
+    for tracker in list(_LIVE_TRACKERS):
+        try:
+            tracker.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush cost ledger on exit: {e}")
+
+
+@dataclass(**_SLOTS)
 class MonthlyCost:
     """Monthly cost aggregation for a source."""
-    cost_usd: float = 0.0
+    # Integer micro-USD, so sums of many small costs do not drift
+    cost_micros: int = 0
     summaries: int = 0
     tokens_input: int = 0
     tokens_output: int = 0
     api_key_source: str = "default"
 
+    @property
+    def cost_usd(self) -> float:
+        """Accumulated cost in USD."""
+        return self.cost_micros / 1_000_000
+
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "cost_usd": round(self.cost_usd, 4),
+            "cost_usd": self.cost_usd,
+            "cost_micros": self.cost_micros,
             "summaries": self.summaries,
             "tokens_input": self.tokens_input,
             "tokens_output": self.tokens_output,
@@ -37,7 +131,11 @@ class MonthlyCost:
         }
 
 
-@dataclass
+# Read-only stand-in for months with no recorded cost
+_EMPTY_MONTH = MonthlyCost()
+
+
+@dataclass(**_SLOTS)
 class SourceCost:
     """Cost tracking for a single source."""
     server_name: str
@@ -46,21 +144,28 @@ class SourceCost:
     api_key_source: str = "default"
     api_key_ref: Optional[str] = None
     monthly: Dict[str, MonthlyCost] = field(default_factory=dict)
-    last_updated: datetime = field(default_factory=utc_now_naive)
+    # Epoch seconds; converted to a datetime only when read or serialized
+    last_updated_ts: float = field(default_factory=time.time)
+
+    @property
+    def last_updated(self) -> datetime:
+        """Last update time as a naive UTC datetime."""
+        return datetime.fromtimestamp(self.last_updated_ts, timezone.utc).replace(tzinfo=None)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "server_name": self.server_name,
-            "total_cost_usd": round(self.total_cost_usd, 4),
+            "total_cost_usd": self.total_cost_usd,
             "summary_count": self.summary_count,
             "api_key_source": self.api_key_source,
             "api_key_ref": self.api_key_ref,
             "monthly": {k: v.to_dict() for k, v in self.monthly.items()},
             "last_updated": self.last_updated.isoformat(),
+            "last_updated_ts": self.last_updated_ts,
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CostEstimate:
     """Estimated cost for a backfill operation."""
     periods: int
@@ -99,17 +204,59 @@ class PricingTable:
         """
         self.pricing_path = pricing_path
         self._pricing_cache: Dict[str, Dict] = {}
+        # Versions sorted by effective date, for bisect lookups in get_pricing
+        self._version_datetimes: List[datetime] = []
+        self._sorted_versions: List[Tuple[datetime, str, Dict]] = []
+        # Per-version model -> (input_rate, output_rate, version_date), parallel to
+        # _sorted_versions and built on first lookup, since most lookups hit the newest version
+        self._resolved_rates: List[Optional[Dict[str, Tuple[float, float, str]]]] = []
+        # Aliases and unknown models: (model, version_date) -> resolved rates
+        self._rate_cache: Dict[Tuple[str, str], Tuple[float, float, str]] = {}
+        self._client = None  # Shared httpx.AsyncClient, created on first fetch
         self._load_pricing()
 
     def _load_pricing(self) -> None:
         """Load pricing from file or use static fallback."""
         if self.pricing_path and self.pricing_path.exists():
-            with open(self.pricing_path, 'r') as f:
-                data = json.load(f)
-                for version in data.get("versions", []):
-                    self._pricing_cache[version["effective_from"]] = version["models"]
+            data = _json_loads(self.pricing_path.read_bytes())
+            for version in data.get("versions", []):
+                self._pricing_cache[version["effective_from"]] = version["models"]
         else:
             self._pricing_cache = self.STATIC_PRICING.copy()
+        self._rebuild_version_index()
+
+    def _rebuild_version_index(self) -> None:
+        """Parse and sort pricing versions once, after the table changes."""
+        self._sorted_versions = sorted(
+            (datetime.fromisoformat(version_date), version_date, models)
+            for version_date, models in self._pricing_cache.items()
+        )
+        self._version_datetimes = [entry[0] for entry in self._sorted_versions]
+        self._resolved_rates = [None] * len(self._sorted_versions)
+        self._rate_cache.clear()
+
+    @staticmethod
+    def _resolve_version(version_date: str, models: Dict) -> Dict[str, Tuple[float, float, str]]:
+        """Flatten one pricing version into ready-to-return rate tuples."""
+        return {
+            model_id: (pricing["input"], pricing["output"], version_date)
+            for model_id, pricing in models.items()
+        }
+
+    def _set_version(self, version_date: str, models: Dict) -> None:
+        """Add or replace one pricing version, keeping the index sorted."""
+        version_dt = datetime.fromisoformat(version_date)
+        idx = bisect.bisect_left(self._version_datetimes, version_dt)
+        entry = (version_dt, version_date, models)
+        if idx < len(self._sorted_versions) and self._sorted_versions[idx][1] == version_date:
+            self._sorted_versions[idx] = entry
+            self._resolved_rates[idx] = None
+        else:
+            self._sorted_versions.insert(idx, entry)
+            self._version_datetimes.insert(idx, version_dt)
+            self._resolved_rates.insert(idx, None)
+        self._pricing_cache[version_date] = models
+        self._rate_cache.clear()
 
     def get_pricing(
         self,
@@ -129,23 +276,35 @@ class PricingTable:
         if timestamp is None:
             timestamp = utc_now_naive()
 
-        # Find the applicable pricing version
-        applicable_version = None
-        applicable_date = None
-
-        for version_date in sorted(self._pricing_cache.keys(), reverse=True):
-            version_dt = datetime.fromisoformat(version_date)
-            if version_dt <= timestamp:
-                applicable_version = self._pricing_cache[version_date]
-                applicable_date = version_date
-                break
-
-        if not applicable_version:
-            # Use the earliest version
-            earliest = min(self._pricing_cache.keys())
-            applicable_version = self._pricing_cache[earliest]
-            applicable_date = earliest
-
+        # Find the latest version in effect at timestamp, else the earliest
+        idx = max(bisect.bisect_right(self._version_datetimes, timestamp) - 1, 0)
+        resolved = self._resolved_rates[idx]
+        if resolved is None:
+            _, applicable_date, applicable_version = self._sorted_versions[idx]
+            resolved = self._resolved_rates[idx] = self._resolve_version(applicable_date, applicable_version)
+        rates = resolved.get(model)
+        if rates is not None:
+            return rates
+
+        # Dated aliases and unknown models go through the fallback resolution
+        _, applicable_date, applicable_version = self._sorted_versions[idx]
+        cache_key = (model, applicable_date)
+        rates = self._rate_cache.get(cache_key)
+        if rates is None:
+            rates = self._resolve_rates(model, applicable_date, applicable_version)
+            if len(self._rate_cache) >= _RATE_CACHE_MAX_ENTRIES:
+                # Drop the oldest entry
+                del self._rate_cache[next(iter(self._rate_cache))]
+            self._rate_cache[cache_key] = rates
+        return rates
+
+    @staticmethod
+    def _resolve_rates(
+        model: str,
+        applicable_date: str,
+        applicable_version: Dict,
+    ) -> Tuple[float, float, str]:
+        """Resolve a model's rates within one pricing version."""
         # Get model pricing
         if model in applicable_version:
             pricing = applicable_version[model]
@@ -184,6 +343,70 @@ class PricingTable:
         cost = (tokens_input / 1000 * input_rate) + (tokens_output / 1000 * output_rate)
         return round(cost, 6), version
 
+    def calculate_costs(
+        self,
+        models: Sequence[str],
+        tokens_input: Sequence[int],
+        tokens_output: Sequence[int],
+        timestamp: Optional[datetime] = None,
+    ):
+        """
+        Calculate costs for many usages at once.
+
+        Rates are resolved once per distinct model, then costs are computed
+        as one vectorized numpy expression.
+
+        Args:
+            models: Model ID for each usage
+            tokens_input: Input tokens for each usage
+            tokens_output: Output tokens for each usage
+            timestamp: Time for pricing lookup
+
+        Returns:
+            numpy float64 array of costs, rounded like calculate_cost
+        """
+        import numpy as np
+
+        if timestamp is None:
+            timestamp = utc_now_naive()
+
+        rates = {}
+        rate_in = np.empty(len(models), dtype=np.float64)
+        rate_out = np.empty(len(models), dtype=np.float64)
+        for i, model in enumerate(models):
+            if model not in rates:
+                rates[model] = self.get_pricing(model, timestamp)[:2]
+            rate_in[i], rate_out[i] = rates[model]
+
+        tokens_in = np.asarray(tokens_input, dtype=np.float64)
+        tokens_out = np.asarray(tokens_output, dtype=np.float64)
+        costs = tokens_in / 1000 * rate_in + tokens_out / 1000 * rate_out
+        return np.round(costs, 6)
+
+    async def _get_client(self):
+        """Get or create the shared HTTP client for OpenRouter pricing fetches."""
+        if self._client is None or self._client.is_closed:
+            import httpx
+
+            try:
+                import h2  # noqa: F401
+                http2 = True
+            except ImportError:
+                http2 = False
+
+            self._client = httpx.AsyncClient(
+                http2=http2,
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=4),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+            self._client = None
+
     async def fetch_openrouter_pricing(self, api_key: str) -> bool:
         """
         Fetch current pricing from OpenRouter API.
@@ -194,50 +417,70 @@ class PricingTable:
         Returns:
             True if pricing was updated
         """
-        import httpx
-
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://openrouter.ai/api/v1/models",
-                    headers={"Authorization": f"Bearer {api_key}"},
-                    timeout=10.0
-                )
-
-                if response.status_code != 200:
-                    logger.warning(f"Failed to fetch OpenRouter pricing: {response.status_code}")
-                    return False
-
-                data = response.json()
-                today = utc_now_naive().strftime("%Y-%m-%d")
-
-                # Parse model pricing
-                models = {}
-                for model in data.get("data", []):
-                    model_id = model.get("id")
-                    pricing = model.get("pricing", {})
-
-                    if model_id and pricing:
-                        # OpenRouter returns per-token prices, we store per-1k
-                        input_price = float(pricing.get("prompt", 0)) * 1000
-                        output_price = float(pricing.get("completion", 0)) * 1000
-                        models[model_id] = {
-                            "input": input_price,
-                            "output": output_price,
-                        }
-
-                if models:
-                    self._pricing_cache[today] = models
-                    self._save_pricing()
-                    logger.info(f"Updated pricing for {len(models)} models")
-                    return True
+            client = await self._get_client()
+            response = await client.get(
+                "https://openrouter.ai/api/v1/models",
+                headers={"Authorization": f"Bearer {api_key}"},
+                timeout=10.0
+            )
 
+            if response.status_code != 200:
+                logger.warning(f"Failed to fetch OpenRouter pricing: {response.status_code}")
                 return False
 
+            data = response.json()
+            today = utc_now_naive().strftime("%Y-%m-%d")
+
+            # Parse model pricing
+            models = {}
+            for model in data.get("data", []):
+                model_id = model.get("id")
+                pricing = model.get("pricing", {})
+
+                if model_id and pricing:
+                    # OpenRouter returns per-token prices, we store per-1k
+                    input_price = float(pricing.get("prompt", 0)) * 1000
+                    output_price = float(pricing.get("completion", 0)) * 1000
+                    models[model_id] = {
+                        "input": input_price,
+                        "output": output_price,
+                    }
+
+            if models:
+                self._set_version(today, models)
+                self._save_pricing()
+                logger.info(f"Updated pricing for {len(models)} models")
+                return True
+
+            return False
+
         except Exception as e:
             logger.error(f"Error fetching OpenRouter pricing: {e}")
             return False
 
+    async def refresh_all(self, api_keys: Sequence[str]) -> bool:
+        """
+        Fetch OpenRouter pricing with several keys concurrently.
+
+        Requests run in parallel, bounded by _PRICING_FETCH_CONCURRENCY, so a
+        refresh takes as long as the slowest key rather than the sum.
+
+        Args:
+            api_keys: OpenRouter API keys; duplicates are fetched once
+
+        Returns:
+            True if any key updated the pricing
+        """
+        semaphore = asyncio.Semaphore(_PRICING_FETCH_CONCURRENCY)
+
+        async def fetch(api_key: str) -> bool:
+            async with semaphore:
+                return await self.fetch_openrouter_pricing(api_key)
+
+        results = await asyncio.gather(*(fetch(key) for key in dict.fromkeys(api_keys)))
+        return any(results)
+
     def _save_pricing(self) -> None:
         """Save pricing to file."""
         if not self.pricing_path:
@@ -256,9 +499,7 @@ class PricingTable:
             "versions": versions,
         }
 
-        self.pricing_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.pricing_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        _atomic_write_bytes(self.pricing_path, _json_dumps(data))
 
 
 class CostTracker:
@@ -271,7 +512,9 @@ class CostTracker:
     def __init__(
         self,
         ledger_path: Path,
-        pricing_table: Optional[PricingTable] = None
+        pricing_table: Optional[PricingTable] = None,
+        flush_interval_s: float = 5.0,
+        max_pending: int = 100,
     ):
         """
         Initialize cost tracker.
@@ -279,13 +522,28 @@ class CostTracker:
         Args:
             ledger_path: Path to cost ledger JSON file
             pricing_table: Optional pricing table (creates one if not provided)
+            flush_interval_s: Longest time a recorded cost waits before being saved
+            max_pending: Save immediately once this many costs are unsaved
         """
         self.ledger_path = ledger_path
         self.pricing = pricing_table or PricingTable()
+        self.flush_interval_s = flush_interval_s
+        self.max_pending = max_pending
         self._sources: Dict[str, SourceCost] = {}
+        # Ledger form of each source, rebuilt only for sources touched since the last save
+        self._serialized_sources: Dict[str, Dict[str, Any]] = {}
+        self._dirty_sources: Dict[str, None] = {}  # ordered set
         self._total_cost: float = 0.0
         self._total_summaries: int = 0
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Current-month cost per source for budget checks, rebuilt at month rollover
+        self._current_month_key = ""
+        self._current_month_ends_ts = 0.0
+        self._current_month_costs: Dict[str, float] = {}
         self._load_ledger()
+        _LIVE_TRACKERS.add(self)
 
     def _load_ledger(self) -> None:
         """Load cost ledger from disk."""
@@ -293,8 +551,7 @@ class CostTracker:
             return
 
         try:
-            with open(self.ledger_path, 'r') as f:
-                data = json.load(f)
+            data = _json_loads(self.ledger_path.read_bytes())
 
             self._total_cost = data.get("total_cost_usd", 0.0)
             self._total_summaries = data.get("total_summaries", 0)
@@ -303,7 +560,7 @@ class CostTracker:
                 monthly = {}
                 for month_key, month_data in source_data.get("monthly", {}).items():
                     monthly[month_key] = MonthlyCost(
-                        cost_usd=month_data.get("cost_usd", 0.0),
+                        cost_micros=self._load_cost_micros(month_data),
                         summaries=month_data.get("summaries", 0),
                         tokens_input=month_data.get("tokens_input", 0),
                         tokens_output=month_data.get("tokens_output", 0),
@@ -317,71 +574,143 @@ class CostTracker:
                     api_key_source=source_data.get("api_key_source", "default"),
                     api_key_ref=source_data.get("api_key_ref"),
                     monthly=monthly,
-                    last_updated=datetime.fromisoformat(source_data["last_updated"]) if source_data.get("last_updated") else utc_now_naive(),
+                    last_updated_ts=self._load_last_updated(source_data),
                 )
 
+            self._dirty_sources.update(dict.fromkeys(self._sources))
             logger.info(f"Loaded cost ledger: {len(self._sources)} sources, ${self._total_cost:.2f} total")
 
         except Exception as e:
             logger.error(f"Failed to load cost ledger: {e}")
 
+    @staticmethod
+    def _load_cost_micros(month_data: Dict[str, Any]) -> int:
+        """Read a month's cost, converting from USD only for older ledgers."""
+        if "cost_micros" in month_data:
+            return int(month_data["cost_micros"])
+        return _to_micros(month_data.get("cost_usd", 0.0))
+
+    @staticmethod
+    def _load_last_updated(source_data: Dict[str, Any]) -> float:
+        """Read a source's update time, parsing ISO only for older ledgers."""
+        if "last_updated_ts" in source_data:
+            return float(source_data["last_updated_ts"])
+        if source_data.get("last_updated"):
+            parsed = datetime.fromisoformat(source_data["last_updated"])
+            return parsed.replace(tzinfo=timezone.utc).timestamp()
+        return time.time()
+
     def _save_ledger(self) -> None:
         """Save cost ledger to disk."""
         data = {
             "schema_version": "1.0.0",
             "currency": "USD",
-            "total_cost_usd": round(self._total_cost, 4),
+            "total_cost_usd": self._total_cost,
             "total_summaries": self._total_summaries,
-            "sources": {k: v.to_dict() for k, v in self._sources.items()},
+            "sources": self._serialize_sources(),
         }
 
-        self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.ledger_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        _atomic_write_bytes(self.ledger_path, _json_dumps(data))
+
+    def _serialize_sources(self) -> Dict[str, Dict[str, Any]]:
+        """Refresh the ledger form of sources changed since the last save."""
+        for source_key in self._dirty_sources:
+            self._serialized_sources[source_key] = self._sources[source_key].to_dict()
+        self._dirty_sources.clear()
+        return self._serialized_sources
+
+    def flush(self) -> None:
+        """Save any costs recorded since the last save."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        self._save_ledger()
+        self._pending = 0
+        self._last_flush = time.monotonic()
 
     def record_cost(self, entry: CostEntry) -> None:
         """
         Record a cost entry to the ledger.
 
+        The ledger is saved once max_pending costs are waiting or
+        flush_interval_s has passed; call flush() to save immediately.
+
         Args:
             entry: Cost entry to record
         """
+        self._apply_cost(entry)
+        self._pending += 1
+        logger.debug(f"Recorded cost ${entry.cost_usd:.4f} for {entry.source_key}")
+
+        if (
+            self._pending >= self.max_pending
+            or time.monotonic() - self._last_flush >= self.flush_interval_s
+        ):
+            self.flush()
+        elif self._flush_handle is None:
+            # Make sure a lone cost is still saved once the interval elapses
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            self._flush_handle = loop.call_later(self.flush_interval_s, self.flush)
+
+    def record_costs_bulk(self, entries: List[CostEntry]) -> None:
+        """
+        Record several cost entries with a single ledger write.
+
+        Args:
+            entries: Cost entries to record
+        """
+        if not entries:
+            return
+
+        for entry in entries:
+            self._apply_cost(entry)
+
+        self._pending += len(entries)
+        self.flush()
+        logger.debug(f"Recorded {len(entries)} cost entries")
+
+    def _apply_cost(self, entry: CostEntry) -> None:
+        """Add a cost entry to the in-memory totals."""
         source_key = entry.source_key
+        cost_usd = entry.cost_usd
 
         # Get or create source cost record
-        if source_key not in self._sources:
-            self._sources[source_key] = SourceCost(
+        source = self._sources.get(source_key)
+        if source is None:
+            source = self._sources[source_key] = SourceCost(
                 server_name="",
                 api_key_source=entry.api_key_source,
             )
-
-        source = self._sources[source_key]
-        month_key = entry.timestamp.strftime("%Y-%m")
+        self._dirty_sources[source_key] = None
+        month_key = _month_key(entry.timestamp)
 
         # Get or create monthly record
-        if month_key not in source.monthly:
-            source.monthly[month_key] = MonthlyCost(
+        monthly = source.monthly.get(month_key)
+        if monthly is None:
+            monthly = source.monthly[month_key] = MonthlyCost(
                 api_key_source=entry.api_key_source,
             )
 
-        monthly = source.monthly[month_key]
-
         # Update totals
-        source.total_cost_usd += entry.cost_usd
+        source.total_cost_usd += cost_usd
         source.summary_count += 1
-        source.last_updated = utc_now_naive()
+        source.last_updated_ts = time.time()
 
-        monthly.cost_usd += entry.cost_usd
+        monthly.cost_micros += _to_micros(cost_usd)
         monthly.summaries += 1
         monthly.tokens_input += entry.tokens_input
         monthly.tokens_output += entry.tokens_output
+        if month_key == self._current_month_key:
+            self._current_month_costs[source_key] = monthly.cost_usd
 
-        self._total_cost += entry.cost_usd
+        self._total_cost += cost_usd
         self._total_summaries += 1
 
-        self._save_ledger()
-        logger.debug(f"Recorded cost ${entry.cost_usd:.4f} for {source_key}")
-
     def get_source_cost(self, source_key: str) -> Optional[SourceCost]:
         """
         Get cost information for a source.
@@ -424,9 +753,23 @@ class CostTracker:
 
     def get_current_month_cost(self, source_key: str) -> float:
         """Get current month's cost for a source."""
+        if time.time() >= self._current_month_ends_ts:
+            self._roll_current_month()
+        return self._current_month_costs.get(source_key, 0.0)
+
+    def _roll_current_month(self) -> None:
+        """Rebuild the current-month cost index for the month we are now in."""
         now = utc_now_naive()
-        monthly = self.get_monthly_cost(source_key, now.year, now.month)
-        return monthly.cost_usd if monthly else 0.0
+        self._current_month_key = _month_key(now)
+        next_month = datetime(now.year + now.month // 12, now.month % 12 + 1, 1, tzinfo=timezone.utc)
+        self._current_month_ends_ts = next_month.timestamp()
+
+        costs = {}
+        for source_key, source in self._sources.items():
+            monthly = source.monthly.get(self._current_month_key)
+            if monthly is not None:
+                costs[source_key] = monthly.cost_usd
+        self._current_month_costs = costs
 
     def estimate_backfill_cost(
         self,
@@ -496,30 +839,40 @@ class CostTracker:
         Returns:
             Cost report dictionary
         """
-        now = utc_now_naive()
-        month_key = now.strftime("%Y-%m")
+        import numpy as np
+
+        month_key = _month_key(utc_now_naive())
+        sources = list(self._sources.items())
+        monthlies = [source.monthly.get(month_key, _EMPTY_MONTH) for _, source in sources]
+
+        # Round both cost columns in one vectorized pass
+        total_costs = np.round(
+            np.fromiter((source.total_cost_usd for _, source in sources), np.float64, len(sources)), 4
+        ).tolist()
+        month_costs = np.round(
+            np.fromiter((monthly.cost_usd for monthly in monthlies), np.float64, len(monthlies)), 4
+        ).tolist()
 
-        report = {
+        return {
             "period": month_key,
             "total_cost_usd": round(self._total_cost, 4),
             "total_summaries": self._total_summaries,
-            "sources": [],
+            "sources": [
+                {
+                    "source_key": source_key,
+                    "server_name": source.server_name,
+                    "total_cost_usd": total_cost,
+                    "summary_count": source.summary_count,
+                    "current_month": {
+                        "cost_usd": month_cost,
+                        "summaries": monthly.summaries,
+                        "tokens_input": monthly.tokens_input,
+                        "tokens_output": monthly.tokens_output,
+                    },
+                    "api_key_source": source.api_key_source,
+                }
+                for (source_key, source), monthly, total_cost, month_cost in zip(
+                    sources, monthlies, total_costs, month_costs
+                )
+            ],
         }
-
-        for source_key, source in self._sources.items():
-            monthly = source.monthly.get(month_key, MonthlyCost())
-            report["sources"].append({
-                "source_key": source_key,
-                "server_name": source.server_name,
-                "total_cost_usd": round(source.total_cost_usd, 4),
-                "summary_count": source.summary_count,
-                "current_month": {
-                    "cost_usd": round(monthly.cost_usd, 4),
-                    "summaries": monthly.summaries,
-                    "tokens_input": monthly.tokens_input,
-                    "tokens_output": monthly.tokens_output,
-                },
-                "api_key_source": source.api_key_source,
-            })
-
-        return report
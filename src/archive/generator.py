@@ -11,13 +11,16 @@ Phase 5: Retrospective Generation
 """
 
 import asyncio
+import calendar
 import logging
+import time
 import uuid
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, time as dt_time, timedelta, timezone as dt_timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable, AsyncIterator, TYPE_CHECKING
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Set, Tuple, Callable, TYPE_CHECKING
 
 from src.utils.time import utc_now_naive
 from src.logging.error_tracker import get_error_tracker
@@ -31,11 +34,12 @@ from .models import (
     GenerationInfo,
     SummaryStatus,
     CostEntry,
+    _SLOTS,
 )
 from .sources import SourceRegistry
 from .cost_tracker import CostTracker, PricingTable
 from .locking import LockManager
-from .writer import SummaryWriter, summary_exists, summary_exists_in_db
+from .writer import SummaryWriter, summary_exists, existing_summary_dates_in_db
 from .api_keys import ApiKeyResolver
 
 # ADR-008: Import for database storage
@@ -44,6 +48,91 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Workers per running job. Generation slots (max_concurrent) limit how many of
+# them generate at once; this bounds how far max_concurrent can be raised mid-job.
+_PERIOD_WORKERS = 8
+
+# Cost entries queued per job before one bulk ledger write
+_COST_FLUSH_EVERY = 32
+
+_ONE_DAY = timedelta(days=1)
+_DAY_END = dt_time(23, 59, 59)
+# Default lookback per granularity; anything else looks back 30 days
+_LOOKBACK_HOURS = {"daily": 24, "weekly": 168}
+
+
+# Batches at least this large count words with numpy instead of str.split
+_VECTOR_WORD_COUNT_MIN = 1000
+# ASCII characters str.split() treats as whitespace
+_ASCII_WHITESPACE = (9, 10, 11, 12, 13, 28, 29, 30, 31, 32)
+
+
+def _count_words(contents: List[str]) -> int:
+    """Count words exactly as sum(len(c.split())) would, without a list per message.
+
+    ASCII text is scanned as bytes with numpy, counting each non-whitespace
+    byte that follows whitespace. Anything else falls back to one split of
+    the joined text, since str.split() also breaks on Unicode whitespace.
+    """
+    # Joined with a newline so words never run together across messages
+    blob = "\n".join(contents)
+    if not blob.isascii():
+        return len(blob.split())
+
+    import numpy as np
+
+    whitespace = np.zeros(256, dtype=bool)
+    whitespace[list(_ASCII_WHITESPACE)] = True
+    is_space = whitespace[np.frombuffer(blob.encode("ascii"), dtype=np.uint8)]
+    word_starts = ~is_space
+    word_starts[1:] &= is_space[:-1]
+    return int(np.count_nonzero(word_starts))
+
+
+def _summary_statistics(messages: List[Dict[str, Any]]) -> SummaryStatistics:
+    """Count messages, distinct authors and words in one pass over the messages."""
+    authors = set()
+    if len(messages) >= _VECTOR_WORD_COUNT_MIN:
+        contents = []
+        for message in messages:
+            authors.add(message.get("author_id"))
+            content = message.get("content")
+            if content:
+                contents.append(content)
+        word_count = _count_words(contents)
+    else:
+        word_count = 0
+        for message in messages:
+            authors.add(message.get("author_id"))
+            content = message.get("content")
+            if content:
+                word_count += len(content.split())
+    return SummaryStatistics(
+        message_count=len(messages),
+        participant_count=len(authors),
+        word_count=word_count,
+    )
+
+
+async def _collect_messages(
+    stream: AsyncIterator[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], SummaryStatistics]:
+    """Drain a streaming message fetcher, counting statistics as messages arrive."""
+    messages = []
+    authors = set()
+    word_count = 0
+    async for message in stream:
+        messages.append(message)
+        authors.add(message.get("author_id"))
+        content = message.get("content")
+        if content:
+            word_count += len(content.split())
+    return messages, SummaryStatistics(
+        message_count=len(messages),
+        participant_count=len(authors),
+        word_count=word_count,
+    )
+
 
 class JobStatus(Enum):
     """Status of a generation job."""
@@ -56,7 +145,7 @@ class JobStatus(Enum):
     PAUSED = "paused"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GenerationProgress:
     """Progress information for a generation job."""
     total_periods: int
@@ -78,7 +167,7 @@ class GenerationProgress:
         return (self.completed + self.failed + self.skipped) / self.total_periods * 100
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CostProgress:
     """Cost progress for a generation job."""
     cost_usd: float = 0.0
@@ -86,6 +175,8 @@ class CostProgress:
     tokens_output: int = 0
     max_cost_usd: Optional[float] = None
     budget_remaining_usd: Optional[float] = None
+    # Estimated cost of generations in flight, held against the budget until they finish
+    reserved_usd: float = 0.0
 
     @property
     def percent_of_max(self) -> Optional[float]:
@@ -94,7 +185,7 @@ class CostProgress:
         return self.cost_usd / self.max_cost_usd * 100
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GenerationJob:
     """A retrospective generation job."""
     job_id: str
@@ -137,12 +228,35 @@ class GenerationJob:
 
     # Results
     summary_ids: List[str] = field(default_factory=list)  # IDs of created summaries
+    # (period_start, period_end) tuples, computed once by create_job
+    periods: List[tuple] = field(default_factory=list, repr=False)
+
+    # source_key -> resolved API key, reused by every period of one run
+    _resolved_keys: Dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # source_key -> summaries directory, so meta paths skip the folder-name regexes
+    _summary_dirs: Dict[str, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # source_key -> dates already summarized in the database, scanned once per run
+    _existing_dates: Dict[str, Set[date]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Fields that do not change after creation, serialized on the first to_dict call
+    _static_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
-        start_date, end_date = self.date_range
-        return {
-            "job_id": self.job_id,
-            "source_key": self.source.source_key,
+        # progress_callback serializes the job after every period; only the
+        # status, progress and cost parts are rebuilt each time
+        if self._static_dict is None:
+            self._static_dict = self._build_static_dict()
+        static = self._static_dict
+        # dict | dict merges in C; date_range is copied so callers cannot edit the cache
+        return static | {
+            "date_range": dict(static["date_range"]),
             "status": self.status.value,
             "progress": {
                 "total": self.progress.total_periods,
@@ -164,6 +278,23 @@ class GenerationJob:
                 "max_cost_usd": self.cost.max_cost_usd,
                 "percent_of_max": self.cost.percent_of_max,
             },
+            # Timestamps
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "pause_reason": self.pause_reason,
+            "error": self.error,
+            # Results
+            "summary_ids": self.summary_ids,
+            # ADR-111: Confluence auto-publish tracking
+            "confluence_published": self.confluence_published,
+            "confluence_errors": self.confluence_errors,
+        }
+
+    def _build_static_dict(self) -> Dict[str, Any]:
+        start_date, end_date = self.date_range
+        return {
+            "job_id": self.job_id,
+            "source_key": self.source.source_key,
             # Job criteria for display
             "date_range": {
                 "start": start_date.isoformat() if hasattr(start_date, 'isoformat') else str(start_date),
@@ -177,17 +308,7 @@ class GenerationJob:
             "skip_existing": self.skip_existing,
             "force_regenerate": self.force_regenerate,
             "creation_source": self.creation_source,
-            # Timestamps
             "created_at": self.created_at.isoformat(),
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "pause_reason": self.pause_reason,
-            "error": self.error,
-            # Results
-            "summary_ids": self.summary_ids,
-            # ADR-111: Confluence auto-publish tracking
-            "confluence_published": self.confluence_published,
-            "confluence_errors": self.confluence_errors,
         }
 
 
@@ -237,7 +358,46 @@ class RetrospectiveGenerator:
         self.summary_job_repository = summary_job_repository  # ADR-013
 
         self._jobs: Dict[str, GenerationJob] = {}
-        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._cost_batch: Dict[str, List[CostEntry]] = {}
+        self._running_jobs: Set[str] = set()
+        # Periods being generated right now, so overlapping jobs share the work
+        self._period_futures: Dict[tuple, asyncio.Future] = {}
+        # ADR-013: jobs known to have a row, so progress writes skip the lookup
+        self._persisted_jobs: Set[str] = set()
+        # Admission control for generations; a counter rather than a Semaphore
+        # so max_concurrent can be changed while jobs run
+        self._inflight = 0
+        self._slot_available = asyncio.Condition()
+
+    async def set_max_concurrent(self, max_concurrent: int) -> None:
+        """
+        Change how many generations may run at once.
+
+        Takes effect immediately: raising the limit admits waiting periods,
+        lowering it lets in-flight generations finish before new ones start.
+
+        Args:
+            max_concurrent: New concurrency limit (at least 1)
+        """
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+        async with self._slot_available:
+            self.max_concurrent = max_concurrent
+            self._slot_available.notify_all()
+        logger.info(f"Retrospective generation concurrency set to {max_concurrent}")
+
+    @asynccontextmanager
+    async def _generation_slot(self):
+        """Hold one of the max_concurrent generation slots."""
+        async with self._slot_available:
+            await self._slot_available.wait_for(lambda: self._inflight < self.max_concurrent)
+            self._inflight += 1
+        try:
+            yield
+        finally:
+            async with self._slot_available:
+                self._inflight -= 1
+                self._slot_available.notify(1)
 
     async def create_job(
         self,
@@ -293,7 +453,7 @@ class RetrospectiveGenerator:
             f"Creating job {job_id}: start_date={start_date} (type={type(start_date).__name__}), "
             f"end_date={end_date} (type={type(end_date).__name__}), granularity={granularity}"
         )
-        periods = list(self._generate_periods(start_date, end_date, granularity, schedule_days))
+        periods = self._generate_periods(start_date, end_date, granularity, schedule_days)
         logger.info(f"Job {job_id}: calculated {len(periods)} periods")
 
         job = GenerationJob(
@@ -303,6 +463,7 @@ class RetrospectiveGenerator:
             granularity=granularity,
             timezone=timezone,
             progress=GenerationProgress(total_periods=len(periods)),
+            periods=periods,
             skip_existing=skip_existing,
             regenerate_outdated=regenerate_outdated,
             regenerate_failed=regenerate_failed,
@@ -410,14 +571,28 @@ class RetrospectiveGenerator:
                 timezone=job.timezone,
                 auto_publish_confluence=job.auto_publish_confluence,
                 creation_source=job.creation_source,
+                # Parameters without their own column, needed to resume the job
+                metadata={
+                    "source_type": job.source.source_type.value,
+                    "timezone": job.timezone,
+                    "max_cost_usd": job.max_cost_usd,
+                    "schedule_days": job.schedule_days,
+                    "per_channel": job.per_channel,
+                    "min_channel_messages": job.min_channel_messages,
+                    "lookback_hours": job.lookback_hours,
+                    "auto_publish_confluence": job.auto_publish_confluence,
+                },
             )
 
-            # Check if job exists
-            existing = await self.summary_job_repository.get(job.job_id)
-            if existing:
-                await self.summary_job_repository.update(db_job)
-            else:
-                await self.summary_job_repository.save(db_job)
+            # Progress updates only touch status/progress columns, so the
+            # existence check is needed once per job rather than per write
+            if job.job_id not in self._persisted_jobs:
+                if await self.summary_job_repository.get(job.job_id) is None:
+                    await self.summary_job_repository.save(db_job)
+                    self._persisted_jobs.add(job.job_id)
+                    return
+                self._persisted_jobs.add(job.job_id)
+            await self.summary_job_repository.update(db_job)
 
         except Exception as e:
             logger.warning(f"Failed to persist job {job.job_id} to database: {e}")
@@ -433,7 +608,8 @@ class RetrospectiveGenerator:
 
         Args:
             job_id: Job ID to run
-            message_fetcher: Async callable to fetch messages for a period
+            message_fetcher: Async callable to fetch messages for a period, or a
+                callable returning an async iterator of messages
             progress_callback: Optional callback for progress updates
 
         Returns:
@@ -443,13 +619,27 @@ class RetrospectiveGenerator:
         if not job:
             raise ValueError(f"Job not found: {job_id}")
 
+        # A second run of the same job would double-spend its budget
+        if job_id in self._running_jobs:
+            logger.warning(f"Job {job_id} is already running; ignoring duplicate run")
+            return job
+        self._running_jobs.add(job_id)
+
         job.status = JobStatus.RUNNING
         job.started_at = utc_now_naive()
-        await self._persist_job(job)  # ADR-013
+        # Resolve keys afresh on resume, in case the source's key was changed
+        job._resolved_keys.clear()
+        job._existing_dates.clear()
+        job._summary_dirs.clear()
 
         try:
-            start_date, end_date = job.date_range
-            periods = list(self._generate_periods(start_date, end_date, job.granularity, job.schedule_days))
+            await self._persist_job(job)  # ADR-013
+
+            if not job.periods:
+                # Jobs restored from the database are rebuilt without their periods
+                start_date, end_date = job.date_range
+                job.periods = self._generate_periods(start_date, end_date, job.granularity, job.schedule_days)
+            periods = job.periods
 
             logger.info(f"Job {job_id}: per_channel={job.per_channel}, granularity={job.granularity}, periods={len(periods)}")
 
@@ -461,69 +651,64 @@ class RetrospectiveGenerator:
                 logger.info(f"Per-channel mode: {len(channels)} channels × {len(periods)} periods = {job.progress.total_periods} total")
             else:
                 channels = [None]  # Single iteration for guild-wide mode
-
-            for period_start, period_end in periods:
-                # Check for cancellation/pause
-                if job.status == JobStatus.CANCELLED:
-                    break
-                if job.status == JobStatus.PAUSED:
-                    break
-
-                # Check cost limit
-                if job.max_cost_usd and job.cost.cost_usd >= job.max_cost_usd:
-                    job.status = JobStatus.PAUSED
-                    job.pause_reason = "budget_exceeded"
-                    logger.warning(f"Job {job_id} paused: budget exceeded")
-                    break
-
-                # ADR-096: Iterate over channels (or single None for guild-wide)
-                for channel_info in channels:
-                    if job.status in (JobStatus.CANCELLED, JobStatus.PAUSED):
-                        break
-
-                    # Create period-specific source for per-channel mode
-                    if channel_info:
-                        channel_id, channel_name = channel_info
-                        period_source = ArchiveSource(
-                            source_type=job.source.source_type,
-                            server_id=job.source.server_id,
-                            server_name=job.source.server_name,
-                            channel_id=channel_id,
-                            channel_name=channel_name,
-                        )
-                        job.progress.current_period = f"{period_start.isoformat()} #{channel_name}"
-                    else:
-                        period_source = job.source
-                        job.progress.current_period = period_start.isoformat()
-
-                    try:
-                        result = await self._generate_period(
-                            job=job,
-                            period_start=period_start,
-                            period_end=period_end,
-                            message_fetcher=message_fetcher,
-                            source_override=period_source if channel_info else None,
-                        )
-
-                        if result == "completed":
-                            job.progress.completed += 1
-                        elif result.startswith("skipped"):
-                            job.progress.skipped += 1
-                            # ADR-112: Track skip reason
-                            if result == "skipped_exists":
-                                job.progress.skipped_exists += 1
-                            elif result == "skipped_locked":
-                                job.progress.skipped_locked += 1
-                            elif result == "skipped_no_messages":
-                                job.progress.skipped_no_messages += 1
-                            elif result == "skipped_budget":
-                                job.progress.skipped_budget += 1
-                        elif result == "failed":
-                            job.progress.failed += 1
-
-                    except Exception as e:
-                        logger.error(f"Error generating {period_start} {channel_info}: {e}")
-                        job.progress.failed += 1
+                if job.skip_existing and not job.force_regenerate:
+                    # Scan before the workers start so they do not all query at once
+                    await self._existing_dates(job, job.source)
+
+            async def run_period(period_start, period_end, channel_info) -> Optional[str]:
+                # Create period-specific source for per-channel mode
+                if channel_info:
+                    channel_id, channel_name = channel_info
+                    period_source = ArchiveSource(
+                        source_type=job.source.source_type,
+                        server_id=job.source.server_id,
+                        server_name=job.source.server_name,
+                        channel_id=channel_id,
+                        channel_name=channel_name,
+                    )
+                    current_period = f"{period_start.isoformat()} #{channel_name}"
+                else:
+                    period_source = job.source
+                    current_period = period_start.isoformat()
+
+                async def generate() -> Optional[str]:
+                    async with self._generation_slot():
+                        # Re-check once a slot frees up; the job may have stopped while we waited
+                        if job.status != JobStatus.RUNNING:
+                            return None
+
+                        # Check cost limit
+                        if job.max_cost_usd and job.cost.cost_usd >= job.max_cost_usd:
+                            job.status = JobStatus.PAUSED
+                            job.pause_reason = "budget_exceeded"
+                            logger.warning(f"Job {job_id} paused: budget exceeded")
+                            return None
+
+                        job.progress.current_period = current_period
+                        try:
+                            return await self._generate_period_once(
+                                job=job,
+                                period_start=period_start,
+                                period_end=period_end,
+                                message_fetcher=message_fetcher,
+                                source_override=period_source if channel_info else None,
+                            )
+                        except Exception as e:
+                            logger.error(f"Error generating {period_start} {channel_info}: {e}")
+                            return "failed"
+
+                # Waiting on an overlapping job happens before taking a slot
+                return await self._generate_period(job, period_start, period_source, generate)
+
+            async def worker() -> None:
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    result = await run_period(*item)
+                    if result is None:
+                        continue  # Not run: job paused or cancelled before its turn
+                    self._count_result(job, result)
 
                     # Progress callback
                     if progress_callback:
@@ -533,6 +718,30 @@ class RetrospectiveGenerator:
                     if (job.progress.completed + job.progress.skipped + job.progress.failed) % 5 == 0:
                         await self._persist_job(job)
 
+            async def produce() -> None:
+                # ADR-096: one item per channel in per-channel mode (or a single None for guild-wide)
+                for period_start, period_end in periods:
+                    for channel_info in channels:
+                        if job.status != JobStatus.RUNNING:
+                            break
+                        await queue.put((period_start, period_end, channel_info))
+                for _ in workers:
+                    await queue.put(None)
+
+            # A fixed pool of workers pulls periods from a bounded queue, so long
+            # ranges do not create a task per period. Generation slots still cap
+            # how many of them call the LLM at once.
+            worker_count = min(len(periods) * len(channels), max(self.max_concurrent, _PERIOD_WORKERS))
+            queue: asyncio.Queue = asyncio.Queue(maxsize=max(worker_count, 1) * 2)
+            workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
+            tasks = [asyncio.create_task(produce()), *workers]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                # Only leaves tasks running if a worker raised
+                for task in tasks:
+                    task.cancel()
+
             # Mark complete if not paused/cancelled
             if job.status == JobStatus.RUNNING:
                 job.status = JobStatus.COMPLETED
@@ -559,8 +768,58 @@ class RetrospectiveGenerator:
             logger.error(f"Job {job_id} failed: {e}")
             await self._persist_job(job)  # ADR-013
 
+        finally:
+            self._flush_costs(job_id)
+            self._running_jobs.discard(job_id)
+
         return job
 
+    def _flush_costs(self, job_id: str) -> None:
+        """Write a job's queued cost entries to the ledger."""
+        entries = self._cost_batch.pop(job_id, None)
+        if entries:
+            self.cost_tracker.record_costs_bulk(entries)
+
+    async def _resolve_key(self, job: GenerationJob, source: ArchiveSource) -> Any:
+        """Resolve the API key for a source once per job run."""
+        resolved_key = job._resolved_keys.get(source.source_key)
+        if resolved_key is None:
+            manifest = self.source_registry.get_manifest(source.source_key)
+            resolved_key = await self.api_key_resolver.get_key_for_source(
+                source.source_key,
+                manifest.to_dict() if manifest else None,
+            )
+            job._resolved_keys[source.source_key] = resolved_key
+        return resolved_key
+
+    async def _existing_dates(self, job: GenerationJob, source: ArchiveSource) -> Set[date]:
+        """ADR-019: Dates with a stored summary for a source, queried once per job run."""
+        existing = job._existing_dates.get(source.source_key)
+        if existing is None:
+            start_date, end_date = job.date_range
+            existing = await existing_summary_dates_in_db(source, start_date, end_date)
+            job._existing_dates[source.source_key] = existing
+        return existing
+
+    @staticmethod
+    def _count_result(job: GenerationJob, result: str) -> None:
+        """Add one period's outcome to the job's progress counters."""
+        if result == "completed":
+            job.progress.completed += 1
+        elif result.startswith("skipped"):
+            job.progress.skipped += 1
+            # ADR-112: Track skip reason
+            if result == "skipped_exists":
+                job.progress.skipped_exists += 1
+            elif result == "skipped_locked":
+                job.progress.skipped_locked += 1
+            elif result == "skipped_no_messages":
+                job.progress.skipped_no_messages += 1
+            elif result == "skipped_budget":
+                job.progress.skipped_budget += 1
+        elif result == "failed":
+            job.progress.failed += 1
+
     async def _get_channels_for_job(
         self,
         job: GenerationJob,
@@ -677,6 +936,50 @@ class RetrospectiveGenerator:
             logger.warning(f"Sync failed for {job.source.source_key}: {e}")
 
     async def _generate_period(
+        self,
+        job: GenerationJob,
+        period_start: date,
+        source: ArchiveSource,
+        generate: Callable[[], Awaitable[Optional[str]]],
+    ) -> Optional[str]:
+        """Run generate() for one period, sharing work with overlapping jobs.
+
+        When another job is already generating the same summary (same source,
+        period, summary options and fetch window), wait for it instead of
+        calling the LLM again. A summary the other job produced, or found
+        already stored, counts as existing for the waiting job. For any other
+        outcome the waiting job generates the period itself.
+        """
+        if job.dry_run:
+            return await generate()
+
+        key = (
+            source.source_key,
+            job.granularity,
+            period_start,
+            job.summary_type,
+            job.perspective,
+            job.force_regenerate,
+            job.lookback_hours,
+        )
+        while (pending := self._period_futures.get(key)) is not None:
+            # Shield so cancelling this job does not cancel the other job's period
+            result = await asyncio.shield(pending)
+            if result in ("completed", "skipped_exists"):
+                logger.info(f"Period {period_start}: shared result '{result}' from an overlapping job")
+                return "skipped_exists"
+
+        future = asyncio.get_running_loop().create_future()
+        self._period_futures[key] = future
+        result = None
+        try:
+            result = await generate()
+            return result
+        finally:
+            del self._period_futures[key]
+            future.set_result(result)
+
+    async def _generate_period_once(
         self,
         job: GenerationJob,
         period_start: date,
@@ -706,8 +1009,8 @@ class RetrospectiveGenerator:
             force_lock_acquire = True  # After deletion, force lock acquisition
         # ADR-019: Check database for existing summary (not disk)
         elif job.skip_existing:
-            exists = await summary_exists_in_db(source, period_start)
-            if exists:
+            existing = await self._existing_dates(job, source)
+            if period_start in existing:
                 logger.info(f"Period {period_start}: SKIPPING - summary already exists for {source.source_key}")
                 return "skipped_exists"
             else:
@@ -717,23 +1020,14 @@ class RetrospectiveGenerator:
                 force_lock_acquire = True
 
         # Create period info with UTC timezone-aware datetimes
-        from datetime import timezone as tz
-
         # Determine lookback hours:
         # 1. Use job.lookback_hours if explicitly set
         # 2. Default based on granularity: 24h for daily, 168h for weekly, 720h for monthly
-        if job.lookback_hours:
-            duration_hours = job.lookback_hours
-        elif job.granularity == "daily":
-            duration_hours = 24
-        elif job.granularity == "weekly":
-            duration_hours = 168
-        else:
-            duration_hours = 720
+        duration_hours = job.lookback_hours or _LOOKBACK_HOURS.get(job.granularity, 720)
 
         # Calculate actual time range for message fetching
         # End time is end of period_end day
-        end_time = datetime.combine(period_end, datetime.max.time().replace(microsecond=0), tzinfo=tz.utc)
+        end_time = datetime.combine(period_end, _DAY_END, tzinfo=dt_timezone.utc)
         # Start time: look back duration_hours from end_time
         # This is critical for weekly summaries where period_start == period_end
         start_time = end_time - timedelta(hours=duration_hours)
@@ -748,7 +1042,7 @@ class RetrospectiveGenerator:
         )
 
         # Acquire lock
-        meta_path = self._get_meta_path(source, period_start)
+        meta_path = self._get_meta_path(job, source, period_start)
         logger.info(f"Period {period_start}: attempting lock at {meta_path} (force={force_lock_acquire})")
         lock_job_id = await self.lock_manager.acquire_lock(meta_path, job.job_id, force_acquire=force_lock_acquire)
         if not lock_job_id:
@@ -765,12 +1059,18 @@ class RetrospectiveGenerator:
                 job.cost.cost_usd += estimate.estimated_cost_usd
                 return "completed"
 
-            # Fetch messages
-            messages = await message_fetcher(
+            # Fetch messages. Fetchers may return a list or stream an async
+            # iterator, in which case statistics are counted while it drains.
+            statistics = None
+            fetched = message_fetcher(
                 source,
                 period.start,
                 period.end,
             )
+            if hasattr(fetched, "__aiter__"):
+                messages, statistics = await _collect_messages(fetched)
+            else:
+                messages = await fetched
 
             # ADR-096: Skip channels with too few messages in per-channel mode
             if not messages or (source_override and len(messages) < job.min_channel_messages):
@@ -789,14 +1089,11 @@ class RetrospectiveGenerator:
                 return "completed"
 
             # Get API key for this source
-            manifest = self.source_registry.get_manifest(source.source_key)
-            resolved_key = await self.api_key_resolver.get_key_for_source(
-                source.source_key,
-                manifest.to_dict() if manifest else None,
-            )
+            resolved_key = await self._resolve_key(job, source)
 
             # Pre-emptive budget check: estimate cost BEFORE making API call
             # This prevents exceeding budget by checking if estimated cost fits
+            estimated_cost = 0.0
             if job.max_cost_usd:
                 # Estimate cost based on message count (avg ~10 tokens per message)
                 estimated_tokens = len(messages) * 10 + 500  # +500 for prompt overhead
@@ -805,7 +1102,7 @@ class RetrospectiveGenerator:
                     tokens_input=estimated_tokens,
                     tokens_output=int(estimated_tokens * 0.2),
                 )
-                remaining_budget = job.max_cost_usd - job.cost.cost_usd
+                remaining_budget = job.max_cost_usd - job.cost.cost_usd - job.cost.reserved_usd
                 if estimated_cost > remaining_budget:
                     logger.warning(
                         f"Budget enforcement: estimated ${estimated_cost:.4f} > remaining ${remaining_budget:.4f}. "
@@ -818,15 +1115,21 @@ class RetrospectiveGenerator:
 
             # Generate summary
             # ADR-014: Pass guild_id for jump link generation in references
-            start_time = utc_now_naive()
-            summary_result = await self.summarization_service.generate_summary(
-                messages=messages,
-                api_key=resolved_key.key,
-                summary_type=job.summary_type,
-                perspective=job.perspective,
-                guild_id=source.server_id or "",
-            )
-            duration = (utc_now_naive() - start_time).total_seconds()
+            # Periods run concurrently, so hold the estimate against the budget until
+            # the real cost is known. Check and reserve happen without an await between.
+            job.cost.reserved_usd += estimated_cost
+            try:
+                started = time.perf_counter()
+                summary_result = await self.summarization_service.generate_summary(
+                    messages=messages,
+                    api_key=resolved_key.key,
+                    summary_type=job.summary_type,
+                    perspective=job.perspective,
+                    guild_id=source.server_id or "",
+                )
+                duration = time.perf_counter() - started
+            finally:
+                job.cost.reserved_usd -= estimated_cost
 
             # Calculate cost
             cost, pricing_version = self.cost_tracker.pricing.calculate_cost(
@@ -847,7 +1150,10 @@ class RetrospectiveGenerator:
                 pricing_version=pricing_version,
                 api_key_source=resolved_key.source,
             )
-            self.cost_tracker.record_cost(cost_entry)
+            batch = self._cost_batch.setdefault(job.job_id, [])
+            batch.append(cost_entry)
+            if len(batch) >= _COST_FLUSH_EVERY:
+                self._flush_costs(job.job_id)
 
             # Update job cost
             job.cost.cost_usd += cost
@@ -855,11 +1161,8 @@ class RetrospectiveGenerator:
             job.cost.tokens_output += summary_result.tokens_output
 
             # Write summary
-            statistics = SummaryStatistics(
-                message_count=len(messages),
-                participant_count=len(set(m.get("author_id") for m in messages)),
-                word_count=sum(len(m.get("content", "").split()) for m in messages),
-            )
+            if statistics is None:
+                statistics = _summary_statistics(messages)
 
             generation = GenerationInfo(
                 prompt_version=summary_result.prompt_version,
@@ -905,6 +1208,9 @@ class RetrospectiveGenerator:
 
             # Track created summary ID for job reporting
             job.summary_ids.append(summary_id)
+            known_dates = job._existing_dates.get(source.source_key)
+            if known_dates is not None:
+                known_dates.add(period_start)
 
             await self.lock_manager.release_lock(meta_path, SummaryStatus.COMPLETE)
             return "completed"
@@ -1171,7 +1477,7 @@ class RetrospectiveGenerator:
         end_date: date,
         granularity: str,
         schedule_days: Optional[List[int]] = None,
-    ) -> AsyncIterator[tuple]:
+    ) -> List[tuple]:
         """Generate period tuples for the date range.
 
         Args:
@@ -1180,49 +1486,66 @@ class RetrospectiveGenerator:
             granularity: "daily", "weekly", or "monthly"
             schedule_days: For weekly granularity - which days to generate (0=Sun, 6=Sat in JS format)
         """
+        # Pick the stepping once rather than comparing strings for every period
+        period_builders = {
+            "daily": self._daily_periods,
+            "weekly": self._weekly_periods,
+            "monthly": self._monthly_periods,
+        }
+        builder = period_builders.get(granularity)
+        if builder is None:
+            raise ValueError(f"Unknown granularity: {granularity}")
+        return builder(start_date, end_date, schedule_days)
+
+    @staticmethod
+    def _daily_periods(start_date: date, end_date: date, schedule_days: Optional[List[int]]) -> List[tuple]:
+        days = (start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1))
+        return [(day, day) for day in days]
+
+    @staticmethod
+    def _weekly_periods(start_date: date, end_date: date, schedule_days: Optional[List[int]]) -> List[tuple]:
+        # If schedule_days is specified, yield each matching day in range
+        # schedule_days uses 0=Sun, 6=Sat format (JavaScript style)
+        if schedule_days:
+            # Convert to Python weekday format
+            # Python: 0=Mon, 1=Tue, 2=Wed, 3=Thu, 4=Fri, 5=Sat, 6=Sun
+            # JS: 0=Sun, 1=Mon, 2=Tue, 3=Wed, 4=Thu, 5=Fri, 6=Sat
+            weekdays = {(js_day - 1) % 7 for js_day in schedule_days}
+            days = (start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1))
+            return [(day, day) for day in days if day.weekday() in weekdays]
+
+        # Original behavior: Monday to Sunday periods
+        periods = []
         current = start_date
-
         while current <= end_date:
-            if granularity == "daily":
-                period_end = current
-                yield (current, period_end)
-                current += timedelta(days=1)
-
-            elif granularity == "weekly":
-                # If schedule_days is specified, yield each matching day in range
-                # schedule_days uses 0=Sun, 6=Sat format (JavaScript style)
-                if schedule_days:
-                    # Convert Python weekday to JS weekday format
-                    # Python: 0=Mon, 1=Tue, 2=Wed, 3=Thu, 4=Fri, 5=Sat, 6=Sun
-                    # JS: 0=Sun, 1=Mon, 2=Tue, 3=Wed, 4=Thu, 5=Fri, 6=Sat
-                    js_weekday = (current.weekday() + 1) % 7
-                    if js_weekday in schedule_days:
-                        yield (current, current)
-                    current += timedelta(days=1)
-                else:
-                    # Original behavior: Monday to Sunday periods
-                    days_until_sunday = 6 - current.weekday()
-                    period_end = min(current + timedelta(days=days_until_sunday), end_date)
-                    yield (current, period_end)
-                    current = period_end + timedelta(days=1)
-
-            elif granularity == "monthly":
-                # End of month
-                if current.month == 12:
-                    next_month = date(current.year + 1, 1, 1)
-                else:
-                    next_month = date(current.year, current.month + 1, 1)
-                period_end = min(next_month - timedelta(days=1), end_date)
-                yield (current, period_end)
-                current = next_month
-
-            else:
-                raise ValueError(f"Unknown granularity: {granularity}")
-
-    def _get_meta_path(self, source: ArchiveSource, target_date: date) -> Path:
+            days_until_sunday = 6 - current.weekday()
+            period_end = min(current + timedelta(days=days_until_sunday), end_date)
+            periods.append((current, period_end))
+            current = period_end + _ONE_DAY
+        return periods
+
+    @staticmethod
+    def _monthly_periods(start_date: date, end_date: date, schedule_days: Optional[List[int]]) -> List[tuple]:
+        periods = []
+        current = start_date
+        while current <= end_date:
+            # End of month
+            days_in_month = calendar.monthrange(current.year, current.month)[1]
+            period_end = min(current.replace(day=days_in_month), end_date)
+            periods.append((current, period_end))
+            current = period_end + _ONE_DAY
+        return periods
+
+    def _get_meta_path(self, job: GenerationJob, source: ArchiveSource, target_date: date) -> Path:
         """Get metadata path for a date."""
-        summary_dir = source.get_archive_path(self.archive_root)
-        return summary_dir / str(target_date.year) / f"{target_date.month:02d}" / f"{target_date.isoformat()}_daily.meta.json"
+        summary_dir = job._summary_dirs.get(source.source_key)
+        if summary_dir is None:
+            summary_dir = str(source.get_archive_path(self.archive_root))
+            job._summary_dirs[source.source_key] = summary_dir
+        return Path(
+            f"{summary_dir}/{target_date.year}/{target_date.month:02d}/"
+            f"{target_date.isoformat()}_daily.meta.json"
+        )
 
     async def _delete_existing(self, source: ArchiveSource, target_date: date) -> None:
         """
@@ -1294,9 +1617,11 @@ class RetrospectiveGenerator:
                 logger.warning(f"Cannot restore non-retrospective job: {db_job.job_type}")
                 return None
 
+            metadata = db_job.metadata or {}
+
             # Reconstruct ArchiveSource
             source = ArchiveSource(
-                source_type=SourceType.DISCORD,  # TODO: support other types
+                source_type=SourceType(metadata.get("source_type", SourceType.DISCORD.value)),
                 server_id=db_job.guild_id,
                 server_name=db_job.server_name or db_job.guild_id,
                 channel_id=db_job.channel_ids[0] if db_job.channel_ids else None,
@@ -1308,7 +1633,7 @@ class RetrospectiveGenerator:
                 source=source,
                 date_range=(db_job.date_range_start, db_job.date_range_end),
                 granularity=db_job.granularity or "daily",
-                timezone=db_job.metadata.get("timezone", "UTC") if db_job.metadata else "UTC",
+                timezone=metadata.get("timezone") or db_job.timezone or "UTC",
                 status=JobStatus.PAUSED,  # Keep as paused until explicitly resumed
                 progress=GenerationProgress(
                     total_periods=db_job.progress_total,
@@ -1318,16 +1643,28 @@ class RetrospectiveGenerator:
                     cost_usd=db_job.cost_usd,
                     tokens_input=db_job.tokens_input,
                     tokens_output=db_job.tokens_output,
+                    max_cost_usd=metadata.get("max_cost_usd"),
                 ),
                 summary_type=db_job.summary_type,
                 perspective=db_job.perspective,
                 force_regenerate=db_job.force_regenerate,
+                max_cost_usd=metadata.get("max_cost_usd"),
                 pause_reason=db_job.pause_reason,
                 summary_ids=db_job.summary_ids or [],
+                skip_existing=db_job.skip_existing,
+                schedule_days=metadata.get("schedule_days"),
+                per_channel=metadata.get("per_channel", db_job.per_channel),
+                min_channel_messages=metadata.get("min_channel_messages", db_job.min_channel_messages),
+                lookback_hours=metadata.get("lookback_hours", db_job.lookback_hours),
+                auto_publish_confluence=metadata.get(
+                    "auto_publish_confluence", db_job.auto_publish_confluence
+                ),
+                creation_source=db_job.creation_source,
             )
 
             # Add to in-memory jobs
             self._jobs[job_id] = job
+            self._persisted_jobs.add(job_id)
             logger.info(f"Restored job {job_id} from database (progress: {job.progress.completed}/{job.progress.total_periods})")
 
             return job
@@ -1380,6 +1717,10 @@ class RetrospectiveGenerator:
         job = self._jobs.get(job_id)
         if not job or job.status != JobStatus.PAUSED:
             return None
+        if job_id in self._running_jobs:
+            # Still finishing the periods that were in flight when it paused
+            logger.warning(f"Job {job_id} cannot resume until its previous run stops")
+            return None
 
         job.pause_reason = None
         return await self.run_job(job_id, message_fetcher, progress_callback)
@@ -9,6 +9,8 @@ Phase 6: WhatsApp Import
 ADR-028: PII Anonymization for phone numbers
 """
 
+import bisect
+import functools
 import json
 import logging
 import re
@@ -16,14 +18,95 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, date
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from src.services.anonymization import PhoneAnonymizer
 from src.services.anonymization.phone_anonymizer import create_guild_anonymizer
 from src.utils.time import utc_now_naive
 
+orjson: Any  # None when orjson is not installed
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Leading separator left between the timestamp and the sender
+_LEADING_SEPARATOR = re.compile(r'^[\s\-:]+')
+
+# Characters replaced with '-' in the group folder name
+_UNSAFE_NAME = re.compile(r'[^\w\-]')
+
+# Version of the *_messages.json layout written by _save_import. Files
+# without a version are the original list of message objects (version 1).
+_MESSAGES_FORMAT_VERSION = 2
+
+# Fields of a saved import, stored column by column (see _save_import)
+_MESSAGE_COLUMNS = ("message_id", "timestamp", "sender", "content", "is_system", "attachment", "reply_to")
+
+# Characters of a text export parsed at a time
+_READ_BLOCK_CHARS = 1 << 20
+# AM/PM suffix in either "PM" or "p.m." form
+_MERIDIEM = re.compile(r'\s*[ap]\.?m\.?', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_wa_datetime(date_str: str, time_str: str) -> datetime:
+    """Parse datetime from various WhatsApp formats.
+
+    Cached because consecutive messages share the same date and often the
+    same minute; datetimes are immutable, so the results can be shared.
+    """
+    # Normalize date separators
+    date_str = date_str.replace('.', '/').replace('-', '/')
+
+    # Parse date
+    parts = date_str.split('/')
+    if len(parts) == 3:
+        try:
+            # Check for YYYY/MM/DD format (year first - 4 digit first part)
+            if len(parts[0]) == 4:
+                year, month, day = int(parts[0]), int(parts[1]), int(parts[2])
+            # DD/MM/YYYY or MM/DD/YYYY format
+            elif len(parts[2]) == 4:
+                day, month, year = int(parts[0]), int(parts[1]), int(parts[2])
+            elif len(parts[2]) == 2:
+                day, month, year = int(parts[0]), int(parts[1]), 2000 + int(parts[2])
+            else:
+                raise ValueError("Unknown year format")
+
+            # Validate month (swap if needed for MM/DD/YYYY)
+            if month > 12:
+                day, month = month, day
+
+        except ValueError:
+            raise ValueError(f"Cannot parse date: {date_str}")
+
+    else:
+        raise ValueError(f"Cannot parse date: {date_str}")
+
+    # Parse time - handle both "AM/PM" and "a.m./p.m." formats
+    time_str = time_str.strip()
+    # Normalize a.m./p.m. to AM/PM
+    time_str_upper = time_str.upper().replace('.', '')
+    is_pm = 'PM' in time_str_upper
+    is_am = 'AM' in time_str_upper
+    # Remove AM/PM variants (with or without periods)
+    time_str = _MERIDIEM.sub('', time_str)
+
+    time_parts = time_str.split(':')
+    hour = int(time_parts[0])
+    minute = int(time_parts[1]) if len(time_parts) > 1 else 0
+    second = int(time_parts[2]) if len(time_parts) > 2 else 0
+
+    if is_pm and hour < 12:
+        hour += 12
+    elif is_am and hour == 12:
+        hour = 0
+
+    return datetime(year, month, day, hour, minute, second)
+
 
 @dataclass
 class WhatsAppMessage:
@@ -107,6 +190,7 @@ class WhatsAppImporter:
     # Format: [DD/MM/YYYY, HH:MM:SS] Sender: Message
     # or: DD/MM/YYYY, HH:MM - Sender: Message
     # or: YYYY-MM-DD, HH:MM a.m./p.m. - Sender: Message (Canadian/ISO format)
+    # Each pattern captures (date, time), tried in this order.
     DATETIME_PATTERNS = [
         # YYYY-MM-DD, HH:MM a.m./p.m. - (Canadian/ISO format with periods in am/pm)
         r'(\d{4}-\d{2}-\d{2}),\s*(\d{1,2}:\d{2}(?:\s*[ap]\.m\.)?)\s*-',
@@ -117,6 +201,13 @@ class WhatsAppImporter:
         # MM/DD/YY, HH:MM -
         r'(\d{1,2}/\d{1,2}/\d{2}),\s*(\d{1,2}:\d{2}(?:\s*[AP]M)?)\s*-',
     ]
+    # Start of a message: a line beginning with any of the above, as one
+    # alternation run over the whole export. Alternatives are tried in order,
+    # like the list; \s is narrowed so a timestamp never spans two lines.
+    MESSAGE_START = re.compile(
+        r"^[^\S\n]*(?:" + "|".join(f"(?:{p})" for p in DATETIME_PATTERNS).replace(r"\s", r"[^\S\n]") + ")",
+        re.MULTILINE,
+    )
 
     # System message patterns
     SYSTEM_PATTERNS = [
@@ -135,10 +226,13 @@ class WhatsAppImporter:
         r"Tap to learn more",
     ]
 
+    # Any of the above, checked in one search per message
+    SYSTEM_MESSAGE = re.compile("|".join(f"(?:{p})" for p in SYSTEM_PATTERNS), re.IGNORECASE)
+
     # ADR-112: Patterns to detect join events (for coverage gap awareness)
     # Note: "created group" is NOT a join event for the exporting user
     # unless THEY created it. We detect it for context but don't use for join_date.
-    JOIN_EVENT_PATTERNS = [
+    JOIN_EVENT_PATTERNS = [(re.compile(p, re.IGNORECASE), event_type) for p, event_type in (
         # Group creation - context only, not a join event
         (r"created group", "group_created"),
         # User was added by someone
@@ -151,7 +245,7 @@ class WhatsAppImporter:
         (r"You joined", "user_joined"),
         # User joined via QR code or other method (generic, must come last)
         (r"joined$", "user_joined"),
-    ]
+    )]
 
     def __init__(
         self,
@@ -205,7 +299,7 @@ class WhatsAppImporter:
 
             content = msg.content
             for pattern, event_type in self.JOIN_EVENT_PATTERNS:
-                if re.search(pattern, content, re.IGNORECASE):
+                if pattern.search(content):
                     event = DetectedEvent(
                         event_type=event_type,
                         timestamp=msg.timestamp,
@@ -242,59 +336,7 @@ class WhatsAppImporter:
         Returns:
             Tuple of (messages, errors)
         """
-        messages: List[WhatsAppMessage] = []
-        errors: List[str] = []
-
-        try:
-            content = file_path.read_text(encoding='utf-8')
-        except UnicodeDecodeError:
-            content = file_path.read_text(encoding='utf-8-sig')
-
-        lines = content.split('\n')
-        current_message = None
-        msg_counter = 0
-
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line:
-                continue
-
-            # Try to parse as new message
-            parsed = self._parse_message_line(line, msg_counter)
-
-            if parsed:
-                # Save previous message
-                if current_message:
-                    messages.append(current_message)
-
-                timestamp, sender, text = parsed
-                msg_counter += 1
-
-                # Check if system message
-                is_system = any(re.search(p, text, re.IGNORECASE) for p in self.SYSTEM_PATTERNS)
-
-                current_message = WhatsAppMessage(
-                    message_id=f"wa_{msg_counter}",
-                    timestamp=timestamp,
-                    sender=sender,
-                    content=text,
-                    is_system=is_system,
-                )
-
-            elif current_message:
-                # Continuation of previous message
-                current_message.content += f"\n{line}"
-
-            else:
-                # Orphan line at start
-                if line and not any(p in line.lower() for p in ["end-to-end encrypted"]):
-                    errors.append(f"Line {line_num}: Could not parse: {line[:50]}...")
-
-        # Don't forget last message
-        if current_message:
-            messages.append(current_message)
-
-        return messages, errors
+        return self._read_txt_export(file_path)
 
     async def import_txt_export(
         self,
@@ -314,70 +356,16 @@ class WhatsAppImporter:
             Import result with parsed messages
         """
         import_id = f"imp_{uuid.uuid4().hex[:12]}"
-        messages: List[WhatsAppMessage] = []
-        errors: List[str] = []
-        participants = set()
-
-        try:
-            content = file_path.read_text(encoding='utf-8')
-        except UnicodeDecodeError:
-            content = file_path.read_text(encoding='utf-8-sig')
-
-        lines = content.split('\n')
-        current_message = None
-        msg_counter = 0
-
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line:
-                continue
-
-            # Try to parse as new message
-            parsed = self._parse_message_line(line, msg_counter)
-
-            if parsed:
-                # Save previous message
-                if current_message:
-                    messages.append(current_message)
-
-                timestamp, sender, text = parsed
-                msg_counter += 1
-
-                # Check if system message
-                is_system = any(re.search(p, text, re.IGNORECASE) for p in self.SYSTEM_PATTERNS)
 
-                if not is_system:
-                    participants.add(sender)
-
-                current_message = WhatsAppMessage(
-                    message_id=f"wa_{msg_counter}",
-                    timestamp=timestamp,
-                    sender=sender,
-                    content=text,
-                    is_system=is_system,
-                )
-
-            elif current_message:
-                # Continuation of previous message
-                current_message.content += f"\n{line}"
-
-            else:
-                # Orphan line at start
-                if line and not any(p in line.lower() for p in ["end-to-end encrypted"]):
-                    errors.append(f"Line {line_num}: Could not parse: {line[:50]}...")
-
-        # Don't forget last message
-        if current_message:
-            messages.append(current_message)
+        messages, errors = self._read_txt_export(file_path)
 
         # ADR-028: Apply anonymization to phone numbers
         anonymization_metadata = None
         anonymizer = self._get_anonymizer(group_id)
         if anonymizer and messages:
             messages, anonymization_metadata = self._anonymize_messages(messages, anonymizer)
-            # Update participants set with anonymized names
-            participants = {m.sender for m in messages if not m.is_system}
             logger.info(f"Anonymized {anonymization_metadata.get('participant_count', 0)} phone-based participants")
+        participants = {m.sender for m in messages if not m.is_system}
 
         # Calculate date range
         if messages:
@@ -442,9 +430,10 @@ class WhatsAppImporter:
         messages: List[WhatsAppMessage] = []
         participants = set()
 
-        for msg_data in data.get("messages", []):
+        for index, msg_data in enumerate(data.get("messages", [])):
             msg = WhatsAppMessage(
-                message_id=msg_data.get("id", f"wa_{len(messages)}"),
+                # Default id only built for messages without one
+                message_id=msg_data["id"] if "id" in msg_data else "wa_" + str(index),
                 timestamp=datetime.fromisoformat(msg_data["timestamp"]),
                 sender=msg_data["sender"],
                 content=msg_data.get("content", ""),
@@ -565,94 +554,124 @@ class WhatsAppImporter:
 
         return anonymized, metadata
 
-    def _parse_message_line(
-        self,
-        line: str,
-        fallback_id: int,
-    ) -> Optional[Tuple[datetime, str, str]]:
+    def _read_txt_export(self, file_path: Path) -> Tuple[List[WhatsAppMessage], List[str]]:
         """
-        Parse a message line from WhatsApp export.
+        Read and parse a WhatsApp text export in fixed-size blocks.
+
+        The file is never held in memory as a whole: each block is parsed as
+        soon as it is read, carrying over only the last message, which may
+        continue in the next block.
 
         Returns:
-            Tuple of (timestamp, sender, content) or None if not a message start
+            Tuple of (messages, errors)
         """
-        for pattern in self.DATETIME_PATTERNS:
-            match = re.match(pattern, line)
-            if match:
-                date_str, time_str = match.groups()
-
-                # Parse datetime
-                try:
-                    timestamp = self._parse_datetime(date_str, time_str)
-                except ValueError:
-                    continue
-
-                # Get rest of line after datetime
-                rest = line[match.end():].strip()
-
-                # Remove leading dash or colon
-                rest = re.sub(r'^[\s\-:]+', '', rest)
+        messages: List[WhatsAppMessage] = []
+        errors: List[str] = []
+        tail = ""
+        line_num = 0
+        # utf-8-sig drops the byte order mark some exports start with
+        with file_path.open('r', encoding='utf-8-sig', errors='replace') as f:
+            for block in iter(functools.partial(f.read, _READ_BLOCK_CHARS), ''):
+                tail, line_num = self._parse_txt_content(
+                    tail + block, messages, errors, line_num, final=False
+                )
+        self._parse_txt_content(tail, messages, errors, line_num)
+        return messages, errors
 
-                # Split sender and content
-                if ': ' in rest:
-                    sender, content = rest.split(': ', 1)
-                    return (timestamp, sender.strip(), content.strip())
-                else:
-                    # System message (no sender)
-                    return (timestamp, "System", rest)
+    def _parse_txt_content(
+        self,
+        content: str,
+        messages: List[WhatsAppMessage],
+        errors: List[str],
+        line_num: int = 0,
+        final: bool = True,
+    ) -> Tuple[str, int]:
+        """
+        Split text from a WhatsApp export into messages.
 
-        return None
+        One finditer pass finds every line that starts with a timestamp; the
+        text up to the next one is that message, so continuation lines are
+        never matched against the timestamp patterns on their own.
 
-    def _parse_datetime(self, date_str: str, time_str: str) -> datetime:
-        """Parse datetime from various WhatsApp formats."""
-        # Normalize date separators
-        date_str = date_str.replace('.', '/').replace('-', '/')
+        Args:
+            content: Export text, starting at a line boundary
+            messages: Parsed messages are appended here
+            errors: Parse errors are appended here
+            line_num: Lines of the export before content (for error messages)
+            final: Whether content runs to the end of the export. If not,
+                the last message and any trailing partial line are left
+                unparsed, since they may continue in the next block.
 
-        # Parse date
-        parts = date_str.split('/')
-        if len(parts) == 3:
+        Returns:
+            Tuple of (unparsed tail of content, lines before that tail)
+        """
+        # (line start, end of timestamp, timestamp) of each message
+        starts = []
+        for match in self.MESSAGE_START.finditer(content):
+            # The time is the last group of whichever alternative matched,
+            # and the date is the group just before it
+            time_index = match.lastindex
+            assert time_index is not None  # every alternative captures (date, time)
             try:
-                # Check for YYYY/MM/DD format (year first - 4 digit first part)
-                if len(parts[0]) == 4:
-                    year, month, day = int(parts[0]), int(parts[1]), int(parts[2])
-                # DD/MM/YYYY or MM/DD/YYYY format
-                elif len(parts[2]) == 4:
-                    day, month, year = int(parts[0]), int(parts[1]), int(parts[2])
-                elif len(parts[2]) == 2:
-                    day, month, year = int(parts[0]), int(parts[1]), 2000 + int(parts[2])
-                else:
-                    raise ValueError("Unknown year format")
-
-                # Validate month (swap if needed for MM/DD/YYYY)
-                if month > 12:
-                    day, month = month, day
-
+                timestamp = _parse_wa_datetime(*match.group(time_index - 1, time_index))
             except ValueError:
-                raise ValueError(f"Cannot parse date: {date_str}")
+                continue  # Not a real date; the line continues the previous message
+            starts.append((match.start(), match.end(), timestamp))
 
+        if final:
+            tail_start = len(content)
+        elif starts:
+            tail_start = starts.pop()[0]
         else:
-            raise ValueError(f"Cannot parse date: {date_str}")
-
-        # Parse time - handle both "AM/PM" and "a.m./p.m." formats
-        time_str = time_str.strip()
-        # Normalize a.m./p.m. to AM/PM
-        time_str_upper = time_str.upper().replace('.', '')
-        is_pm = 'PM' in time_str_upper
-        is_am = 'AM' in time_str_upper
-        # Remove AM/PM variants (with or without periods)
-        time_str = re.sub(r'\s*[ap]\.?m\.?', '', time_str, flags=re.IGNORECASE)
-
-        time_parts = time_str.split(':')
-        hour = int(time_parts[0])
-        minute = int(time_parts[1]) if len(time_parts) > 1 else 0
-        second = int(time_parts[2]) if len(time_parts) > 2 else 0
-
-        if is_pm and hour < 12:
-            hour += 12
-        elif is_am and hour == 12:
-            hour = 0
+            # Only orphan lines so far; keep just a partial last line
+            tail_start = content.rfind('\n') + 1
+
+        # Orphan lines at start (once a message is found, content starts with one)
+        head = content[:starts[0][0] if starts else tail_start]
+        if head:
+            for line_num, line in enumerate(head.split('\n'), line_num + 1):
+                line = line.strip()
+                if line and "end-to-end encrypted" not in line.lower():
+                    errors.append(f"Line {line_num}: Could not parse: {line[:50]}...")
+            if not starts:
+                line_num -= 1  # head ended with a newline, so its last "line" was empty
+
+        is_system_text = self.SYSTEM_MESSAGE.search
+        ends = [line_start for line_start, _, _ in starts[1:]]
+        ends.append(tail_start)
+        for msg_counter, ((_, body_start, timestamp), body_end) in enumerate(
+            zip(starts, ends), len(messages) + 1
+        ):
+            first_line, _, continuation = content[body_start:body_end].partition('\n')
+
+            # Remove leading dash or colon
+            rest = _LEADING_SEPARATOR.sub('', first_line.strip())
+
+            # Split sender and content
+            if ': ' in rest:
+                sender, text = rest.split(': ', 1)
+                sender, text = sender.strip(), text.strip()
+            else:
+                # System message (no sender)
+                sender, text = "System", rest
+
+            # Check if system message (first line only)
+            is_system = is_system_text(text) is not None
+
+            # Continuation lines, without blank ones
+            if continuation and not continuation.isspace():
+                lines = [line.strip() for line in continuation.split('\n')]
+                text = '\n'.join([text, *filter(None, lines)])
+
+            messages.append(WhatsAppMessage(
+                message_id="wa_" + str(msg_counter),
+                timestamp=timestamp,
+                sender=sender,
+                content=text,
+                is_system=is_system,
+            ))
 
-        return datetime(year, month, day, hour, minute, second)
+        return content[tail_start:], line_num
 
     async def _save_import(
         self,
@@ -665,15 +684,39 @@ class WhatsAppImporter:
     ) -> None:
         """Save imported messages to archive."""
         # Create directory structure
-        safe_name = re.sub(r'[^\w\-]', '-', group_name.lower())
+        safe_name = _UNSAFE_NAME.sub('-', group_name.lower())
         group_dir = self.archive_root / "sources" / "whatsapp" / f"{safe_name}_{group_id}"
         imports_dir = group_dir / "imports"
         imports_dir.mkdir(parents=True, exist_ok=True)
 
-        # Save messages
+        # Save messages as one list per field rather than one object per
+        # message: field names are not repeated per message, and period
+        # queries filter on the timestamp list before touching the rest.
+        # Written compact; the manifest below stays indented for people.
         messages_file = imports_dir / f"{import_id}_messages.json"
-        with open(messages_file, 'w') as f:
-            json.dump([m.to_dict() for m in messages], f, indent=2)
+        # Naive ISO timestamps (always the case for .txt exports) sort as
+        # strings, so stored in time order they can be searched with bisect
+        is_sorted = all(m.timestamp.tzinfo is None for m in messages)
+        if is_sorted:
+            messages = sorted(messages, key=lambda m: m.timestamp)
+        payload = {
+            "version": _MESSAGES_FORMAT_VERSION,
+            "layout": "columns",
+            "sorted": is_sorted,
+            "columns": {
+                "message_id": [m.message_id for m in messages],
+                "timestamp": [m.timestamp.isoformat() for m in messages],
+                "sender": [m.sender for m in messages],
+                "content": [m.content for m in messages],
+                "is_system": [m.is_system for m in messages],
+                "attachment": [m.attachment for m in messages],
+                "reply_to": [m.reply_to for m in messages],
+            },
+        }
+        if orjson is not None:
+            messages_file.write_bytes(orjson.dumps(payload))
+        else:
+            messages_file.write_text(json.dumps(payload), encoding='utf-8')
 
         # Update import manifest
         manifest_file = imports_dir / "import-manifest.json"
@@ -701,17 +744,13 @@ class WhatsAppImporter:
             "participant_count": len(set(m.sender for m in messages if not m.is_system)),
         })
 
-        # Update coverage
-        all_dates = []
-        for imp in manifest["imports"]:
-            if imp["date_range"]["start"]:
-                all_dates.append(date.fromisoformat(imp["date_range"]["start"]))
-            if imp["date_range"]["end"]:
-                all_dates.append(date.fromisoformat(imp["date_range"]["end"]))
-
-        if all_dates:
-            manifest["coverage"]["earliest"] = min(all_dates).isoformat()
-            manifest["coverage"]["latest"] = max(all_dates).isoformat()
+        # Update coverage: merge this import's range (ISO dates compare as strings)
+        if earliest:
+            coverage = manifest["coverage"]
+            if not coverage.get("earliest") or earliest < coverage["earliest"]:
+                coverage["earliest"] = earliest
+            if not coverage.get("latest") or latest > coverage["latest"]:
+                coverage["latest"] = latest
 
         with open(manifest_file, 'w') as f:
             json.dump(manifest, f, indent=2)
@@ -734,6 +773,24 @@ class WhatsAppImporter:
         content = msg.get("content", "")[:50]
         return f"{timestamp}|{sender}|{content}"
 
+    @staticmethod
+    def _load_message_columns(messages_file: Path) -> Tuple[Dict[str, List[Any]], bool]:
+        """
+        Load a saved import as one list per message field.
+
+        Returns:
+            Tuple of (columns, whether timestamps are naive and in order)
+        """
+        raw = messages_file.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if isinstance(data, list):
+            # Version 1: one object per message, in export order
+            return {key: [msg.get(key) for msg in data] for key in _MESSAGE_COLUMNS}, False
+        version = data.get("version", _MESSAGES_FORMAT_VERSION)
+        if version > _MESSAGES_FORMAT_VERSION:
+            raise ValueError(f"{messages_file.name}: unsupported messages format version {version}")
+        return data["columns"], data.get("sorted", False)
+
     async def get_messages_for_period(
         self,
         group_id: str,
@@ -780,29 +837,69 @@ class WhatsAppImporter:
         start_naive = start.replace(tzinfo=None) if start.tzinfo else start
         end_naive = end.replace(tzinfo=None) if end.tzinfo else end
 
+        # The manifest's per-import date ranges let imports outside the period
+        # be skipped without loading them. Files it does not list are read.
+        import_ranges: Dict[str, Dict[str, Optional[str]]] = {}
+        manifest_file = imports_dir / "import-manifest.json"
+        if manifest_file.exists():
+            with open(manifest_file, 'r') as f:
+                manifest = json.load(f)
+            import_ranges = {imp["import_id"]: imp["date_range"] for imp in manifest.get("imports", [])}
+        start_day = start_naive.date().isoformat()
+        end_day = end_naive.date().isoformat()
+        start_iso = start_naive.isoformat()
+        end_iso = end_naive.isoformat()
+
         for msg_file in imports_dir.glob("*_messages.json"):
-            with open(msg_file, 'r') as f:
-                messages = json.load(f)
-
-            for msg in messages:
-                msg_time = datetime.fromisoformat(msg["timestamp"])
-                # Also strip timezone from parsed time if present
-                msg_time_naive = msg_time.replace(tzinfo=None) if msg_time.tzinfo else msg_time
-                if start_naive <= msg_time_naive <= end_naive:
-                    # Deduplicate using fingerprint
-                    fingerprint = self._message_fingerprint(msg)
-                    if fingerprint in seen_fingerprints:
-                        continue
-                    seen_fingerprints.add(fingerprint)
-
-                    all_messages.append({
-                        "id": msg["message_id"],
-                        "author_id": msg["sender"],
-                        "author_name": msg["sender"],
-                        "content": msg["content"],
-                        "timestamp": msg["timestamp"],
-                        "is_system": msg.get("is_system", False),
-                    })
+            date_range = import_ranges.get(msg_file.name[:-len("_messages.json")])
+            if date_range is not None:
+                # ISO dates compare correctly as strings; no range means no messages
+                range_start, range_end = date_range["start"], date_range["end"]
+                if not range_start or not range_end or range_start > end_day or range_end < start_day:
+                    continue
+
+            columns, is_sorted = self._load_message_columns(msg_file)
+            timestamps = columns["timestamp"]
+            senders = columns["sender"]
+            contents = columns["content"]
+
+            in_period: Sequence[int]
+            if is_sorted:
+                # Naive ISO strings order like the times they encode
+                in_period = range(
+                    bisect.bisect_left(timestamps, start_iso),
+                    bisect.bisect_right(timestamps, end_iso),
+                )
+            else:
+                matching: List[int] = []
+                for i, timestamp in enumerate(timestamps):
+                    msg_time = datetime.fromisoformat(timestamp)
+                    # Also strip timezone from parsed time if present
+                    msg_time_naive = msg_time.replace(tzinfo=None) if msg_time.tzinfo else msg_time
+                    if start_naive <= msg_time_naive <= end_naive:
+                        matching.append(i)
+                in_period = matching
+
+            for i in in_period:
+                timestamp = timestamps[i]
+                sender = senders[i]
+                content = contents[i]
+                # Deduplicate using fingerprint
+                fingerprint = self._message_fingerprint(
+                    {"timestamp": timestamp, "sender": sender, "content": content}
+                )
+                if fingerprint in seen_fingerprints:
+                    continue
+                seen_fingerprints.add(fingerprint)
+
+                all_messages.append({
+                    "id": columns["message_id"][i],
+                    "author_id": sender,
+                    "author_name": sender,
+                    "content": content,
+                    "timestamp": timestamp,
+                    "is_system": bool(columns["is_system"][i]),
+                })
 
         # Sort by timestamp
         all_messages.sort(key=lambda m: m["timestamp"])
@@ -4,11 +4,12 @@ Generation lock management for preventing duplicate summary generation.
 Implements ADR-006 Section 7: Generation Locking.
 """
 
+import errno
 import json
 import logging
 import os
 import tempfile
-from datetime import datetime, timedelta
+from datetime import timedelta
 from pathlib import Path
 from typing import Optional
 import uuid
@@ -18,6 +19,15 @@ from src.utils.time import utc_now_naive
 
 logger = logging.getLogger(__name__)
 
+# os.link errors from filesystems without hard links (some FUSE/SMB/NFS mounts)
+_NO_HARD_LINKS = {errno.EPERM, errno.ENOTSUP, errno.EOPNOTSUPP, errno.EXDEV}
+
+# Mode open() gives new files. mkstemp creates 0o600 temp files, and that
+# mode would otherwise carry over to the meta file they are renamed to.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_FILE_MODE = 0o666 & ~_UMASK
+
 
 class LockManager:
     """
@@ -64,10 +74,12 @@ class LockManager:
             Job ID if lock acquired, None if already locked
         """
         job_id = job_id or str(uuid.uuid4())
+        now = utc_now_naive()
 
         try:
             # Read existing metadata if present
-            if meta_path.exists():
+            is_new = not meta_path.exists()
+            if not is_new:
                 meta = self._read_meta(meta_path)
 
                 # Already complete - unless force_acquire is set (e.g., DB entry was deleted)
@@ -82,12 +94,8 @@ class LockManager:
                 if meta.get("status") == SummaryStatus.GENERATING.value:
                     lock_data = meta.get("lock", {})
                     if lock_data:
-                        expires_at = datetime.fromisoformat(
-                            lock_data.get("expires_at", "2000-01-01")
-                        )
-
-                        # Lock still valid
-                        if utc_now_naive() < expires_at:
+                        # Lock still valid (naive ISO timestamps compare as strings)
+                        if lock_data.get("expires_at", "") > now.isoformat():
                             logger.debug(
                                 f"Lock held by {lock_data.get('job_id')}: {meta_path}"
                             )
@@ -101,13 +109,19 @@ class LockManager:
             # Acquire lock
             lock = GenerationLock(
                 job_id=job_id,
-                acquired_at=utc_now_naive(),
+                acquired_at=now,
                 acquired_by=self.worker_id,
-                expires_at=utc_now_naive() + timedelta(seconds=self.lock_ttl_seconds),
+                expires_at=now + timedelta(seconds=self.lock_ttl_seconds),
             )
 
             meta = self._create_lock_meta(lock)
-            self._atomic_write(meta_path, meta)
+            if is_new:
+                # Another worker may create the file after our exists() check
+                if not self._exclusive_write(meta_path, meta):
+                    logger.debug(f"Lock created concurrently: {meta_path}")
+                    return None
+            else:
+                self._atomic_write(meta_path, meta)
 
             logger.info(f"Acquired lock {job_id} for {meta_path}")
             return job_id
@@ -211,12 +225,10 @@ class LockManager:
             if not lock_data:
                 return None
 
-            lock = GenerationLock.from_dict(lock_data)
-
-            if lock.is_expired():
+            if lock_data.get("expires_at", "") < utc_now_naive().isoformat():
                 return None
 
-            return lock
+            return GenerationLock.from_dict(lock_data)
 
         except Exception as e:
             logger.error(f"Failed to check lock: {e}")
@@ -258,6 +270,8 @@ class LockManager:
         Returns:
             Number of locks cleaned up
         """
+        # One clock read per pass; naive ISO timestamps compare as strings
+        now_iso = utc_now_naive().isoformat()
         cleaned = 0
 
         for meta_path in archive_root.glob("**/*.meta.json"):
@@ -271,8 +285,7 @@ class LockManager:
                 if not lock_data:
                     continue
 
-                lock = GenerationLock.from_dict(lock_data)
-                if lock.is_expired():
+                if lock_data.get("expires_at", "") < now_iso:
                     meta["lock"] = None
                     meta["status"] = SummaryStatus.PENDING.value
                     self._atomic_write(meta_path, meta)
@@ -297,13 +310,97 @@ class LockManager:
         }
 
     def _atomic_write(self, path: Path, data: dict) -> None:
-        """Write atomically using rename."""
-        path.parent.mkdir(parents=True, exist_ok=True)
+        """
+        Replace a file so a crash leaves either the old or the new contents.
+
+        Each write goes through its own temp file, so concurrent writers
+        never rename each other's partial data into place.
+        """
+        tmp_name = self._write_temp(path, data)
+        try:
+            os.replace(tmp_name, path)
+        except BaseException:
+            self._remove_temp(tmp_name)
+            raise
+        self._fsync_dir(path.parent)
+
+    def _exclusive_write(self, path: Path, data: dict) -> bool:
+        """
+        Create a file with the given contents only if it does not exist yet.
+
+        The complete temp file is hard-linked into place, so the create is
+        exclusive like O_EXCL but readers never see a half-written file.
+        Filesystems without hard links fall back to an O_EXCL create.
 
-        # Write to temp file in same directory
-        tmp_path = path.with_suffix(".tmp")
-        with open(tmp_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        Returns:
+            True if this call created the file
+        """
+        tmp_name = self._write_temp(path, data)
+        try:
+            os.link(tmp_name, path)
+        except FileExistsError:
+            return False
+        except OSError as e:
+            if e.errno not in _NO_HARD_LINKS:
+                raise
+            return self._exclusive_create(path, data)
+        finally:
+            self._remove_temp(tmp_name)
+        self._fsync_dir(path.parent)
+        return True
+
+    def _exclusive_create(self, path: Path, data: dict) -> bool:
+        """Create path with O_EXCL and write data into it."""
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+        except FileExistsError:
+            return False
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+        except BaseException:
+            self._remove_temp(str(path))
+            raise
+        self._fsync_dir(path.parent)
+        return True
 
-        # Atomic rename (POSIX)
-        tmp_path.rename(path)
+    def _write_temp(self, path: Path, data: dict) -> str:
+        """Write data to a unique, fsynced temp file next to path."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-", suffix=".tmp")
+        try:
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, _FILE_MODE)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+        except BaseException:
+            self._remove_temp(tmp_name)
+            raise
+        return tmp_name
+
+    @staticmethod
+    def _remove_temp(tmp_name: str) -> None:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _fsync_dir(directory: Path) -> None:
+        """Persist a rename or link in the directory (POSIX only)."""
+        if os.name != "posix":
+            return
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
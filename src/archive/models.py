@@ -12,8 +12,15 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Literal
 import json
 import re
+import sys
 from src.utils.time import utc_now_naive
 
+# dataclass(**_SLOTS) drops the per-instance __dict__ where slots=True exists (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Characters replaced with '-' in folder names
+_UNSAFE_NAME = re.compile(r'[^\w\-]')
+
 
 class SourceType(Enum):
     """Supported chat platforms."""
@@ -93,7 +100,7 @@ class ArchiveSource:
     @property
     def folder_name(self) -> str:
         """Generate safe folder name for this source."""
-        safe_name = re.sub(r'[^\w\-]', '-', self.server_name.lower())
+        safe_name = _UNSAFE_NAME.sub('-', self.server_name.lower())
         return f"{safe_name}_{self.server_id}"
 
     @property
@@ -104,7 +111,7 @@ class ArchiveSource:
         # ADR-112: Fallback to channel_id if channel_name is missing
         # This can happen for WhatsApp when the lookup fails
         name = self.channel_name or self.channel_id
-        safe_name = re.sub(r'[^\w\-]', '-', name.lower())
+        safe_name = _UNSAFE_NAME.sub('-', name.lower())
         return f"{safe_name}_{self.channel_id}"
 
     @property
@@ -114,7 +121,7 @@ class ArchiveSource:
             return None
         # ADR-112: Fallback to category_id if category_name is missing
         name = self.category_name or self.category_id
-        safe_name = re.sub(r'[^\w\-]', '-', name.lower())
+        safe_name = _UNSAFE_NAME.sub('-', name.lower())
         return f"{safe_name}_{self.category_id}"
 
     def get_archive_path(self, archive_root: Path) -> Path:
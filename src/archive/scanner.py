@@ -6,10 +6,11 @@ Phase 7: Backfill Analysis - Scanner component
 
 import json
 import logging
+import os
 from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set
 
 from .models import (
     SourceType,
@@ -143,7 +144,7 @@ class ArchiveScanner:
         summaries: Dict[date, SummaryInfo] = {}
 
         if archive_path.exists():
-            for meta_path in archive_path.glob("**/*.meta.json"):
+            for meta_path in self._iter_meta_files(archive_path, start_date, end_date):
                 try:
                     info = self._parse_meta_file(meta_path)
                     if info:
@@ -322,6 +323,50 @@ class ArchiveScanner:
 
         return results
 
+    def _iter_meta_files(
+        self,
+        archive_path: Path,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Iterator[Path]:
+        """
+        Yield meta files under a source, skipping out-of-range year/month dirs.
+
+        Args:
+            archive_path: Source archive directory
+            start_date: Skip years/months entirely before this date
+            end_date: Skip years/months entirely after this date
+
+        Yields:
+            Paths of *.meta.json files
+        """
+        if start_date is None and end_date is None:
+            yield from archive_path.glob("**/*.meta.json")
+            return
+
+        lo = (start_date.year, start_date.month) if start_date else (0, 0)
+        hi = (end_date.year, end_date.month) if end_date else (9999, 12)
+
+        with os.scandir(archive_path) as years:
+            for year_entry in years:
+                if not year_entry.is_dir():
+                    continue
+                if not year_entry.name.isdigit():
+                    yield from Path(year_entry.path).glob("**/*.meta.json")
+                    continue
+                year = int(year_entry.name)
+                if year < lo[0] or year > hi[0]:
+                    continue
+
+                with os.scandir(year_entry.path) as months:
+                    for month_entry in months:
+                        if not month_entry.is_dir():
+                            continue
+                        if month_entry.name.isdigit():
+                            if not lo <= (year, int(month_entry.name)) <= hi:
+                                continue
+                        yield from Path(month_entry.path).glob("**/*.meta.json")
+
     def _parse_meta_file(self, meta_path: Path) -> Optional[SummaryInfo]:
         """Parse a metadata file into SummaryInfo."""
         with open(meta_path, 'r') as f:
@@ -385,6 +430,8 @@ class ArchiveScanner:
         include_failed: bool = True,
         include_outdated: bool = False,
         current_prompt_version: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
     ) -> List[date]:
         """
         Get list of dates that need backfill.
@@ -394,12 +441,16 @@ class ArchiveScanner:
             include_failed: Include failed summaries
             include_outdated: Include outdated summaries
             current_prompt_version: Required if include_outdated=True
+            start_date: Only return dates on or after this date
+            end_date: Only return dates on or before this date
 
         Returns:
             List of dates needing backfill
         """
         result = self.scan_source(
             source,
+            start_date=start_date,
+            end_date=end_date,
             current_prompt_version=current_prompt_version if include_outdated else None,
         )
 
@@ -6,9 +6,11 @@ Generates human-readable Markdown files with platform-aware templates.
 
 import hashlib
 import logging
+import os
+from contextlib import contextmanager
 from datetime import datetime, date
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Set
 
 from src.utils.time import utc_now_naive
 from .models import (
@@ -25,6 +27,35 @@ from .models import (
 logger = logging.getLogger(__name__)
 
 
+class WriteBatch:
+    """Files written while a batch is open, synced to disk together."""
+
+    def __init__(self):
+        self.paths: Set[Path] = set()
+
+    def sync(self) -> None:
+        """Fsync every written file, then each containing directory once."""
+        for path in self.paths:
+            _fsync_path(path)
+        for directory in {path.parent for path in self.paths}:
+            _fsync_path(directory)
+        self.paths.clear()
+
+
+def _fsync_path(path: Path) -> None:
+    """Flush a file or directory to disk, ignoring platforms that can't."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError as e:
+        logger.debug(f"fsync not supported for {path}: {e}")
+    finally:
+        os.close(fd)
+
+
 class SummaryWriter:
     """
     Writes summary files to the archive.
@@ -40,6 +71,31 @@ class SummaryWriter:
             archive_root: Root path of the archive
         """
         self.archive_root = archive_root
+        self._batches: List[WriteBatch] = []
+
+    @contextmanager
+    def begin_batch(self) -> Iterator[WriteBatch]:
+        """
+        Collect files written inside the block so they can be synced at once.
+
+        Writes still land immediately; call ``batch.sync()`` (ideally off the
+        event loop) to make them durable with one pass over the files.
+
+        Yields:
+            The active write batch
+        """
+        # Several jobs may share a writer; each open batch sees every write
+        batch = WriteBatch()
+        self._batches.append(batch)
+        try:
+            yield batch
+        finally:
+            self._batches.remove(batch)
+
+    def _track(self, *paths: Path) -> None:
+        """Record written files in every open batch."""
+        for batch in self._batches:
+            batch.paths.update(paths)
 
     def write_summary(
         self,
@@ -118,6 +174,7 @@ class SummaryWriter:
 
         metadata.save(meta_path)
         logger.debug(f"Wrote metadata: {meta_path}")
+        self._track(md_path, meta_path)
 
         return md_path
 
@@ -171,6 +228,7 @@ class SummaryWriter:
 
         metadata.save(meta_path)
         logger.info(f"Wrote incomplete marker: {meta_path}")
+        self._track(meta_path)
 
         return meta_path
 
@@ -374,28 +432,7 @@ async def summary_exists_in_db(
         )
 
         if require_complete:
-            # Check if the summary is actually complete (has content)
-            import json
-            summary_json = row.get('summary_json')
-            if not summary_json:
-                return False
-
-            try:
-                summary_data = json.loads(summary_json) if isinstance(summary_json, str) else summary_json
-            except (json.JSONDecodeError, TypeError):
-                return False
-
-            summary_text = summary_data.get('summary_text', '') or ''
-            message_count = row.get('message_count') or summary_data.get('message_count') or 0
-
-            # Consider incomplete if no summary text or no messages
-            if len(summary_text.strip()) < 50 or message_count == 0:
-                logger.info(
-                    f"Found incomplete summary for {target_date} ({source.source_key}) "
-                    f"(text_len={len(summary_text)}, messages={message_count}), "
-                    f"allowing regeneration"
-                )
-                return False
+            return _is_complete_summary_row(row, target_date, source)
 
         return True
     except Exception as e:
@@ -404,6 +441,83 @@ async def summary_exists_in_db(
         return False
 
 
+async def existing_summary_dates_in_db(
+    source: ArchiveSource,
+    start_date: date,
+    end_date: date,
+) -> Set[date]:
+    """
+    Find the dates in a range that already have a complete summary in the database.
+
+    Batched form of summary_exists_in_db() with require_complete=True: one
+    query for the whole range instead of one per date.
+
+    Args:
+        source: Source information (includes source_key for scope matching)
+        start_date: First date to check
+        end_date: Last date to check (inclusive)
+
+    Returns:
+        Dates with a complete summary for this specific source
+    """
+    try:
+        from ..data.repositories import get_stored_summary_repository
+        repo = await get_stored_summary_repository()
+        if not repo:
+            return set()
+
+        query = """
+        SELECT archive_period, summary_json, message_count
+        FROM stored_summaries
+        WHERE guild_id = ?
+          AND archive_source_key = ?
+          AND archive_period BETWEEN ? AND ?
+        """
+        rows = await repo.connection.fetch_all(
+            query,
+            (source.server_id, source.source_key, start_date.isoformat(), end_date.isoformat())
+        )
+
+        existing = set()
+        for row in rows:
+            try:
+                target_date = date.fromisoformat(row["archive_period"])
+            except (TypeError, ValueError):
+                continue
+            if _is_complete_summary_row(row, target_date, source):
+                existing.add(target_date)
+        return existing
+    except Exception as e:
+        logger.warning(f"DB range check failed, assuming none exist: {e}")
+        return set()
+
+
+def _is_complete_summary_row(row: Dict[str, Any], target_date: date, source: ArchiveSource) -> bool:
+    """Check that a stored summary row has actual content."""
+    import json
+    summary_json = row.get('summary_json')
+    if not summary_json:
+        return False
+
+    try:
+        summary_data = json.loads(summary_json) if isinstance(summary_json, str) else summary_json
+    except (json.JSONDecodeError, TypeError):
+        return False
+
+    summary_text = summary_data.get('summary_text', '') or ''
+    message_count = row.get('message_count') or summary_data.get('message_count') or 0
+
+    # Consider incomplete if no summary text or no messages
+    if len(summary_text.strip()) < 50 or message_count == 0:
+        logger.info(
+            f"Found incomplete summary for {target_date} ({source.source_key}) "
+            f"(text_len={len(summary_text)}, messages={message_count}), "
+            f"allowing regeneration"
+        )
+        return False
+    return True
+
+
 def delete_summary_file(
     archive_root: Path,
     source: ArchiveSource,
@@ -170,6 +170,9 @@ def get_archive_root() -> Path:
 # Singleton generator instance to preserve job state across requests
 _generator_instance = None
 
+# Singleton backfill manager so repeated backfill reports reuse its analysis cache
+_backfill_manager = None
+
 
 class SummarizationAdapter:
     """
@@ -372,6 +375,31 @@ async def get_generator():
     return _generator_instance
 
 
+async def close_generator():
+    """Release resources held by the generator and backfill singletons on shutdown."""
+    if _generator_instance is not None:
+        await _generator_instance.api_key_resolver.close()
+        _generator_instance.cost_tracker.flush()
+        await _generator_instance.cost_tracker.pricing.close()
+    if _backfill_manager is not None:
+        _backfill_manager.close()
+
+
+def get_backfill_manager():
+    """Get backfill manager instance (singleton to preserve its analysis cache)."""
+    global _backfill_manager
+
+    if _backfill_manager is None:
+        from src.archive.backfill import BackfillManager
+        from src.archive.cost_tracker import CostTracker
+
+        archive_root = get_archive_root()
+        cost_tracker = CostTracker(archive_root / "cost-ledger.json")
+        _backfill_manager = BackfillManager(archive_root, cost_tracker)
+
+    return _backfill_manager
+
+
 def get_scanner():
     """Get archive scanner instance."""
     from src.archive.scanner import ArchiveScanner
@@ -946,10 +974,6 @@ async def scan_source(
 async def get_backfill_report(request: BackfillReportRequest):
     """Analyze archive for backfill opportunities."""
     from src.archive.models import SourceType, ArchiveSource
-    from src.archive.backfill import BackfillManager
-    from src.archive.cost_tracker import CostTracker
-
-    archive_root = get_archive_root()
 
     source = ArchiveSource(
         source_type=SourceType(request.source_type),
@@ -957,8 +981,7 @@ async def get_backfill_report(request: BackfillReportRequest):
         server_name=request.server_id,  # Will be updated from manifest
     )
 
-    cost_tracker = CostTracker(archive_root / "cost-ledger.json")
-    manager = BackfillManager(archive_root, cost_tracker)
+    manager = get_backfill_manager()
 
     report = manager.analyze_backfill(
         source,
@@ -1555,7 +1578,12 @@ async def get_source_costs(source_key: str):
     if not cost:
         raise HTTPException(404, f"No cost data for source: {source_key}")
 
-    return cost.to_dict()
+    # The ledger keeps full precision; round only for display
+    data = cost.to_dict()
+    data["total_cost_usd"] = round(data["total_cost_usd"], 4)
+    for monthly in data["monthly"].values():
+        monthly["cost_usd"] = round(monthly["cost_usd"], 4)
+    return data
 
 
 @router.post("/recover/{summary_id}")
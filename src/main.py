@@ -592,6 +592,13 @@ class SummaryBotApp:
             self.logger.info("Stopping Discord bot...")
             await self.discord_bot.stop()
 
+        # Close the archive generator's shared OpenRouter HTTP client
+        try:
+            from .dashboard.routes.archive import close_generator
+            await close_generator()
+        except Exception as e:
+            self.logger.warning(f"Failed to close archive generator: {e}")
+
         # ADR-102: Checkpoint WAL to ensure all data is persisted before shutdown
         try:
             from .data import get_repository_factory
@@ -684,37 +691,6 @@ async def main():
         sys.exit(1)
 
 
-async def emergency_server():
-    """Start a minimal server when main app fails to initialize.
-
-    This ensures health checks pass and we can diagnose issues.
-    """
-    from fastapi import FastAPI
-    from fastapi.responses import JSONResponse
-    import uvicorn
-
-    app = FastAPI(title="Summary Bot NG - Emergency Mode")
-
-    @app.get("/health")
-    async def health():
-        return JSONResponse(
-            status_code=200,
-            content={
-                "status": "emergency",
-                "message": "Main application failed to start. Check logs for details.",
-                "version": "2.0.0"
-            }
-        )
-
-    @app.get("/")
-    async def root():
-        return {"status": "emergency", "message": "Application in emergency mode"}
-
-    config = uvicorn.Config(app, host="0.0.0.0", port=5000, log_level="info")
-    server = uvicorn.Server(config)
-    await server.serve()
-
-
 if __name__ == "__main__":
     print("=== Starting Summary Bot NG ===", flush=True, file=sys.stderr)
     try:
@@ -725,4 +701,5 @@ if __name__ == "__main__":
         import traceback
         traceback.print_exc()
         print("Starting emergency server for diagnostics...", flush=True, file=sys.stderr)
-        asyncio.run(emergency_server())
+        from .__main__ import run_emergency_server
+        run_emergency_server(f"{type(e).__name__}: {e}")
@@ -24,6 +24,7 @@ from src.archive import (
     LockManager,
     SummaryStatus,
 )
+from src.archive.cost_tracker import SourceCost
 
 
 class TestArchiveSource:
@@ -179,6 +180,98 @@ class TestCostTracker:
             assert source_cost is not None
             assert source_cost.total_cost_usd > 0
 
+    def test_record_cost_debounces_ledger_writes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ledger_path = Path(tmpdir) / "cost-ledger.json"
+            tracker = CostTracker(ledger_path, max_pending=3)
+
+            def entry(i):
+                return CostEntry(
+                    source_key="discord:123",
+                    summary_id=f"sum_{i}",
+                    timestamp=datetime.utcnow(),
+                    model="anthropic/claude-3-haiku",
+                    tokens_input=1000,
+                    tokens_output=200,
+                    cost_usd=0.0015,
+                    pricing_version="2026-02-01",
+                )
+
+            tracker.record_cost(entry(0))
+            tracker.record_cost(entry(1))
+            assert not ledger_path.exists()
+
+            tracker.record_cost(entry(2))
+            assert CostTracker(ledger_path).get_source_cost("discord:123").summary_count == 3
+
+            tracker.record_cost(entry(3))
+            tracker.flush()
+            assert CostTracker(ledger_path).get_source_cost("discord:123").summary_count == 4
+            assert [p.name for p in Path(tmpdir).iterdir()] == ["cost-ledger.json"]
+
+    def test_save_only_reserializes_touched_sources(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ledger_path = Path(tmpdir) / "cost-ledger.json"
+            tracker = CostTracker(ledger_path)
+            for source_key in ("discord:1", "discord:2"):
+                tracker.record_costs_bulk([CostEntry(
+                    source_key=source_key,
+                    summary_id="sum_0",
+                    timestamp=datetime.utcnow(),
+                    model="anthropic/claude-3-haiku",
+                    tokens_input=1000,
+                    tokens_output=200,
+                    cost_usd=0.0015,
+                    pricing_version="2026-02-01",
+                )])
+
+            serialized = []
+            original = SourceCost.to_dict
+            monkeypatch.setattr(
+                SourceCost, "to_dict", lambda self: serialized.append(self) or original(self)
+            )
+            tracker.record_costs_bulk([CostEntry(
+                source_key="discord:2",
+                summary_id="sum_1",
+                timestamp=datetime.utcnow(),
+                model="anthropic/claude-3-haiku",
+                tokens_input=1000,
+                tokens_output=200,
+                cost_usd=0.0015,
+                pricing_version="2026-02-01",
+            )])
+
+            assert serialized == [tracker.get_source_cost("discord:2")]
+            with open(ledger_path) as f:
+                data = json.load(f)
+            assert list(data["sources"]) == ["discord:1", "discord:2"]
+            assert data["sources"]["discord:2"]["summary_count"] == 2
+
+    def test_record_costs_bulk(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ledger_path = Path(tmpdir) / "cost-ledger.json"
+            tracker = CostTracker(ledger_path)
+
+            entries = [
+                CostEntry(
+                    source_key="discord:123",
+                    summary_id=f"sum_{i}",
+                    timestamp=datetime.utcnow(),
+                    model="anthropic/claude-3-haiku",
+                    tokens_input=1000,
+                    tokens_output=200,
+                    cost_usd=0.0015,
+                    pricing_version="2026-02-01",
+                )
+                for i in range(3)
+            ]
+            tracker.record_costs_bulk(entries)
+
+            reloaded = CostTracker(ledger_path)
+            source_cost = reloaded.get_source_cost("discord:123")
+            assert source_cost.summary_count == 3
+            assert reloaded.get_total_cost() == pytest.approx(0.0045)
+
     def test_cost_estimate(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             ledger_path = Path(tmpdir) / "cost-ledger.json"
@@ -214,6 +307,58 @@ class TestPricingTable:
         assert cost > 0
         assert cost < 0.01  # Sanity check
 
+    def test_version_lookup_by_timestamp(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pricing_path = Path(tmpdir) / "pricing.json"
+            pricing_path.write_text(json.dumps({"versions": [
+                {"effective_from": "2026-03-01", "models": {"m": {"input": 2.0, "output": 2.0}}},
+                {"effective_from": "2026-01-01", "models": {"m": {"input": 1.0, "output": 1.0}}},
+            ]}))
+            pricing = PricingTable(pricing_path)
+
+            assert pricing.get_pricing("m", datetime(2026, 2, 1))[2] == "2026-01-01"
+            assert pricing.get_pricing("m", datetime(2026, 3, 1))[2] == "2026-03-01"
+            assert pricing.get_pricing("m", datetime(2026, 6, 1))[:2] == (2.0, 2.0)
+            # Before the first version falls back to the earliest
+            assert pricing.get_pricing("m", datetime(2025, 1, 1))[2] == "2026-01-01"
+
+            pricing._set_version("2026-02-01", {"m": {"input": 1.5, "output": 1.5}})
+            assert pricing.get_pricing("m", datetime(2026, 2, 15))[:2] == (1.5, 1.5)
+            pricing._set_version("2026-02-01", {"m": {"input": 1.7, "output": 1.7}})
+            assert pricing.get_pricing("m", datetime(2026, 2, 15))[:2] == (1.7, 1.7)
+            assert [v[1] for v in pricing._sorted_versions] == ["2026-01-01", "2026-02-01", "2026-03-01"]
+
+    def test_rate_tables_resolved_on_first_use(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pricing_path = Path(tmpdir) / "pricing.json"
+            pricing_path.write_text(json.dumps({"versions": [
+                {"effective_from": f"2025-{month:02d}-01", "models": {"m": {"input": month, "output": 1.0}}}
+                for month in range(1, 13)
+            ]}))
+            pricing = PricingTable(pricing_path)
+            assert pricing._resolved_rates == [None] * 12
+
+            assert pricing.get_pricing("m", datetime(2026, 1, 1))[0] == 12
+            assert pricing.get_pricing("m", datetime(2025, 3, 5))[0] == 3
+            built = [i for i, table in enumerate(pricing._resolved_rates) if table is not None]
+            assert built == [2, 11]
+
+    def test_rates_cached_per_model_and_version(self):
+        pricing = PricingTable()
+        first = pricing.get_pricing("anthropic/claude-3-haiku")
+        assert pricing.get_pricing("anthropic/claude-3-haiku") is first
+        # Catalogue models come straight from the resolved table
+        assert not pricing._rate_cache
+
+        alias = pricing.get_pricing("anthropic/claude-3-haiku-20240307")
+        assert alias == first
+        assert list(pricing._rate_cache) == [("anthropic/claude-3-haiku-20240307", first[2])]
+
+        pricing._pricing_cache["2026-02-01"] = {"anthropic/claude-3-haiku": {"input": 1.0, "output": 2.0}}
+        pricing._rebuild_version_index()
+        assert pricing.get_pricing("anthropic/claude-3-haiku")[:2] == (1.0, 2.0)
+        assert pricing.get_pricing("anthropic/claude-3-haiku-20240307")[:2] == (1.0, 2.0)
+
 
 class TestLockManager:
     """Tests for LockManager."""
@@ -273,6 +418,85 @@ class TestLockManager:
             assert job2 is not None
             assert job2 != job1
 
+    @pytest.mark.asyncio
+    async def test_check_lock_ignores_expired_lock(self, tmp_path):
+        meta_path = tmp_path / "test.meta.json"
+        lock_manager = LockManager(lock_ttl_seconds=60)
+        assert await lock_manager.acquire_lock(meta_path) is not None
+
+        meta = json.loads(meta_path.read_text())
+        meta["lock"]["expires_at"] = (datetime.utcnow() - timedelta(microseconds=1)).isoformat()
+        lock_manager._atomic_write(meta_path, meta)
+
+        assert await lock_manager.check_lock(meta_path) is None
+        assert await lock_manager.cleanup_expired_locks(tmp_path) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_create_is_exclusive(self, tmp_path, monkeypatch):
+        meta_path = tmp_path / "test.meta.json"
+        lock_manager = LockManager(lock_ttl_seconds=60)
+        job1 = await lock_manager.acquire_lock(meta_path)
+        assert job1 is not None
+
+        # Second worker passed its exists() check before the first one wrote
+        monkeypatch.setattr(Path, "exists", lambda self: False)
+        assert await lock_manager.acquire_lock(meta_path) is None
+
+        assert json.loads(meta_path.read_text())["lock"]["job_id"] == job1
+        assert [p.name for p in tmp_path.iterdir()] == ["test.meta.json"]
+
+    @pytest.mark.asyncio
+    async def test_create_without_hard_links_falls_back_to_o_excl(self, tmp_path, monkeypatch):
+        import errno
+        import os
+
+        def no_link(src, dst):
+            raise OSError(errno.EPERM, "Operation not permitted")
+
+        monkeypatch.setattr(os, "link", no_link)
+        meta_path = tmp_path / "test.meta.json"
+        lock_manager = LockManager(lock_ttl_seconds=60)
+
+        job1 = await lock_manager.acquire_lock(meta_path)
+        assert job1 is not None
+        assert json.loads(meta_path.read_text())["lock"]["job_id"] == job1
+        assert [p.name for p in tmp_path.iterdir()] == ["test.meta.json"]
+
+        # The fallback create is still exclusive
+        monkeypatch.setattr(Path, "exists", lambda self: False)
+        assert await lock_manager.acquire_lock(meta_path) is None
+
+    @pytest.mark.asyncio
+    async def test_meta_files_follow_umask(self, tmp_path, monkeypatch):
+        import errno
+        import os
+
+        def no_link(src, dst):
+            raise OSError(errno.EPERM, "Operation not permitted")
+
+        umask = os.umask(0)
+        os.umask(umask)
+        lock_manager = LockManager(lock_ttl_seconds=60)
+        linked = tmp_path / "linked.meta.json"
+        await lock_manager.acquire_lock(linked)
+        replaced = tmp_path / "replaced.meta.json"
+        lock_manager._atomic_write(replaced, {"status": "pending"})
+        monkeypatch.setattr(os, "link", no_link)
+        created = tmp_path / "created.meta.json"
+        await lock_manager.acquire_lock(created)
+
+        for meta_path in (linked, replaced, created):
+            assert meta_path.stat().st_mode & 0o777 == 0o666 & ~umask
+
+    def test_atomic_write_replaces_without_leftovers(self, tmp_path):
+        meta_path = tmp_path / "test.meta.json"
+        lock_manager = LockManager()
+        lock_manager._atomic_write(meta_path, {"status": "pending"})
+        lock_manager._atomic_write(meta_path, {"status": "complete"})
+
+        assert json.loads(meta_path.read_text()) == {"status": "complete"}
+        assert [p.name for p in tmp_path.iterdir()] == ["test.meta.json"]
+
 
 class TestSummaryWriter:
     """Tests for SummaryWriter."""
@@ -367,6 +591,43 @@ class TestSummaryWriter:
             assert data["status"] == "incomplete"
             assert data["incomplete_reason"]["code"] == "NO_MESSAGES"
 
+    def test_batch_collects_written_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            writer = SummaryWriter(Path(tmpdir))
+
+            source = ArchiveSource(
+                source_type=SourceType.WHATSAPP,
+                server_id="group_123",
+                server_name="Family",
+            )
+
+            period = PeriodInfo(
+                start=datetime(2026, 2, 14, 0, 0),
+                end=datetime(2026, 2, 14, 23, 59, 59),
+                timezone="UTC",
+            )
+
+            with writer.begin_batch() as batch:
+                meta_path = writer.write_incomplete_marker(
+                    source=source,
+                    period=period,
+                    reason_code="NO_MESSAGES",
+                    reason_message="No messages found in this period",
+                )
+
+            assert batch.paths == {meta_path}
+            batch.sync()
+            assert not batch.paths
+
+            # Writes outside a batch are not tracked
+            writer.write_incomplete_marker(
+                source=source,
+                period=period,
+                reason_code="NO_MESSAGES",
+                reason_message="No messages found in this period",
+            )
+            assert not batch.paths
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,17 @@
+"""
+Shared fixtures for archive tests.
+"""
+
+import pytest
+
+from src.archive.models import ArchiveSource, SourceType
+
+
+@pytest.fixture
+def archive_source() -> ArchiveSource:
+    """Discord source used across the archive tests."""
+    return ArchiveSource(
+        source_type=SourceType.DISCORD,
+        server_id="123",
+        server_name="Test Server",
+    )
@@ -0,0 +1,89 @@
+"""
+Tests for API key storage backends.
+"""
+
+import os
+
+import pytest
+from cryptography.fernet import Fernet
+
+from src.archive.api_keys import EncryptedFileBackend, EnvVarBackend
+from src.archive.api_keys.backends import get_backend_for_ref
+
+
+@pytest.fixture
+def master_key(monkeypatch):
+    key = Fernet.generate_key().decode()
+    monkeypatch.setenv("SUMMARYBOT_MASTER_KEY", key)
+    return key
+
+
+class TestEncryptedFileBackend:
+    """Tests for the encrypted file backend."""
+
+    @pytest.mark.asyncio
+    async def test_roundtrip(self, tmp_path, master_key):
+        backend = EncryptedFileBackend(tmp_path)
+        assert await backend.set_key("file:discord_1.enc", "sk-secret")
+        assert await backend.get_key("file:discord_1.enc") == "sk-secret"
+        assert await backend.get_key("file:missing.enc") is None
+
+    @pytest.mark.asyncio
+    async def test_cached_key_skips_decrypt(self, tmp_path, master_key):
+        backend = EncryptedFileBackend(tmp_path)
+        await backend.set_key("file:discord_1.enc", "sk-secret")
+        assert await backend.get_key("file:discord_1.enc") == "sk-secret"
+
+        backend._fernet = None
+        os.environ.pop("SUMMARYBOT_MASTER_KEY")
+        # Served from the plaintext cache without touching the master key
+        assert await backend.get_key("file:discord_1.enc") == "sk-secret"
+
+    @pytest.mark.asyncio
+    async def test_rewritten_file_invalidates_cache(self, tmp_path, master_key):
+        backend = EncryptedFileBackend(tmp_path)
+        other = EncryptedFileBackend(tmp_path)
+        await backend.set_key("file:discord_1.enc", "sk-old")
+        assert await backend.get_key("file:discord_1.enc") == "sk-old"
+
+        await other.set_key("file:discord_1.enc", "sk-new")
+        path = tmp_path / "discord_1.enc"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert await backend.get_key("file:discord_1.enc") == "sk-new"
+
+    @pytest.mark.asyncio
+    async def test_delete_drops_cached_key(self, tmp_path, master_key):
+        backend = EncryptedFileBackend(tmp_path)
+        await backend.set_key("file:discord_1.enc", "sk-secret")
+        await backend.get_key("file:discord_1.enc")
+
+        assert await backend.delete_key("file:discord_1.enc")
+        assert await backend.get_key("file:discord_1.enc") is None
+
+
+class TestGetBackendForRef:
+    """Tests for key reference dispatch."""
+
+    def test_dispatch_by_scheme(self, tmp_path):
+        assert isinstance(get_backend_for_ref("env:VAR", {}), EnvVarBackend)
+        backend = get_backend_for_ref("file:a.enc", {"keys_dir": str(tmp_path)})
+        assert isinstance(backend, EncryptedFileBackend)
+        assert backend.keys_dir == tmp_path
+
+    def test_file_backend_reused_per_keys_dir(self, tmp_path):
+        config = {"keys_dir": str(tmp_path)}
+        first = get_backend_for_ref("file:a.enc", config)
+        assert get_backend_for_ref("file:b.enc", config) is first
+        other = get_backend_for_ref("file:a.enc", {"keys_dir": str(tmp_path / "other")})
+        assert other is not first
+
+    def test_unknown_scheme_defaults_to_env(self):
+        assert isinstance(get_backend_for_ref("OPENROUTER_KEY", {}), EnvVarBackend)
+        assert isinstance(get_backend_for_ref("db:123", {}), EnvVarBackend)
+
+    def test_vault_requires_address(self, monkeypatch):
+        monkeypatch.delenv("VAULT_ADDR", raising=False)
+        with pytest.raises(ValueError):
+            get_backend_for_ref("vault:openrouter/acme", {})
@@ -0,0 +1,172 @@
+"""
+Tests for the per-server API key resolver.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.archive.api_keys import ApiKeyResolver, KeyStatus
+
+
+class TestKeyFingerprint:
+    """Tests for validation cache fingerprints."""
+
+    def test_fingerprint_is_stable_per_resolver(self):
+        resolver = ApiKeyResolver(default_key="sk-default")
+        assert resolver._key_fingerprint("sk-abc") == resolver._key_fingerprint("sk-abc")
+        assert resolver._key_fingerprint("sk-abc") != resolver._key_fingerprint("sk-abd")
+
+    def test_fingerprint_is_salted_per_resolver(self):
+        first = ApiKeyResolver(default_key="sk-default")
+        second = ApiKeyResolver(default_key="sk-default")
+        assert first._key_fingerprint("sk-abc") != second._key_fingerprint("sk-abc")
+
+    @pytest.mark.asyncio
+    async def test_set_server_key_clears_validation_entry(self, monkeypatch):
+        # Register the variable so monkeypatch removes it again on teardown
+        monkeypatch.setenv("OPENROUTER_KEY_DISCORD_1", "sk-old")
+        resolver = ApiKeyResolver(default_key="sk-default")
+        fingerprint = resolver._key_fingerprint("sk-new")
+        resolver._validation_cache[fingerprint] = (KeyStatus.INVALID, None)
+
+        key_ref = await resolver.set_server_key("discord:1", "sk-new")
+
+        assert key_ref == "env:OPENROUTER_KEY_DISCORD_1"
+        assert fingerprint not in resolver._validation_cache
+
+
+class TestKeyCache:
+    """Tests for the resolved key cache."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_key_uses_cache_until_expiry(self, monkeypatch):
+        monkeypatch.setenv("OPENROUTER_KEY_TEST", "sk-first")
+        resolver = ApiKeyResolver(default_key="sk-default")
+        assert await resolver._fetch_key("env:OPENROUTER_KEY_TEST") == "sk-first"
+
+        monkeypatch.setenv("OPENROUTER_KEY_TEST", "sk-second")
+        assert await resolver._fetch_key("env:OPENROUTER_KEY_TEST") == "sk-first"
+
+        # Force the cached entry past its monotonic deadline
+        key, _ = resolver._key_cache["env:OPENROUTER_KEY_TEST"]
+        resolver._key_cache["env:OPENROUTER_KEY_TEST"] = (key, 0.0)
+        assert await resolver._fetch_key("env:OPENROUTER_KEY_TEST") == "sk-second"
+
+    def test_cache_evicts_least_recently_used(self, monkeypatch):
+        monkeypatch.setattr("src.archive.api_keys.resolver._CACHE_MAX_ENTRIES", 2)
+        resolver = ApiKeyResolver(default_key="sk-default")
+        cache = resolver._key_cache
+
+        resolver._cache_put(cache, "a", "1", 60.0)
+        resolver._cache_put(cache, "b", "2", 60.0)
+        assert resolver._cache_get(cache, "a") == "1"
+        resolver._cache_put(cache, "c", "3", 60.0)
+
+        assert list(cache) == ["a", "c"]
+
+
+def _mock_client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestValidateKey:
+    """Tests for OpenRouter key validation."""
+
+    @pytest.mark.asyncio
+    async def test_validation_reuses_shared_client(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.headers["Authorization"])
+            return httpx.Response(200, json={})
+
+        resolver = ApiKeyResolver(default_key="sk-default")
+        resolver._client = _mock_client(handler)
+        client = await resolver._get_client()
+
+        assert await resolver._validate_key("sk-a")
+        assert await resolver._validate_key("sk-a")  # cached
+        assert await resolver._validate_key("sk-b")
+        assert await resolver._get_client() is client
+        assert calls == ["Bearer sk-a", "Bearer sk-b"]
+
+        await resolver.close()
+        assert resolver._client is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_validations_share_one_request(self):
+        calls = []
+
+        async def handler(request):
+            calls.append(request.headers["Authorization"])
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={})
+
+        resolver = ApiKeyResolver(default_key="sk-default")
+        resolver._client = _mock_client(handler)
+
+        results = await asyncio.gather(*(resolver._validate_key("sk-a") for _ in range(5)))
+
+        assert results == [True] * 5
+        assert calls == ["Bearer sk-a"]
+        assert not resolver._inflight_validations
+
+    @pytest.mark.asyncio
+    async def test_validate_keys_batches_refs(self, monkeypatch):
+        monkeypatch.setenv("OPENROUTER_KEY_GOOD", "sk-good")
+        monkeypatch.setenv("OPENROUTER_KEY_BAD", "sk-bad")
+        monkeypatch.delenv("OPENROUTER_KEY_MISSING", raising=False)
+
+        def handler(request):
+            if request.headers["Authorization"] == "Bearer sk-good":
+                return httpx.Response(200, json={"credits_remaining": 5})
+            return httpx.Response(401)
+
+        resolver = ApiKeyResolver(default_key="sk-default")
+        resolver._client = _mock_client(handler)
+
+        results = await resolver.validate_keys([
+            "env:OPENROUTER_KEY_GOOD",
+            "env:OPENROUTER_KEY_BAD",
+            "env:OPENROUTER_KEY_MISSING",
+        ])
+
+        assert results["env:OPENROUTER_KEY_GOOD"]["valid"] is True
+        assert results["env:OPENROUTER_KEY_GOOD"]["credits_remaining"] == 5
+        assert results["env:OPENROUTER_KEY_BAD"]["error"] == "HTTP 401"
+        assert results["env:OPENROUTER_KEY_MISSING"]["error"] == "Key not found"
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_after_repeated_outages(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.headers["Authorization"])
+            return httpx.Response(503)
+
+        resolver = ApiKeyResolver(default_key="sk-default")
+        resolver._client = _mock_client(handler)
+
+        for i in range(5):
+            assert await resolver._validate_key(f"sk-{i}")
+        assert len(calls) == 5
+        assert not resolver._validation_cache
+
+        # Breaker is open: keys are assumed valid without calling OpenRouter
+        assert await resolver._validate_key("sk-other")
+        assert len(calls) == 5
+
+        resolver._breaker_open_until = 0.0
+        assert await resolver._validate_key("sk-other")
+        assert len(calls) == 6
+
+    @pytest.mark.asyncio
+    async def test_auth_failure_is_cached_as_invalid(self):
+        resolver = ApiKeyResolver(default_key="sk-default")
+        resolver._client = _mock_client(lambda request: httpx.Response(401))
+
+        assert not await resolver._validate_key("sk-revoked")
+        assert resolver._breaker_failures == 0
+        assert len(resolver._validation_cache) == 1
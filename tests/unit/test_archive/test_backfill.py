@@ -0,0 +1,388 @@
+"""
+Tests for backfill job execution.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from datetime import date
+
+import numpy as np
+import pytest
+
+from src.archive.backfill import BackfillJob, BackfillManager, BackfillStatus, _message_stats
+from src.archive.cost_tracker import CostTracker
+
+
+def _fetcher(source, start, end):
+    return [
+        {"author_id": "a", "content": "hello"},
+        {"author_id": "b", "content": "hi"},
+        {"author_id": "a", "content": "bye"},
+    ]
+
+
+def _summarizer(messages, source):
+    return {"content": "Summary", "tokens_input": 1000, "tokens_output": 200}
+
+
+def _manager(tmp_path, fetcher=_fetcher, summarizer=_summarizer) -> BackfillManager:
+    return BackfillManager(
+        archive_root=tmp_path,
+        cost_tracker=CostTracker(tmp_path / "cost-ledger.json"),
+        message_fetcher=fetcher,
+        summarizer=summarizer,
+    )
+
+
+DATES = [date(2025, 1, day) for day in range(1, 6)]
+
+
+def _meta_path(source, root, day: date):
+    return source.get_archive_path(root) / str(day.year) / f"{day.month:02d}" / f"{day.isoformat()}_daily.meta.json"
+
+
+class TestRunBackfillJob:
+    """Tests for BackfillManager.run_backfill_job."""
+
+    @pytest.mark.asyncio
+    async def test_completes_all_dates(self, archive_source, tmp_path):
+        manager = _manager(tmp_path)
+        job = await manager.create_backfill_job(archive_source, dates=DATES)
+
+        job = await manager.run_backfill_job(job.job_id)
+
+        assert job.status == BackfillStatus.COMPLETED
+        assert job.progress.completed == len(DATES)
+        assert job.progress.failed == 0
+        assert job.progress.cost_usd > 0
+        assert _meta_path(archive_source, tmp_path, DATES[2]).exists()
+
+    @pytest.mark.asyncio
+    async def test_failed_dates_are_counted(self, archive_source, tmp_path):
+        def summarizer(messages, source):
+            raise RuntimeError("LLM unavailable")
+
+        manager = _manager(tmp_path, summarizer=summarizer)
+        job = await manager.create_backfill_job(archive_source, dates=DATES)
+
+        job = await manager.run_backfill_job(job.job_id)
+
+        assert job.status == BackfillStatus.COMPLETED
+        assert job.progress.failed == len(DATES)
+        assert job.progress.completed == 0
+
+    @pytest.mark.asyncio
+    async def test_cost_limit_stops_queued_dates(self, archive_source, tmp_path):
+        manager = _manager(tmp_path)
+        job = await manager.create_backfill_job(
+            archive_source, dates=DATES, max_cost_usd=0.000001
+        )
+
+        job = await manager.run_backfill_job(job.job_id, concurrency=1)
+
+        assert job.status == BackfillStatus.PAUSED
+        assert job.progress.completed == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_queued_dates(self, archive_source, tmp_path):
+        loop = asyncio.get_running_loop()
+
+        def summarizer(messages, source):
+            # Summarizer runs in a worker thread; cancel on the event loop
+            loop.call_soon_threadsafe(manager.cancel_job, job.job_id)
+            return _summarizer(messages, source)
+
+        manager = _manager(tmp_path, summarizer=summarizer)
+        job = await manager.create_backfill_job(archive_source, dates=DATES)
+
+        job = await manager.run_backfill_job(job.job_id, concurrency=1)
+
+        assert job.status == BackfillStatus.CANCELLED
+        assert job.progress.completed == 1
+        assert not manager.cancel_job("bf_missing")
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, archive_source, tmp_path):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+        release = threading.Event()
+
+        def summarizer(messages, source):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            release.wait(0.05)
+            with lock:
+                active -= 1
+            return _summarizer(messages, source)
+
+        manager = _manager(tmp_path, summarizer=summarizer)
+        job = await manager.create_backfill_job(archive_source, dates=DATES)
+
+        job = await manager.run_backfill_job(job.job_id, concurrency=2)
+
+        assert job.progress.completed == len(DATES)
+        assert peak <= 2
+
+    @pytest.mark.asyncio
+    async def test_costs_flushed_in_one_ledger_write(self, archive_source, tmp_path, monkeypatch):
+        manager = _manager(tmp_path)
+        writes = []
+        save = manager.cost_tracker._save_ledger
+        monkeypatch.setattr(manager.cost_tracker, "_save_ledger", lambda: writes.append(save()))
+        job = await manager.create_backfill_job(archive_source, dates=DATES)
+
+        job = await manager.run_backfill_job(job.job_id)
+
+        assert len(writes) == 1
+        source_cost = manager.cost_tracker.get_source_cost(archive_source.source_key)
+        assert source_cost.summary_count == len(DATES)
+        assert source_cost.total_cost_usd == pytest.approx(job.progress.cost_usd)
+
+    @pytest.mark.asyncio
+    async def test_progress_deltas_are_published(self, archive_source, tmp_path):
+        manager = _manager(tmp_path)
+        job = await manager.create_backfill_job(archive_source, dates=DATES[:2])
+        queue = manager.subscribe_progress(job.job_id)
+
+        job = await manager.run_backfill_job(job.job_id)
+
+        deltas = []
+        while (delta := queue.get_nowait()) is not None:
+            deltas.append(delta)
+        assert sum(d.completed for d in deltas) == 2
+        assert sum(d.cost_usd for d in deltas) == pytest.approx(job.progress.cost_usd)
+        assert {d.current_period for d in deltas} >= {"2025-01-01", "2025-01-02"}
+
+    @pytest.mark.asyncio
+    async def test_cost_calculation_is_memoized(self, archive_source, tmp_path):
+        manager = _manager(tmp_path)
+        job = await manager.create_backfill_job(archive_source, dates=DATES)
+
+        await manager.run_backfill_job(job.job_id)
+
+        info = manager.cost_cache_info()
+        assert info.misses == 1
+        assert info.hits == len(DATES) - 1
+
+    @pytest.mark.asyncio
+    async def test_callbacks_run_on_dedicated_executor(self, archive_source, tmp_path):
+        threads = set()
+
+        def summarizer(messages, source):
+            threads.add(threading.current_thread().name)
+            return _summarizer(messages, source)
+
+        manager = _manager(tmp_path, summarizer=summarizer)
+        job = await manager.create_backfill_job(archive_source, dates=DATES)
+
+        await manager.run_backfill_job(job.job_id)
+        manager.close()
+
+        assert threads
+        assert all(name.startswith("backfill") for name in threads)
+
+    @pytest.mark.asyncio
+    async def test_dry_run_only_estimates(self, archive_source, tmp_path):
+        manager = BackfillManager(
+            archive_root=tmp_path,
+            cost_tracker=CostTracker(tmp_path / "cost-ledger.json"),
+        )
+        job = await manager.create_backfill_job(archive_source, dates=DATES, dry_run=True)
+
+        job = await manager.run_backfill_job(job.job_id)
+
+        assert job.status == BackfillStatus.COMPLETED
+        assert job.progress.completed == len(DATES)
+        assert job.progress.cost_usd > 0
+        assert not _meta_path(archive_source, tmp_path, DATES[0]).exists()
+        assert manager.cost_tracker.get_source_cost(archive_source.source_key) is None
+
+    @pytest.mark.asyncio
+    async def test_periods_use_local_day_boundaries(self, archive_source, tmp_path):
+        periods = []
+
+        def fetcher(source, start, end):
+            periods.append((start.isoformat(), end.isoformat()))
+            return _fetcher(source, start, end)
+
+        manager = _manager(tmp_path, fetcher=fetcher)
+        job = await manager.create_backfill_job(archive_source, dates=[date(2025, 7, 1)])
+
+        await manager.run_backfill_job(job.job_id, timezone="America/New_York")
+
+        assert periods == [("2025-07-01T00:00:00-04:00", "2025-07-01T23:59:59-04:00")]
+
+
+class TestAnalyzeBackfill:
+    """Tests for BackfillManager.analyze_backfill caching."""
+
+    def test_report_is_reused_within_ttl(self, archive_source, tmp_path, monkeypatch):
+        manager = _manager(tmp_path)
+        first = manager.analyze_backfill(archive_source, DATES[0], DATES[-1])
+
+        def fail_scan(*args, **kwargs):
+            raise AssertionError("scanner should not run for a cached report")
+
+        monkeypatch.setattr(manager.scanner, "scan_source", fail_scan)
+        assert manager.analyze_backfill(archive_source, DATES[0], DATES[-1]) is first
+
+        manager.analyze_ttl_seconds = 0
+        monkeypatch.undo()
+        assert manager.analyze_backfill(archive_source, DATES[0], DATES[-1]) is not first
+
+    @pytest.mark.asyncio
+    async def test_create_job_reuses_recent_analysis(self, archive_source, tmp_path, monkeypatch):
+        manager = _manager(tmp_path)
+        report = manager.analyze_backfill(archive_source, DATES[0], DATES[-1])
+
+        def fail_candidates(*args, **kwargs):
+            raise AssertionError("scanner should not run after a fresh analysis")
+
+        monkeypatch.setattr(manager.scanner, "get_backfill_candidates", fail_candidates)
+        job = await manager.create_backfill_job(
+            archive_source, start_date=DATES[0], end_date=DATES[-1]
+        )
+
+        assert job.dates == report.backfill_dates == DATES
+        assert job.dates is not report.backfill_dates
+
+    @pytest.mark.asyncio
+    async def test_written_summaries_invalidate_report(self, archive_source, tmp_path):
+        manager = _manager(tmp_path)
+        manager.analyze_backfill(archive_source, DATES[0], DATES[-1])
+
+        job = await manager.create_backfill_job(archive_source, dates=DATES[:1])
+        await manager.run_backfill_job(job.job_id)
+
+        assert not manager._analyze_cache
+
+
+class TestListJobs:
+    """Tests for BackfillManager.list_jobs."""
+
+    @pytest.mark.asyncio
+    async def test_filter_by_status(self, archive_source, tmp_path):
+        manager = _manager(tmp_path)
+        done = await manager.create_backfill_job(archive_source, dates=DATES[:1])
+        pending = await manager.create_backfill_job(archive_source, dates=DATES[1:2])
+        await manager.run_backfill_job(done.job_id)
+
+        assert manager.list_jobs(BackfillStatus.PENDING) == [pending]
+        assert manager.list_jobs(BackfillStatus.COMPLETED) == [done]
+        assert manager.list_jobs(BackfillStatus.RUNNING) == []
+        assert manager.list_jobs() == [done, pending]
+
+
+class TestDateClaims:
+    """Tests for per-date claim files."""
+
+    @pytest.mark.asyncio
+    async def test_claim_released_after_date(self, archive_source, tmp_path):
+        manager = _manager(tmp_path)
+        job = await manager.create_backfill_job(archive_source, dates=DATES[:1])
+
+        await manager.run_backfill_job(job.job_id)
+
+        meta = _meta_path(archive_source, tmp_path, DATES[0])
+        assert meta.exists()
+        assert not meta.with_name(meta.name + ".lock").exists()
+
+    @pytest.mark.asyncio
+    async def test_claimed_date_is_skipped(self, archive_source, tmp_path):
+        claim = _meta_path(archive_source, tmp_path, DATES[0]).with_suffix(".json.lock")
+        claim.parent.mkdir(parents=True)
+        claim.write_text("bf_other")
+        manager = _manager(tmp_path)
+        job = await manager.create_backfill_job(archive_source, dates=DATES[:2])
+
+        job = await manager.run_backfill_job(job.job_id)
+
+        assert job.progress.skipped == 1
+        assert job.progress.completed == 1
+        assert claim.read_text() == "bf_other"
+
+    @pytest.mark.asyncio
+    async def test_stale_claim_is_taken_over(self, archive_source, tmp_path):
+        claim = _meta_path(archive_source, tmp_path, DATES[0]).with_suffix(".json.lock")
+        claim.parent.mkdir(parents=True)
+        claim.write_text("bf_crashed")
+        stale = time.time() - 3600
+        os.utime(claim, (stale, stale))
+        manager = _manager(tmp_path)
+        job = await manager.create_backfill_job(archive_source, dates=DATES[:1])
+
+        job = await manager.run_backfill_job(job.job_id)
+
+        assert job.progress.completed == 1
+        assert not claim.exists()
+
+    @pytest.mark.asyncio
+    async def test_claim_taken_over_mid_run_is_left_in_place(self, archive_source, tmp_path):
+        claim = _meta_path(archive_source, tmp_path, DATES[0]).with_suffix(".json.lock")
+
+        def fetcher(source, start, end):
+            # Another worker took the claim over while this one was working
+            claim.write_text("bf_other")
+            return _fetcher(source, start, end)
+
+        manager = _manager(tmp_path, fetcher=fetcher)
+        job = await manager.create_backfill_job(archive_source, dates=DATES[:1])
+
+        job = await manager.run_backfill_job(job.job_id)
+
+        assert job.progress.completed == 1
+        assert claim.read_text() == "bf_other"
+
+    @pytest.mark.asyncio
+    async def test_complete_summary_is_not_regenerated(self, archive_source, tmp_path):
+        manager = _manager(tmp_path)
+        job = await manager.create_backfill_job(archive_source, dates=DATES[:1])
+        await manager.run_backfill_job(job.job_id)
+
+        job = await manager.create_backfill_job(archive_source, dates=DATES[:1])
+        job = await manager.run_backfill_job(job.job_id)
+
+        assert job.progress.skipped == 1
+        assert job.progress.completed == 0
+
+
+class TestBackfillJobToDict:
+    """Tests for BackfillJob serialization caching."""
+
+    def test_to_dict_reflects_progress_changes(self, archive_source):
+        job = BackfillJob(job_id="bf_1", source=archive_source, dates=DATES)
+        first = job.to_dict()
+        assert job.to_dict() == first
+
+        job.status = BackfillStatus.RUNNING
+        job.progress.total_periods = 5
+        job.progress.completed += 1
+
+        data = job.to_dict()
+        assert data["status"] == "running"
+        assert data["progress"]["completed"] == 1
+        assert data["progress"]["percent_complete"] == 20.0
+
+    def test_returned_dict_is_a_copy(self, archive_source):
+        job = BackfillJob(job_id="bf_1", source=archive_source, dates=DATES)
+        job.to_dict()["progress"]["completed"] = 99
+
+        assert job.to_dict()["progress"]["completed"] == 0
+
+
+class TestMessageStats:
+    """Tests for message and participant counting."""
+
+    def test_row_messages(self):
+        assert _message_stats(_fetcher(None, None, None)) == (3, 2)
+        assert _message_stats([{"content": "no author"}]) == (1, 0)
+
+    def test_columnar_messages(self):
+        assert _message_stats({"author_id": np.array([7, 8, 7, 7])}) == (4, 2)
+        assert _message_stats({"author_id": np.array(["a", None, "a"], dtype=object)}) == (3, 1)
+        assert _message_stats({"author_id": np.array([])}) == (0, 0)
@@ -0,0 +1,300 @@
+"""
+Tests for cost tracking and pricing.
+"""
+
+import asyncio
+import json
+import os
+from datetime import datetime
+
+import httpx
+import pytest
+
+from src.archive import cost_tracker
+from src.archive.cost_tracker import CostTracker, PricingTable
+from src.archive.models import CostEntry
+from src.utils.time import utc_now_naive
+
+
+def _entry(source_key: str = "discord:123") -> CostEntry:
+    return CostEntry(
+        source_key=source_key,
+        summary_id="sum_1",
+        timestamp=datetime(2026, 2, 14),
+        model="anthropic/claude-3-haiku",
+        tokens_input=1000,
+        tokens_output=200,
+        cost_usd=0.0015,
+        pricing_version="2026-02-01",
+    )
+
+
+class TestLedgerPersistence:
+    """Tests for reading and writing the cost ledger."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_ledger_roundtrip(self, tmp_path, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr(cost_tracker, "orjson", None)
+        ledger_path = tmp_path / "cost-ledger.json"
+        tracker = CostTracker(ledger_path)
+        tracker.record_costs_bulk([_entry(), _entry("discord:456")])
+
+        reloaded = CostTracker(ledger_path)
+
+        assert reloaded.get_total_cost() == pytest.approx(0.003)
+        assert reloaded.get_monthly_cost("discord:456", 2026, 2).summaries == 1
+
+    def test_ledger_keeps_full_precision(self, tmp_path):
+        ledger_path = tmp_path / "cost-ledger.json"
+        entries = [_entry() for _ in range(3)]
+        for entry in entries:
+            entry.cost_usd = 0.00004
+        CostTracker(ledger_path).record_costs_bulk(entries)
+
+        reloaded = CostTracker(ledger_path)
+
+        assert reloaded.get_total_cost() == pytest.approx(0.00012)
+        assert reloaded.get_source_cost("discord:123").total_cost_usd == pytest.approx(0.00012)
+        assert reloaded.get_monthly_cost("discord:123", 2026, 2).cost_usd == pytest.approx(0.00012)
+
+    def test_monthly_costs_accumulate_exactly(self, tmp_path):
+        ledger_path = tmp_path / "cost-ledger.json"
+        entries = [_entry() for _ in range(1000)]
+        for entry in entries:
+            entry.cost_usd = 0.000123
+        CostTracker(ledger_path).record_costs_bulk(entries)
+
+        monthly = CostTracker(ledger_path).get_monthly_cost("discord:123", 2026, 2)
+
+        assert monthly.cost_micros == 123_000
+        assert monthly.cost_usd == 0.123
+
+    def test_legacy_monthly_cost_usd_loads(self, tmp_path):
+        ledger_path = tmp_path / "cost-ledger.json"
+        ledger_path.write_text(json.dumps({
+            "total_cost_usd": 0.5,
+            "total_summaries": 1,
+            "sources": {"discord:123": {
+                "server_name": "Guild",
+                "total_cost_usd": 0.5,
+                "summary_count": 1,
+                "monthly": {"2026-02": {"cost_usd": 0.5, "summaries": 1}},
+            }},
+        }))
+
+        monthly = CostTracker(ledger_path).get_monthly_cost("discord:123", 2026, 2)
+
+        assert monthly.cost_micros == 500_000
+
+    def test_orjson_and_json_write_the_same_ledger(self, tmp_path, monkeypatch):
+        if cost_tracker.orjson is None:
+            pytest.skip("orjson not installed")
+        ledger_path = tmp_path / "cost-ledger.json"
+        CostTracker(ledger_path).record_costs_bulk([_entry(), _entry("discord:456")])
+        with_orjson = json.loads(ledger_path.read_bytes())
+
+        # Reloading marks every source for re-serialization
+        monkeypatch.setattr(cost_tracker, "orjson", None)
+        CostTracker(ledger_path)._save_ledger()
+        with_json = json.loads(ledger_path.read_bytes())
+
+        assert with_orjson == with_json
+        source = with_orjson["sources"]["discord:123"]
+        assert source["last_updated"] and source["last_updated_ts"]
+        assert source["monthly"]["2026-02"]["cost_usd"] == pytest.approx(0.0015)
+
+    def test_failed_save_keeps_previous_ledger(self, tmp_path, monkeypatch):
+        ledger_path = tmp_path / "cost-ledger.json"
+        tracker = CostTracker(ledger_path)
+        tracker.record_costs_bulk([_entry()])
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(cost_tracker.os, "replace", fail_replace)
+        with pytest.raises(OSError):
+            tracker.record_costs_bulk([_entry()])
+        monkeypatch.undo()
+
+        assert CostTracker(ledger_path).get_source_cost("discord:123").summary_count == 1
+        assert [p.name for p in tmp_path.iterdir()] == ["cost-ledger.json"]
+
+    def test_ledger_follows_umask(self, tmp_path):
+        umask = os.umask(0)
+        os.umask(umask)
+        ledger_path = tmp_path / "cost-ledger.json"
+        CostTracker(ledger_path).record_costs_bulk([_entry()])
+
+        assert ledger_path.stat().st_mode & 0o777 == 0o666 & ~umask
+
+    def test_last_updated_survives_reload(self, tmp_path):
+        ledger_path = tmp_path / "cost-ledger.json"
+        tracker = CostTracker(ledger_path)
+        tracker.record_costs_bulk([_entry()])
+        before = tracker.get_source_cost("discord:123")
+
+        after = CostTracker(ledger_path).get_source_cost("discord:123")
+
+        assert after.last_updated_ts == before.last_updated_ts
+        assert after.last_updated == before.last_updated
+
+    def test_legacy_iso_last_updated(self, tmp_path):
+        ledger_path = tmp_path / "cost-ledger.json"
+        ledger_path.write_text(json.dumps({"sources": {
+            "discord:123": {"server_name": "Test", "last_updated": "2026-02-14T12:30:00"},
+        }}))
+
+        source = CostTracker(ledger_path).get_source_cost("discord:123")
+
+        assert source.last_updated == datetime(2026, 2, 14, 12, 30)
+        assert source.to_dict()["last_updated"] == "2026-02-14T12:30:00"
+
+
+class TestCostReport:
+    """Tests for the per-source cost report."""
+
+    def test_report_rounds_costs_per_source(self, tmp_path):
+        tracker = CostTracker(tmp_path / "cost-ledger.json")
+        current = _entry("discord:123")
+        current.timestamp = utc_now_naive()
+        current.cost_usd = 0.123456
+        tracker.record_costs_bulk([current, _entry("discord:456")])
+
+        report = tracker.get_cost_report()
+
+        assert report["period"] == current.timestamp.strftime("%Y-%m")
+        assert report["total_summaries"] == 2
+        by_key = {source["source_key"]: source for source in report["sources"]}
+        assert by_key["discord:123"]["total_cost_usd"] == 0.1235
+        assert by_key["discord:123"]["current_month"]["cost_usd"] == 0.1235
+        assert by_key["discord:456"]["total_cost_usd"] == 0.0015
+        assert by_key["discord:456"]["current_month"] == {
+            "cost_usd": 0.0,
+            "summaries": 0,
+            "tokens_input": 0,
+            "tokens_output": 0,
+        }
+
+    def test_empty_report(self, tmp_path):
+        report = CostTracker(tmp_path / "cost-ledger.json").get_cost_report()
+        assert report["sources"] == []
+        assert report["total_cost_usd"] == 0
+
+
+class TestCheckBudget:
+    """Tests for current-month budget checks."""
+
+    def test_budget_tracks_current_month_costs(self, tmp_path):
+        tracker = CostTracker(tmp_path / "cost-ledger.json")
+        current = _entry()
+        current.timestamp = utc_now_naive()
+        tracker.record_costs_bulk([current, _entry()])
+
+        assert tracker.check_budget("discord:123", 1.0) == (True, 0.0015, 0.9985)
+        tracker.record_costs_bulk([current])
+        assert tracker.get_current_month_cost("discord:123") == pytest.approx(0.003)
+        assert tracker.check_budget("discord:456", 1.0) == (True, 0.0, 1.0)
+        assert tracker.check_budget("discord:123", None) == (True, 0.0, float("inf"))
+
+    def test_month_rollover_rebuilds_costs(self, tmp_path):
+        tracker = CostTracker(tmp_path / "cost-ledger.json")
+        current = _entry()
+        current.timestamp = utc_now_naive()
+        tracker.record_costs_bulk([current])
+        assert tracker.get_current_month_cost("discord:123") == 0.0015
+
+        # Pretend the cached month ended and belonged to the February entry
+        tracker._current_month_key = "2026-02"
+        tracker._current_month_costs = {"discord:123": 99.0}
+        tracker._current_month_ends_ts = 0.0
+
+        assert tracker.get_current_month_cost("discord:123") == 0.0015
+
+
+class TestCalculateCosts:
+    """Tests for PricingTable.calculate_costs."""
+
+    def test_matches_scalar_calculation(self):
+        pricing = PricingTable()
+        models = ["anthropic/claude-3-haiku", "anthropic/claude-opus-4", "anthropic/claude-3-haiku"]
+        tokens_in = [1000, 2500, 123457]
+        tokens_out = [200, 700, 9876]
+
+        costs = pricing.calculate_costs(models, tokens_in, tokens_out)
+
+        expected = [
+            pricing.calculate_cost(m, ti, to)[0]
+            for m, ti, to in zip(models, tokens_in, tokens_out)
+        ]
+        assert costs.tolist() == pytest.approx(expected)
+
+    def test_empty_input(self):
+        assert PricingTable().calculate_costs([], [], []).size == 0
+
+
+class TestFetchOpenRouterPricing:
+    """Tests for PricingTable.fetch_openrouter_pricing."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_reuse_shared_client(self, tmp_path):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(200, json={"data": [
+                {"id": "vendor/model", "pricing": {"prompt": "0.000001", "completion": "0.000002"}},
+            ]})
+
+        pricing = PricingTable(tmp_path / "pricing.json")
+        pricing._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = await pricing._get_client()
+
+        assert await pricing.fetch_openrouter_pricing("sk-test")
+        assert await pricing.fetch_openrouter_pricing("sk-test")
+        assert await pricing._get_client() is client
+        assert len(calls) == 2
+        assert pricing.get_pricing("vendor/model")[:2] == pytest.approx((0.001, 0.002))
+
+        await pricing.close()
+        assert pricing._client is None
+
+    @pytest.mark.asyncio
+    async def test_refresh_all_fetches_keys_concurrently(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cost_tracker, "_PRICING_FETCH_CONCURRENCY", 2)
+        calls = []
+        active = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            calls.append(request.headers["Authorization"])
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if request.headers["Authorization"] == "Bearer sk-bad":
+                return httpx.Response(401)
+            return httpx.Response(200, json={"data": [
+                {"id": "vendor/model", "pricing": {"prompt": "0.000001", "completion": "0.000002"}},
+            ]})
+
+        pricing = PricingTable(tmp_path / "pricing.json")
+        pricing._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        assert await pricing.refresh_all(["sk-bad", "sk-a", "sk-b", "sk-a"])
+        assert sorted(calls) == ["Bearer sk-a", "Bearer sk-b", "Bearer sk-bad"]
+        assert peak == 2
+        assert pricing.get_pricing("vendor/model")[:2] == pytest.approx((0.001, 0.002))
+        await pricing.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_keeps_pricing(self, tmp_path):
+        pricing = PricingTable(tmp_path / "pricing.json")
+        pricing._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(503))
+        )
+
+        assert not await pricing.fetch_openrouter_pricing("sk-test")
+        assert "vendor/model" not in pricing._sorted_versions[-1][2]
+        await pricing.close()
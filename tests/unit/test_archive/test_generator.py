@@ -0,0 +1,594 @@
+"""
+Tests for retrospective summary generation.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+
+import pytest
+
+from src.archive.cost_tracker import CostTracker
+from src.archive.generator import (
+    JobStatus,
+    RetrospectiveGenerator,
+    _collect_messages,
+    _summary_statistics,
+)
+
+
+@dataclass
+class _SummaryResult:
+    content: str = "Summary"
+    model: str = "anthropic/claude-3-haiku"
+    tokens_input: int = 1000
+    tokens_output: int = 200
+    prompt_version: str = "1"
+    prompt_checksum: str = "abc"
+
+
+@dataclass
+class _ResolvedKey:
+    key: str = "sk-test"
+    source: str = "default"
+    api_key_used: str = "default"
+
+
+class _SummarizationService:
+    """Records how many summaries are generated at once."""
+
+    def __init__(self, delay: float = 0.01, result: _SummaryResult = None):
+        self.delay = delay
+        self.result = result or _SummaryResult()
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+
+    async def generate_summary(self, **kwargs):
+        self.calls += 1
+        self.messages = kwargs["messages"]
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return self.result
+
+
+class _SourceRegistry:
+    def __init__(self):
+        self.calls = 0
+
+    def get_manifest(self, source_key):
+        self.calls += 1
+        return None
+
+
+class _ApiKeyResolver:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_key_for_source(self, source_key, manifest):
+        self.calls += 1
+        return _ResolvedKey()
+
+
+async def _fetcher(source, start, end):
+    return [
+        {"author_id": "a", "content": "hello there"},
+        {"author_id": "b", "content": "hi"},
+    ]
+
+
+def _generator(tmp_path, service=None, max_concurrent=3) -> RetrospectiveGenerator:
+    return RetrospectiveGenerator(
+        archive_root=tmp_path,
+        summarization_service=service or _SummarizationService(),
+        source_registry=_SourceRegistry(),
+        cost_tracker=CostTracker(tmp_path / "cost-ledger.json"),
+        api_key_resolver=_ApiKeyResolver(),
+        max_concurrent=max_concurrent,
+    )
+
+
+class TestRunJob:
+    """Tests for RetrospectiveGenerator.run_job."""
+
+    @pytest.mark.asyncio
+    async def test_periods_generate_concurrently(self, archive_source, tmp_path):
+        service = _SummarizationService()
+        generator = _generator(tmp_path, service, max_concurrent=3)
+        job = await generator.create_job(
+            archive_source, date(2025, 1, 1), date(2025, 1, 8), skip_existing=False
+        )
+        updates = []
+
+        async def on_progress(job):
+            updates.append(job.progress.completed)
+
+        job = await generator.run_job(job.job_id, _fetcher, on_progress)
+
+        assert job.status == JobStatus.COMPLETED
+        assert job.progress.completed == 8
+        assert len(job.summary_ids) == 8
+        assert service.peak == 3
+        assert updates == list(range(1, 9))
+        assert job.cost.reserved_usd == pytest.approx(0)
+
+    @pytest.mark.asyncio
+    async def test_max_concurrent_can_change_while_running(self, archive_source, tmp_path):
+        service = _SummarizationService()
+        generator = _generator(tmp_path, service, max_concurrent=1)
+        job = await generator.create_job(archive_source, date(2025, 1, 1), date(2025, 1, 10))
+
+        async def on_progress(job):
+            if job.progress.completed == 1:
+                await generator.set_max_concurrent(4)
+
+        job = await generator.run_job(job.job_id, _fetcher, on_progress)
+
+        assert job.progress.completed == 10
+        assert service.peak == 4
+        assert generator._inflight == 0
+
+    @pytest.mark.asyncio
+    async def test_max_concurrent_must_be_positive(self, tmp_path):
+        with pytest.raises(ValueError):
+            await _generator(tmp_path).set_max_concurrent(0)
+
+    @pytest.mark.asyncio
+    async def test_fetch_window_per_granularity(self, archive_source, tmp_path):
+        windows = []
+
+        async def fetcher(source, start, end):
+            windows.append((start, end))
+            return await _fetcher(source, start, end)
+
+        generator = _generator(tmp_path)
+        daily = await generator.create_job(
+            archive_source, date(2025, 1, 2), date(2025, 1, 2), skip_existing=False
+        )
+        weekly = await generator.create_job(
+            archive_source, date(2025, 1, 12), date(2025, 1, 12), granularity="weekly",
+            schedule_days=[0], skip_existing=False,
+        )
+        await generator.run_job(daily.job_id, fetcher)
+        await generator.run_job(weekly.job_id, fetcher)
+
+        utc = timezone.utc
+        assert windows == [
+            (datetime(2025, 1, 1, 23, 59, 59, tzinfo=utc), datetime(2025, 1, 2, 23, 59, 59, tzinfo=utc)),
+            (datetime(2025, 1, 5, 23, 59, 59, tzinfo=utc), datetime(2025, 1, 12, 23, 59, 59, tzinfo=utc)),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_costs_recorded_in_batches(self, archive_source, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.archive.generator._COST_FLUSH_EVERY", 3)
+        generator = _generator(tmp_path)
+        batches = []
+        record_costs_bulk = generator.cost_tracker.record_costs_bulk
+
+        def record(entries):
+            batches.append(len(entries))
+            record_costs_bulk(entries)
+
+        monkeypatch.setattr(generator.cost_tracker, "record_costs_bulk", record)
+        job = await generator.create_job(
+            archive_source, date(2025, 1, 1), date(2025, 1, 7), skip_existing=False
+        )
+
+        await generator.run_job(job.job_id, _fetcher)
+
+        assert batches == [3, 3, 1]
+        assert generator.cost_tracker.get_source_cost("discord:123").summary_count == 7
+        assert not generator._cost_batch
+
+    @pytest.mark.asyncio
+    async def test_api_key_resolved_once_per_run(self, archive_source, tmp_path):
+        generator = _generator(tmp_path, max_concurrent=1)
+        job = await generator.create_job(
+            archive_source, date(2025, 1, 1), date(2025, 1, 5), skip_existing=False
+        )
+
+        job = await generator.run_job(job.job_id, _fetcher)
+
+        assert job.progress.completed == 5
+        assert generator.source_registry.calls == 1
+        assert generator.api_key_resolver.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_existing_summaries_scanned_once(self, archive_source, tmp_path, monkeypatch):
+        scans = []
+
+        async def existing_dates(source, start_date, end_date):
+            scans.append((source.source_key, start_date, end_date))
+            return {date(2025, 1, 2)}
+
+        monkeypatch.setattr("src.archive.generator.existing_summary_dates_in_db", existing_dates)
+        generator = _generator(tmp_path)
+        job = await generator.create_job(archive_source, date(2025, 1, 1), date(2025, 1, 4))
+
+        job = await generator.run_job(job.job_id, _fetcher)
+
+        assert scans == [("discord:123", date(2025, 1, 1), date(2025, 1, 4))]
+        assert job.progress.skipped_exists == 1
+        assert job.progress.completed == 3
+
+    @pytest.mark.asyncio
+    async def test_duplicate_run_is_ignored(self, archive_source, tmp_path):
+        service = _SummarizationService()
+        generator = _generator(tmp_path, service)
+        job = await generator.create_job(
+            archive_source, date(2025, 1, 1), date(2025, 1, 4), skip_existing=False
+        )
+
+        first = asyncio.create_task(generator.run_job(job.job_id, _fetcher))
+        await asyncio.sleep(0)
+        duplicate = await generator.run_job(job.job_id, _fetcher)
+        assert duplicate.status == JobStatus.RUNNING
+        await first
+
+        assert job.status == JobStatus.COMPLETED
+        assert service.calls == 4
+        assert job.progress.completed == 4
+        assert not generator._running_jobs
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_queued_periods(self, archive_source, tmp_path):
+        service = _SummarizationService()
+        generator = _generator(tmp_path, service, max_concurrent=2)
+        job = await generator.create_job(
+            archive_source, date(2025, 1, 1), date(2025, 1, 10), skip_existing=False
+        )
+
+        async def on_progress(job):
+            await generator.cancel_job(job.job_id)
+
+        job = await generator.run_job(job.job_id, _fetcher, on_progress)
+
+        assert job.status == JobStatus.CANCELLED
+        # Periods already in flight finish; queued ones never start
+        assert service.calls < 10
+        assert job.progress.completed == service.calls
+
+    @pytest.mark.asyncio
+    async def test_concurrent_periods_respect_budget(self, archive_source, tmp_path):
+        # Match the generator's pre-call estimate for two messages
+        service = _SummarizationService(result=_SummaryResult(tokens_input=520, tokens_output=104))
+        generator = _generator(tmp_path, service, max_concurrent=4)
+        per_summary, _ = generator.cost_tracker.pricing.calculate_cost(
+            "anthropic/claude-3-haiku", 520, 104
+        )
+        job = await generator.create_job(
+            archive_source, date(2025, 1, 1), date(2025, 1, 10),
+            skip_existing=False, max_cost_usd=per_summary * 2.5,
+        )
+
+        job = await generator.run_job(job.job_id, _fetcher)
+
+        assert job.status == JobStatus.PAUSED
+        assert job.pause_reason == "budget_exceeded"
+        assert service.calls == 2
+        assert job.cost.cost_usd <= job.max_cost_usd
+        assert job.cost.reserved_usd == pytest.approx(0)
+
+    @pytest.mark.asyncio
+    async def test_streaming_fetcher(self, archive_source, tmp_path):
+        def fetcher(source, start, end):
+            async def stream():
+                for message in await _fetcher(source, start, end):
+                    yield message
+            return stream()
+
+        service = _SummarizationService()
+        generator = _generator(tmp_path, service)
+        job = await generator.create_job(
+            archive_source, date(2025, 1, 1), date(2025, 1, 2), skip_existing=False
+        )
+
+        job = await generator.run_job(job.job_id, fetcher)
+
+        assert job.progress.completed == 2
+        assert service.messages == await _fetcher(None, None, None)
+
+    @pytest.mark.asyncio
+    async def test_overlapping_jobs_share_periods(self, archive_source, tmp_path):
+        service = _SummarizationService(delay=0.02)
+        generator = _generator(tmp_path, service, max_concurrent=4)
+        first = await generator.create_job(
+            archive_source, date(2025, 1, 1), date(2025, 1, 6), skip_existing=False
+        )
+        second = await generator.create_job(
+            archive_source, date(2025, 1, 4), date(2025, 1, 9), skip_existing=False
+        )
+
+        first, second = await asyncio.gather(
+            generator.run_job(first.job_id, _fetcher),
+            generator.run_job(second.job_id, _fetcher),
+        )
+
+        # Nine distinct days, each summarized once
+        assert service.calls == 9
+        assert first.progress.completed + second.progress.completed == 9
+        # Shared while in flight (exists) or already written (locked)
+        assert first.progress.skipped + second.progress.skipped == 3
+        assert len(first.summary_ids) + len(second.summary_ids) == 9
+        assert not generator._period_futures
+
+    @pytest.mark.asyncio
+    async def test_waiting_on_shared_period_does_not_hold_a_slot(self, archive_source, tmp_path):
+        service = _SummarizationService(delay=0.05)
+        generator = _generator(tmp_path, service, max_concurrent=2)
+        first = await generator.create_job(
+            archive_source, date(2025, 1, 1), date(2025, 1, 1), skip_existing=False
+        )
+        second = await generator.create_job(
+            archive_source, date(2025, 1, 1), date(2025, 1, 2), skip_existing=False
+        )
+
+        await asyncio.gather(
+            generator.run_job(first.job_id, _fetcher),
+            generator.run_job(second.job_id, _fetcher),
+        )
+
+        # The second job's other day ran while its first day waited
+        assert service.calls == 2
+        assert service.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_waiting_job_generates_after_failed_shared_period(self, archive_source, tmp_path):
+        generator = _generator(tmp_path)
+        job = await generator.create_job(archive_source, date(2025, 1, 1), date(2025, 1, 1))
+        release = asyncio.Event()
+        calls = []
+
+        async def generate(result):
+            calls.append(result)
+            await release.wait()
+            return result
+
+        owner = asyncio.create_task(
+            generator._generate_period(job, date(2025, 1, 1), archive_source, lambda: generate("failed"))
+        )
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(
+            generator._generate_period(job, date(2025, 1, 1), archive_source, lambda: generate("completed"))
+        )
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await owner == "failed"
+        assert await waiter == "completed"
+        assert calls == ["failed", "completed"]
+
+    @pytest.mark.asyncio
+    async def test_jobs_with_other_options_do_not_share_periods(self, archive_source, tmp_path):
+        generator = _generator(tmp_path)
+        normal = await generator.create_job(archive_source, date(2025, 1, 1), date(2025, 1, 1))
+        others = [
+            await generator.create_job(
+                archive_source, date(2025, 1, 1), date(2025, 1, 1), force_regenerate=True
+            ),
+            await generator.create_job(
+                archive_source, date(2025, 1, 1), date(2025, 1, 1), lookback_hours=48
+            ),
+        ]
+        release = asyncio.Event()
+
+        async def generate():
+            await release.wait()
+            return "completed"
+
+        tasks = [
+            asyncio.create_task(generator._generate_period(job, date(2025, 1, 1), archive_source, generate))
+            for job in [normal, *others]
+        ]
+        await asyncio.sleep(0)
+        assert len(generator._period_futures) == 3
+        release.set()
+
+        assert await asyncio.gather(*tasks) == ["completed"] * 3
+
+
+class _SummaryJobRepository:
+    """In-memory stand-in for the ADR-013 summary job repository."""
+
+    def __init__(self):
+        self.jobs = {}
+        self.gets = 0
+
+    async def get(self, job_id):
+        self.gets += 1
+        return self.jobs.get(job_id)
+
+    async def save(self, job):
+        self.jobs[job.id] = job
+        return job.id
+
+    async def update(self, job):
+        # Like the SQLite repository, only progress columns are rewritten
+        stored = self.jobs[job.id]
+        stored.status = job.status
+        stored.progress_current = job.progress_current
+        stored.cost_usd = job.cost_usd
+        return True
+
+
+class TestJobPersistence:
+    """Tests for ADR-013 job persistence."""
+
+    @pytest.mark.asyncio
+    async def test_restored_job_keeps_parameters(self, archive_source, tmp_path):
+        repository = _SummaryJobRepository()
+        generator = _generator(tmp_path)
+        generator.summary_job_repository = repository
+        job = await generator.create_job(
+            archive_source, date(2025, 1, 5), date(2025, 1, 19), granularity="weekly",
+            timezone="Europe/Berlin", max_cost_usd=2.5, schedule_days=[0],
+            per_channel=True, min_channel_messages=10, lookback_hours=48,
+            skip_existing=False,
+        )
+
+        restarted = _generator(tmp_path)
+        restarted.summary_job_repository = repository
+        restored = await restarted.restore_job_from_db(job.job_id)
+
+        assert restored.status == JobStatus.PAUSED
+        assert restored.timezone == "Europe/Berlin"
+        assert restored.max_cost_usd == restored.cost.max_cost_usd == 2.5
+        assert restored.schedule_days == [0]
+        assert restored.per_channel is True
+        assert restored.min_channel_messages == 10
+        assert restored.lookback_hours == 48
+        assert restored.skip_existing is False
+        assert restored.source.source_key == "discord:123"
+
+    @pytest.mark.asyncio
+    async def test_progress_writes_skip_existence_check(self, archive_source, tmp_path):
+        repository = _SummaryJobRepository()
+        generator = _generator(tmp_path)
+        generator.summary_job_repository = repository
+        job = await generator.create_job(
+            archive_source, date(2025, 1, 1), date(2025, 1, 10), skip_existing=False
+        )
+
+        job = await generator.run_job(job.job_id, _fetcher)
+
+        assert repository.gets == 1
+        assert repository.jobs[job.job_id].status.value == "completed"
+        assert repository.jobs[job.job_id].progress_current == 10
+
+
+class TestGenerationJobToDict:
+    """Tests for GenerationJob.to_dict."""
+
+    @pytest.mark.asyncio
+    async def test_reflects_progress_and_reuses_static_fields(self, archive_source, tmp_path):
+        generator = _generator(tmp_path)
+        job = await generator.create_job(archive_source, date(2025, 1, 1), date(2025, 1, 3))
+
+        first = job.to_dict()
+        first["date_range"]["start"] = "mutated"
+        job.status = JobStatus.RUNNING
+        job.progress.completed = 2
+        job.cost.cost_usd = 0.5
+        second = job.to_dict()
+
+        assert second["status"] == "running"
+        assert second["progress"]["completed"] == 2
+        assert second["cost"]["cost_usd"] == 0.5
+        assert second["date_range"] == {"start": "2025-01-01", "end": "2025-01-03"}
+        assert second["source_key"] == "discord:123"
+        assert second["created_at"] == job.created_at.isoformat()
+
+
+class TestGeneratePeriods:
+    """Tests for period calculation."""
+
+    @pytest.mark.asyncio
+    async def test_create_job_stores_periods(self, archive_source, tmp_path):
+        generator = _generator(tmp_path)
+        job = await generator.create_job(archive_source, date(2025, 1, 1), date(2025, 1, 3))
+
+        assert job.periods == [(date(2025, 1, d), date(2025, 1, d)) for d in (1, 2, 3)]
+        assert job.progress.total_periods == 3
+
+    def test_monthly_periods(self, tmp_path):
+        periods = list(_generator(tmp_path)._generate_periods(
+            date(2024, 1, 15), date(2024, 3, 10), "monthly"
+        ))
+
+        assert periods == [
+            (date(2024, 1, 15), date(2024, 1, 31)),
+            (date(2024, 2, 1), date(2024, 2, 29)),
+            (date(2024, 3, 1), date(2024, 3, 10)),
+        ]
+
+    def test_weekly_schedule_days(self, tmp_path):
+        # 0=Sun, 3=Wed in the dashboard's JS weekday numbering
+        periods = _generator(tmp_path)._generate_periods(
+            date(2025, 1, 1), date(2025, 1, 12), "weekly", schedule_days=[0, 3]
+        )
+
+        assert [start for start, _ in periods] == [
+            date(2025, 1, 1), date(2025, 1, 5), date(2025, 1, 8), date(2025, 1, 12),
+        ]
+
+    def test_unknown_granularity(self, tmp_path):
+        with pytest.raises(ValueError):
+            _generator(tmp_path)._generate_periods(date(2025, 1, 1), date(2025, 1, 2), "hourly")
+
+    def test_monthly_periods_cross_year(self, tmp_path):
+        periods = list(_generator(tmp_path)._generate_periods(
+            date(2024, 12, 1), date(2025, 1, 31), "monthly"
+        ))
+
+        assert periods == [
+            (date(2024, 12, 1), date(2024, 12, 31)),
+            (date(2025, 1, 1), date(2025, 1, 31)),
+        ]
+
+
+class TestMetaPath:
+    """Tests for lock metadata paths."""
+
+    @pytest.mark.asyncio
+    async def test_summary_dir_resolved_once_per_source(self, archive_source, tmp_path):
+        generator = _generator(tmp_path)
+        job = await generator.create_job(archive_source, date(2025, 1, 1), date(2025, 1, 3))
+
+        path = generator._get_meta_path(job, archive_source, date(2025, 3, 7))
+        generator._get_meta_path(job, archive_source, date(2025, 3, 8))
+
+        assert path == (
+            archive_source.get_archive_path(tmp_path) / "2025" / "03" / "2025-03-07_daily.meta.json"
+        )
+        assert list(job._summary_dirs) == ["discord:123"]
+
+
+class TestSummaryStatistics:
+    """Tests for _summary_statistics."""
+
+    def test_counts_in_one_pass(self):
+        stats = _summary_statistics([
+            {"author_id": "a", "content": "hello  there\nfriend"},
+            {"author_id": "b", "content": ""},
+            {"author_id": "a"},
+            {"author_id": "c", "content": None},
+        ])
+
+        assert stats.message_count == 4
+        assert stats.participant_count == 3
+        assert stats.word_count == 3
+
+    def test_large_batch_counts_like_split(self):
+        contents = ["hello  there\tfriend", " \x1cpadded\r\n", "", "naïve\u00a0café", "x"]
+        messages = [
+            {"author_id": str(i % 7), "content": contents[i % len(contents)]}
+            for i in range(1000)
+        ]
+
+        stats = _summary_statistics(messages)
+
+        assert stats.participant_count == 7
+        assert stats.word_count == sum(len(m["content"].split()) for m in messages)
+        ascii_only = [m for m in messages if m["content"].isascii()]
+        assert _summary_statistics(ascii_only * 2).word_count == 2 * sum(
+            len(m["content"].split()) for m in ascii_only
+        )
+
+    @pytest.mark.asyncio
+    async def test_streamed_counts_match(self):
+        messages = [
+            {"author_id": "a", "content": "one two"},
+            {"author_id": "b", "content": None},
+            {"author_id": "a", "content": " three "},
+        ]
+
+        async def stream():
+            for message in messages:
+                yield message
+
+        collected, stats = await _collect_messages(stream())
+
+        assert collected == messages
+        assert stats == _summary_statistics(messages)
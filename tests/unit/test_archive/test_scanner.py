@@ -0,0 +1,46 @@
+"""
+Tests for the archive scanner.
+"""
+
+import json
+from datetime import date
+
+from src.archive.scanner import ArchiveScanner
+
+
+def _write_meta(source, root, day: date, status: str = "complete"):
+    month_dir = source.get_archive_path(root) / str(day.year) / f"{day.month:02d}"
+    month_dir.mkdir(parents=True, exist_ok=True)
+    meta_path = month_dir / f"{day.isoformat()}_daily.meta.json"
+    meta_path.write_text(json.dumps({
+        "period": {"start": f"{day.isoformat()}T00:00:00+00:00"},
+        "status": status,
+    }))
+    return meta_path
+
+
+class TestBackfillCandidates:
+    """Tests for ArchiveScanner.get_backfill_candidates."""
+
+    def test_candidates_limited_to_range(self, archive_source, tmp_path):
+        _write_meta(archive_source, tmp_path, date(2024, 3, 1))
+        _write_meta(archive_source, tmp_path, date(2024, 3, 4))
+        scanner = ArchiveScanner(tmp_path)
+
+        candidates = scanner.get_backfill_candidates(
+            archive_source, start_date=date(2024, 3, 1), end_date=date(2024, 3, 5)
+        )
+
+        assert candidates == [date(2024, 3, 2), date(2024, 3, 3), date(2024, 3, 5)]
+
+    def test_out_of_range_directories_are_skipped(self, archive_source, tmp_path):
+        in_range = _write_meta(archive_source, tmp_path, date(2024, 3, 1))
+        _write_meta(archive_source, tmp_path, date(2023, 12, 31))
+        _write_meta(archive_source, tmp_path, date(2024, 4, 1))
+        scanner = ArchiveScanner(tmp_path)
+
+        paths = list(scanner._iter_meta_files(
+            archive_source.get_archive_path(tmp_path), date(2024, 3, 1), date(2024, 3, 31)
+        ))
+
+        assert paths == [in_range]
@@ -8,7 +8,7 @@ import tempfile
 from datetime import datetime
 from pathlib import Path
 
-from src.archive.importers.whatsapp import WhatsAppImporter
+from src.archive.importers.whatsapp import WhatsAppImporter, WhatsAppMessage
 
 
 class TestMessageFingerprint:
@@ -144,3 +144,163 @@ class TestDeduplication:
         )
 
         assert messages == []
+
+
+_EXPORT = """[15/01/2025, 10:30:00] Messages and calls are end-to-end encrypted. Tap to learn more.
+[15/01/2025, 10:31:00] Alice: Hello everyone
+and a second line
+[15/01/2025, 2:05:00 PM] Bob: Afternoon: all good?
+15/01/2025, 14:06 - Carol: Dash format
+2025-01-16, 9:15 a.m. - Dave: ISO format
+2025-01-16, 12:30 p.m. - Dave left
+"""
+
+
+class TestParseTxtFile:
+    """Tests for parsing native WhatsApp text exports."""
+
+    def test_parses_formats_and_system_messages(self, tmp_path):
+        export = tmp_path / "chat.txt"
+        export.write_text(_EXPORT, encoding="utf-8")
+
+        messages, errors = WhatsAppImporter(tmp_path).parse_txt_file(export)
+
+        assert errors == []
+        assert [(m.timestamp, m.sender) for m in messages] == [
+            (datetime(2025, 1, 15, 10, 30), "System"),
+            (datetime(2025, 1, 15, 10, 31), "Alice"),
+            (datetime(2025, 1, 15, 14, 5), "Bob"),
+            (datetime(2025, 1, 15, 14, 6), "Carol"),
+            (datetime(2025, 1, 16, 9, 15), "Dave"),
+            (datetime(2025, 1, 16, 12, 30), "System"),
+        ]
+        assert messages[1].content == "Hello everyone\nand a second line"
+        assert messages[2].content == "Afternoon: all good?"
+        assert [m.is_system for m in messages] == [True, False, False, False, False, True]
+        assert [m.message_id for m in messages] == [f"wa_{i}" for i in range(1, 7)]
+
+    @pytest.mark.parametrize("text, expected", [
+        ("Messages and calls are end-to-end encrypted. Tap to learn more.", True),
+        ("Bob LEFT", True),
+        ("Carol was removed", True),
+        ("Your security code with Dave changed", True),
+        ("I left my keys at home", False),
+        ("Nobody was removed from the list.", False),
+    ])
+    def test_system_message_detection(self, text, expected):
+        assert (WhatsAppImporter.SYSTEM_MESSAGE.search(text) is not None) is expected
+
+    def test_reads_in_blocks_and_skips_byte_order_mark(self, tmp_path, monkeypatch):
+        export = tmp_path / "chat.txt"
+        export.write_text("\ufeff" + _EXPORT, encoding="utf-8")
+        expected, _ = WhatsAppImporter(tmp_path).parse_txt_file(export)
+        monkeypatch.setattr("src.archive.importers.whatsapp._READ_BLOCK_CHARS", 7)
+
+        messages, errors = WhatsAppImporter(tmp_path).parse_txt_file(export)
+
+        assert errors == []
+        assert len(messages) == 6
+        assert messages == expected
+        assert messages[0].content.startswith("Messages and calls")
+
+    @pytest.mark.asyncio
+    async def test_reader_bot_json_default_ids(self, tmp_path):
+        export = tmp_path / "export.json"
+        export.write_text(json.dumps({"messages": [
+            {"id": "m1", "timestamp": "2025-01-10T09:00:00", "sender": "Alice", "content": "Hi"},
+            {"timestamp": "2025-01-10T09:01:00", "sender": "Bob", "content": "Hey"},
+        ]}))
+        importer = WhatsAppImporter(tmp_path / "archive", anonymize=False)
+
+        result = await importer.import_reader_bot_json(export, "g1", "Group")
+
+        assert [m.message_id for m in result.messages] == ["m1", "wa_1"]
+
+
+def _message(message_id: str, timestamp: datetime) -> WhatsAppMessage:
+    return WhatsAppMessage(message_id=message_id, timestamp=timestamp, sender="Alice", content=message_id)
+
+
+class TestGetMessagesForPeriod:
+    """Tests for reading saved imports back by period."""
+
+    @pytest.mark.asyncio
+    async def test_skips_imports_outside_period(self, tmp_path):
+        importer = WhatsAppImporter(tmp_path, anonymize=False)
+        await importer._save_import(
+            "g1", "Group", "imp_jan", [_message("jan", datetime(2025, 1, 10, 9))], "whatsapp_txt", "jan.txt"
+        )
+        await importer._save_import(
+            "g1", "Group", "imp_mar", [_message("mar", datetime(2025, 3, 10, 9))], "whatsapp_txt", "mar.txt"
+        )
+        # Would fail to parse if it were read
+        imports_dir = tmp_path / "sources" / "whatsapp" / "group_g1" / "imports"
+        (imports_dir / "imp_mar_messages.json").write_text("not json")
+
+        messages = await importer.get_messages_for_period(
+            "g1", datetime(2025, 1, 10), datetime(2025, 1, 10, 23, 59, 59)
+        )
+
+        assert [m["id"] for m in messages] == ["jan"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    async def test_saved_messages_are_columnar(self, tmp_path, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr("src.archive.importers.whatsapp.orjson", None)
+        importer = WhatsAppImporter(tmp_path, anonymize=False)
+        saved = [_message("a", datetime(2025, 1, 10, 9)), _message("b", datetime(2025, 1, 10, 9, 5, 0, 250))]
+        await importer._save_import("g1", "Group", "imp_1", saved, "whatsapp_txt", "chat.txt")
+
+        messages_file = tmp_path / "sources" / "whatsapp" / "group_g1" / "imports" / "imp_1_messages.json"
+        data = json.loads(messages_file.read_bytes())
+        assert data["version"] == 2
+        columns = data["columns"]
+        assert [dict(zip(columns, row)) for row in zip(*columns.values())] == [m.to_dict() for m in saved]
+        messages = await importer.get_messages_for_period("g1", datetime(2025, 1, 10), datetime(2025, 1, 11))
+        assert [m["timestamp"] for m in messages] == ["2025-01-10T09:00:00", "2025-01-10T09:05:00.000250"]
+
+    @pytest.mark.asyncio
+    async def test_newer_messages_format_is_rejected(self, tmp_path):
+        importer = WhatsAppImporter(tmp_path, anonymize=False)
+        await importer._save_import("g1", "Group", "imp_1", [_message("a", datetime(2025, 1, 10, 9))], "whatsapp_txt", "chat.txt")
+        messages_file = tmp_path / "sources" / "whatsapp" / "group_g1" / "imports" / "imp_1_messages.json"
+        data = json.loads(messages_file.read_bytes())
+        data["version"] = 3
+        messages_file.write_text(json.dumps(data))
+
+        with pytest.raises(ValueError, match="version 3"):
+            await importer.get_messages_for_period("g1", datetime(2025, 1, 10), datetime(2025, 1, 11))
+
+    @pytest.mark.asyncio
+    async def test_sorted_import_matches_period_bounds(self, tmp_path):
+        importer = WhatsAppImporter(tmp_path, anonymize=False)
+        saved = [
+            _message("late", datetime(2025, 1, 11, 0, 0, 0, 1)),
+            _message("end", datetime(2025, 1, 11)),
+            _message("start", datetime(2025, 1, 10)),
+            _message("early", datetime(2025, 1, 9, 23, 59, 59)),
+            _message("mid", datetime(2025, 1, 10, 12)),
+        ]
+        await importer._save_import("g1", "Group", "imp_1", saved, "whatsapp_txt", "chat.txt")
+
+        messages_file = tmp_path / "sources" / "whatsapp" / "group_g1" / "imports" / "imp_1_messages.json"
+        data = json.loads(messages_file.read_bytes())
+        assert data["sorted"] is True
+        assert data["columns"]["message_id"] == ["early", "start", "mid", "end", "late"]
+        messages = await importer.get_messages_for_period("g1", datetime(2025, 1, 10), datetime(2025, 1, 11))
+        assert [m["id"] for m in messages] == ["start", "mid", "end"]
+
+    @pytest.mark.asyncio
+    async def test_manifest_coverage_spans_all_imports(self, tmp_path):
+        importer = WhatsAppImporter(tmp_path, anonymize=False)
+        for import_id, day in (("imp_feb", 10), ("imp_jan", 1), ("imp_empty", None), ("imp_mid", 20)):
+            month = 2 if import_id == "imp_feb" else 1
+            saved = [_message(import_id, datetime(2025, month, day, 9))] if day else []
+            await importer._save_import("g1", "Group", import_id, saved, "whatsapp_txt", "chat.txt")
+
+        manifest_file = tmp_path / "sources" / "whatsapp" / "group_g1" / "imports" / "import-manifest.json"
+        manifest = json.loads(manifest_file.read_text())
+        assert len(manifest["imports"]) == 4
+        assert manifest["coverage"]["earliest"] == "2025-01-01"
+        assert manifest["coverage"]["latest"] == "2025-02-10"